@@ -0,0 +1 @@
+"""Benchmarks de performance do text_cleaner_for_py."""
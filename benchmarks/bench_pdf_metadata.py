@@ -0,0 +1,62 @@
+"""
+Benchmark da extração de metadados de PDFs: árvore de páginas vs leitura rápida.
+
+Gera um PDF sintético com ``--pages`` páginas e compara o caminho antigo
+(``PdfReader(path)`` + ``len(reader.pages)`` + ``reader.metadata``) com
+``DocumentProcessor.extract_metadata``, que lê apenas o trailer, a xref, o
+dicionário de informações e a contagem do nó raiz da árvore de páginas.
+
+Uso::
+
+    python -m benchmarks.bench_pdf_metadata --pages 1000 5000 20000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import PyPDF2
+
+from text_cleaner_for_py.document_processor import DocumentProcessor
+from text_cleaner_for_py.synthetic_corpus import write_pdf
+
+
+def _page_tree_metadata(path):
+    """Caminho anterior: carrega o arquivo e percorre a árvore de páginas."""
+    reader = PyPDF2.PdfReader(path)
+    info = reader.metadata or {}
+    return len(reader.pages), info.get('/Title', '')
+
+
+def _best_of(func, path, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(path)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    processor = DocumentProcessor()
+    info = {"Title": "Relatório", "Author": "Benchmark", "CreationDate": "D:20240101120000Z"}
+    print(f"{'páginas':>8}{'MB':>8}{'árvore (ms)':>14}{'rápido (ms)':>14}{'speedup':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in args.pages:
+            path = write_pdf(os.path.join(tmp, f"bench_{pages}.pdf"),
+                             [f"Página {i}" for i in range(pages)], info=info)
+            assert processor.extract_metadata(path)['pages'] == _page_tree_metadata(path)[0]
+            slow = _best_of(_page_tree_metadata, path, args.repeat)
+            fast = _best_of(processor.extract_metadata, path, args.repeat)
+            size = os.path.getsize(path) / 2**20
+            print(f"{pages:>8}{size:>8.1f}{slow * 1000:>14.1f}{fast * 1000:>14.1f}{slow / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
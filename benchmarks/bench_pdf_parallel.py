@@ -0,0 +1,51 @@
+"""
+Benchmark da extração de texto de PDFs: sequencial vs processos.
+
+Gera um PDF sintético com ``--pages`` páginas e mede o tempo de
+``DocumentProcessor.read_document`` para cada número de processos.
+
+Uso::
+
+    python -m benchmarks.bench_pdf_parallel --pages 1000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from text_cleaner_for_py.document_processor import DocumentProcessor
+from text_cleaner_for_py.synthetic_corpus import write_pdf
+
+_LINE = "Relatório trimestral: receita de R$ 1.234,56 registrada em 25/12/2023 (linha {})."
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--lines", type=int, default=40, help="linhas de texto por página")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    page = "\n".join(_LINE.format(i) for i in range(args.lines))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_pdf(os.path.join(tmp, "bench.pdf"), [page] * args.pages)
+        print(f"PDF: {args.pages} páginas, {os.path.getsize(path) / 2**20:.1f} MB")
+        print(f"{'processos':>10}{'melhor (s)':>12}{'páginas/s':>12}{'speedup':>10}")
+
+        baseline = None
+        for workers in sorted(set(args.workers)):
+            processor = DocumentProcessor(pdf_workers=workers, parallel_min_pages=1)
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                processor.read_document(path)
+                timings.append(time.perf_counter() - started)
+            best = min(timings)
+            baseline = baseline or best
+            print(f"{workers:>10}{best:>12.2f}{args.pages / best:>12.0f}{baseline / best:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
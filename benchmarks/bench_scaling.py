@@ -0,0 +1,165 @@
+"""
+Benchmark de escalabilidade dos modos de execução do PerformanceTextCleaner.
+
+Varre número de workers, tamanho do lote e distribuição de tamanhos dos
+textos para cada modo de execução e mede o melhor tempo de ``--repeat``
+execuções:
+
+- ``sequential``: ``clean_text`` em laço (referência para speedup)
+- ``threads``: ``clean_texts_parallel`` com ``max_workers`` threads
+- ``processes``: ``clean_texts_parallel`` com ``execution_mode='processes'``
+  (pool persistente, iniciado fora da medição; lotes de ``batch_size`` textos)
+- ``async``: ``clean_texts_async`` (um único loop, sem workers)
+- ``large_text``: ``clean_large_text`` sobre o lote concatenado, com
+  ``--chunk-size`` fixo (independente do perfil de calibração da máquina)
+
+Para cada combinação são exibidos vazão (itens/s e MB/s), speedup sobre o
+sequencial, eficiência (speedup / workers) e overhead por item (tempo acima
+da escala linear ideal, em µs). Ao final, a tabela de recomendação indica o
+modo e o número de workers com maior vazão para cada carga.
+
+Uso::
+
+    python -m benchmarks.bench_scaling --workers 1 2 4 8 --batch-sizes 10 100 1000
+    python -m benchmarks.bench_scaling --distributions short mixed --json scaling.json
+    python -m benchmarks.bench_scaling --modes large_text --chunk-size 4000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from text_cleaner_for_py.cleaner import clean_text
+from text_cleaner_for_py.performance_cleaner import PerformanceTextCleaner
+from text_cleaner_for_py.synthetic_corpus import CorpusGenerator, LengthDistribution
+
+MODES = ('sequential', 'threads', 'processes', 'async', 'large_text')
+
+# Modos sem número de workers (medidos uma única vez por carga)
+_SINGLE = ('sequential', 'async')
+
+
+DISTRIBUTIONS = {
+    'short': LengthDistribution('uniform', minimum=100, maximum=300),
+    'long': LengthDistribution('uniform', minimum=8_000, maximum=12_000),
+    # mediana ~500 caracteres e cauda longa
+    'mixed': LengthDistribution('lognormal', median=500, sigma=1.2, minimum=20, maximum=50_000),
+}
+
+
+def make_batch(distribution, size, seed=0):
+    """Lote de ``size`` textos de redes sociais com a distribuição de tamanhos pedida."""
+    generator = CorpusGenerator(seed=seed, noise='social', lengths=DISTRIBUTIONS[distribution])
+    return list(generator.documents(size))
+
+
+def _cleaner(mode, texts, workers):
+    execution_mode = 'processes' if mode == 'processes' else 'threads'
+    batch_size = max(1, len(texts) // (workers * 4))
+    return PerformanceTextCleaner(max_workers=workers, execution_mode=execution_mode, batch_size=batch_size)
+
+
+def _run(mode, cleaner, texts, chunk_size):
+    if mode == 'sequential':
+        return [clean_text(text) for text in texts]
+    if mode in ('threads', 'processes'):
+        return cleaner.clean_texts_parallel(texts)
+    if mode == 'async':
+        return asyncio.run(cleaner.clean_texts_async(texts))
+    return cleaner.clean_large_text(' '.join(texts), chunk_size=chunk_size)
+
+
+def _best(mode, texts, workers, repeat, chunk_size):
+    with _cleaner(mode, texts, workers) as cleaner:
+        if mode == 'processes':
+            # O pool é mantido entre chamadas: a partida dos processos fica fora da medição
+            cleaner.clean_texts_parallel(texts[:workers])
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            _run(mode, cleaner, texts, chunk_size)
+            timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def sweep(modes, workers_list, batch_sizes, distributions, repeat=3, chunk_size=1000):
+    """
+    Executa a varredura e retorna uma linha por combinação.
+
+    Returns:
+        list[dict]: Carga (distribuição, lote), modo, workers, tempo, vazão,
+        speedup, eficiência e overhead por item
+    """
+    rows = []
+    for distribution in distributions:
+        for batch_size in batch_sizes:
+            texts = make_batch(distribution, batch_size)
+            megabytes = sum(len(text.encode('utf-8')) for text in texts) / 1e6
+            sequential = _best('sequential', texts, 1, repeat, chunk_size)
+            for mode in modes:
+                for workers in ((1,) if mode in _SINGLE else workers_list):
+                    seconds = sequential if mode == 'sequential' else _best(mode, texts, workers, repeat, chunk_size)
+                    speedup = sequential / seconds
+                    rows.append({
+                        'distribution': distribution,
+                        'batch_size': batch_size,
+                        'megabytes': megabytes,
+                        'mode': mode,
+                        'workers': workers,
+                        'seconds': seconds,
+                        'items_per_s': batch_size / seconds,
+                        'mb_per_s': megabytes / seconds,
+                        'speedup': speedup,
+                        'efficiency': speedup / workers,
+                        'overhead_us': (seconds - sequential / workers) / batch_size * 1e6,
+                    })
+    return rows
+
+
+def recommend(rows):
+    """Para cada carga (distribuição, lote), a linha de maior vazão."""
+    best = {}
+    for row in rows:
+        key = (row['distribution'], row['batch_size'])
+        if key not in best or row['items_per_s'] > best[key]['items_per_s']:
+            best[key] = row
+    return [best[key] for key in sorted(best)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--distributions", nargs="+", choices=list(DISTRIBUTIONS), default=list(DISTRIBUTIONS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=1000, help="chunk_size do modo large_text")
+    parser.add_argument("--json", help="grava as linhas da varredura em JSON")
+    args = parser.parse_args(argv)
+
+    rows = sweep(args.modes, sorted(set(args.workers)), args.batch_sizes, args.distributions,
+                 args.repeat, args.chunk_size)
+
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'distribuição':<13}{'lote':>6}{'modo':>12}{'workers':>9}{'itens/s':>11}"
+          f"{'MB/s':>8}{'speedup':>9}{'eficiência':>12}{'overhead µs':>13}")
+    for row in rows:
+        print(f"{row['distribution']:<13}{row['batch_size']:>6}{row['mode']:>12}{row['workers']:>9}"
+              f"{row['items_per_s']:>11.0f}{row['mb_per_s']:>8.2f}{row['speedup']:>8.2f}x"
+              f"{row['efficiency']:>12.0%}{row['overhead_us']:>13.1f}")
+
+    print("\nRecomendação (maior vazão por carga):")
+    print(f"{'distribuição':<13}{'lote':>6}{'modo':>12}{'workers':>9}{'speedup':>9}")
+    for row in recommend(rows):
+        print(f"{row['distribution']:<13}{row['batch_size']:>6}{row['mode']:>12}{row['workers']:>9}"
+              f"{row['speedup']:>8.2f}x")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(rows, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark de inicialização do corretor ortográfico: JSON vs snapshot.
+
+Mede, em processos isolados, o tempo de construção e a memória residente
+(RSS máximo e, no Linux, PSS — memória proporcional, que divide as páginas
+compartilhadas entre os processos) de:
+
+- ``SpellCheckerCleaner(language=...)``, que carrega o JSON do pyspellchecker;
+- ``SpellCheckerCleaner(dictionary_path=...)``, que mapeia o snapshot binário.
+
+Uso::
+
+    python -m benchmarks.bench_spell_snapshot --language pt --workers 4
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_CHILD = r"""
+import json, resource, sys, time
+started = time.perf_counter()
+from text_cleaner_for_py.spell_checker import SpellCheckerCleaner
+mode, language, path = sys.argv[1:4]
+if mode == "json":
+    cleaner = SpellCheckerCleaner(language=language)
+else:
+    cleaner = SpellCheckerCleaner(dictionary_path=path)
+elapsed = time.perf_counter() - started
+cleaner.correct_texts(["obrigadu pela ajuda", "tambem gostei muito"])
+# ru_maxrss é herdado através do exec no Linux; prefira o VmHWM do processo
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+pss = None
+try:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                rss = int(line.split()[1]) / 1024
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith("Pss:"):
+                pss = int(line.split()[1]) / 1024
+except OSError:
+    pass
+if len(sys.argv) > 4:
+    sys.stdin.readline()  # mantém o processo vivo enquanto os irmãos medem
+print(json.dumps({
+    "seconds": elapsed,
+    "max_rss_mb": rss,
+    "pss_mb": pss,
+}))
+"""
+
+
+def _run(mode, language, path, workers):
+    """Inicia ``workers`` processos simultâneos e coleta as medições."""
+    hold = ["hold"] if workers > 1 else []
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", _CHILD, mode, language, path, *hold],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        )
+        for _ in range(workers)
+    ]
+    time.sleep(0.1)
+    results = [json.loads(proc.communicate("\n")[0]) for proc in procs]
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--language", default="pt")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    from text_cleaner_for_py.spell_snapshot import build_spell_snapshot
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"{args.language}.snap")
+        started = time.perf_counter()
+        build_spell_snapshot(path, language=args.language)
+        build_seconds = time.perf_counter() - started
+        print(f"snapshot: {os.path.getsize(path) / 2**20:.1f} MB gerado em {build_seconds:.2f}s")
+
+        print(f"{'modo':<10}{'processos':>10}{'init (s)':>12}{'RSS (MB)':>12}{'PSS (MB)':>12}")
+        for mode in ("json", "snapshot"):
+            for workers in sorted({1, args.workers}):
+                results = _run(mode, args.language, path, workers)
+                seconds = max(r["seconds"] for r in results)
+                rss = sum(r["max_rss_mb"] for r in results)
+                pss = [r["pss_mb"] for r in results]
+                pss_text = f"{sum(pss):12.1f}" if None not in pss else f"{'-':>12}"
+                print(f"{mode:<10}{workers:>10}{seconds:>12.3f}{rss:>12.1f}{pss_text}")
+
+
+if __name__ == "__main__":
+    main()
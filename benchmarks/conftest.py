@@ -0,0 +1,95 @@
+"""
+Configuração das suítes de benchmark (tempo e memória).
+
+A suíte não faz parte de ``testpaths``: rode-a explicitamente. Exemplos::
+
+    # grava a linha de base (JSON em benchmarks/baselines/<máquina>/0001_baseline.json)
+    pytest benchmarks --benchmark-only --no-cov \\
+        --benchmark-storage=benchmarks/baselines --benchmark-save=baseline
+
+    # compara com a última linha de base e falha se a média piorar mais de 10%
+    pytest benchmarks --benchmark-only --no-cov \\
+        --benchmark-storage=benchmarks/baselines --benchmark-compare \\
+        --benchmark-compare-fail=mean:10%
+
+Cada benchmark registra o tamanho da entrada em ``extra_info``; ao gravar o
+JSON, a vazão (MB/s e itens/s) é calculada a partir da média.
+
+Os testes de memória têm o marcador ``memory`` e são ignorados com
+``--benchmark-only``. Cada um falha se a amplificação (pico alocado por
+byte de entrada) passar do orçamento da operação::
+
+    pytest benchmarks -m memory --no-cov --memory-json=memory.json
+"""
+
+import json
+
+import pytest
+
+from benchmarks.inputs import SIZES, make_text
+from benchmarks.memory import measure_memory
+
+_memory_results = []
+
+
+def pytest_addoption(parser):
+    parser.addoption("--memory-json", default=None, metavar="PATH",
+                     help="grava as medições dos testes de memória em JSON")
+
+
+@pytest.fixture
+def sample():
+    """Gera o texto de um tipo e faixa de tamanho (memorizado entre benchmarks)."""
+    def build(kind, size):
+        return make_text(kind, SIZES[size])
+    return build
+
+
+@pytest.fixture
+def measure(benchmark):
+    """Executa o benchmark registrando o volume de entrada para o cálculo de vazão."""
+    def run(func, *args, input_bytes, items=1):
+        benchmark.extra_info['input_bytes'] = input_bytes
+        benchmark.extra_info['items'] = items
+        return benchmark(func, *args)
+    return run
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    for bench in output_json['benchmarks']:
+        extra = bench.get('extra_info', {})
+        mean = bench['stats']['mean']
+        if mean and 'input_bytes' in extra:
+            extra['throughput_mb_s'] = extra['input_bytes'] / mean / 1e6
+            extra['items_per_s'] = extra.get('items', 1) / mean
+
+
+@pytest.fixture
+def memory(request):
+    """Mede a memória de uma chamada e guarda o resultado para o relatório."""
+    def run(func, *args, input_bytes, **kwargs):
+        usage = measure_memory(request.node.name, func, *args, input_bytes=input_bytes, **kwargs)
+        _memory_results.append(usage)
+        return usage
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _memory_results:
+        return
+    terminalreporter.section("memória")
+    terminalreporter.write_line(
+        f"{'operação':<40}{'entrada MB':>12}{'pico MB':>10}{'RSS MB':>10}{'bytes/byte':>12}"
+    )
+    for usage in _memory_results:
+        terminalreporter.write_line(
+            f"{usage.operation:<40}{usage.input_bytes / 1e6:>12.2f}{usage.peak_bytes / 1e6:>10.1f}"
+            f"{usage.peak_rss_growth_bytes / 1e6:>10.1f}{usage.amplification:>12.1f}"
+        )
+
+
+def pytest_sessionfinish(session):
+    path = session.config.getoption("--memory-json")
+    if path and _memory_results:
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump([usage.to_dict() for usage in _memory_results], file, indent=2)
@@ -0,0 +1,46 @@
+"""
+Textos sintéticos para os benchmarks, gerados de forma determinística.
+
+Cada tipo de conteúdo é um perfil de ruído de
+``text_cleaner_for_py.synthetic_corpus`` e reproduz o que encontramos em
+produção:
+
+    - ``plain``: prosa em português com acentos e pontuação
+    - ``html``: marcação pesada (divs aninhadas, links, entidades, scripts)
+    - ``social``: menções, URLs, e-mails, emojis, abreviações e erros de digitação
+    - ``ocr``: dígitos no lugar de letras e erros de digitação
+    - ``financial``: valores em reais, datas e percentuais
+"""
+
+from functools import lru_cache
+from typing import Iterable, List
+
+import pytest
+
+from text_cleaner_for_py.synthetic_corpus import CorpusGenerator
+
+KINDS = ('plain', 'html', 'social', 'ocr', 'financial')
+
+# Tamanho aproximado (em caracteres) de cada faixa de entrada
+SIZES = {'short': 200, 'medium': 10_000, 'large': 200_000}
+
+
+@lru_cache(maxsize=None)
+def make_text(kind: str, size: int, seed: int = 0) -> str:
+    """
+    Gera um texto do tipo pedido com aproximadamente ``size`` caracteres.
+
+    Args:
+        kind: Um dos tipos em ``KINDS``
+        size: Tamanho aproximado em caracteres
+        seed: Semente (o mesmo trio de argumentos gera sempre o mesmo texto)
+
+    Returns:
+        str: Texto gerado
+    """
+    return CorpusGenerator(seed=seed, noise=kind).text(size)
+
+
+def text_params(kinds: Iterable[str], sizes: Iterable[str] = tuple(SIZES)) -> List:
+    """Parâmetros (tipo, faixa) para ``parametrize``, com ids legíveis (ex. ``html-large``)."""
+    return [pytest.param(kind, size, id=f"{kind}-{size}") for kind in kinds for size in sizes]
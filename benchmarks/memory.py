@@ -0,0 +1,125 @@
+"""
+Medição de memória por operação: pico alocado (tracemalloc) e RSS.
+
+``measure_memory`` executa uma função uma vez e retorna um ``MemoryUsage``
+com:
+
+- ``peak_bytes``: pico de memória alocada pelo Python durante a chamada,
+  acima do que já estava alocado antes dela (``tracemalloc``);
+- ``rss_growth_bytes``: quanto o RSS do processo terminou acima do início;
+- ``peak_rss_growth_bytes``: quanto o pico de RSS subiu durante a chamada.
+  No Linux o pico do processo (``VmHWM``) é zerado antes de cada medição
+  (``/proc/self/clear_refs``); sem esse recurso, o valor só é maior que
+  zero quando a chamada ultrapassa o maior pico anterior do processo.
+
+A amplificação (``amplification``) é o pico alocado dividido pelo tamanho
+da entrada em bytes: quantos bytes a operação precisa por byte lido.
+"""
+
+import gc
+import resource
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+def _proc_status(field: str) -> Optional[int]:
+    """Lê um campo em kB de ``/proc/self/status`` (em bytes), se existir."""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def current_rss() -> Optional[int]:
+    """RSS atual do processo em bytes (None fora do Linux)."""
+    return _proc_status('VmRSS')
+
+
+def peak_rss() -> int:
+    """Pico de RSS do processo em bytes."""
+    peak = _proc_status('VmHWM')
+    if peak is not None:
+        return peak
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é em kB no Linux e em bytes no macOS
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+def _reset_peak_rss() -> bool:
+    """Zera o pico de RSS do processo (Linux >= 4.0)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+        return True
+    except OSError:
+        return False
+
+
+@dataclass
+class MemoryUsage:
+    """Memória usada por uma chamada."""
+    operation: str
+    input_bytes: int
+    peak_bytes: int
+    rss_growth_bytes: Optional[int]
+    peak_rss_growth_bytes: int
+    peak_rss_reset: bool
+
+    @property
+    def amplification(self) -> float:
+        """Bytes alocados no pico por byte de entrada."""
+        return self.peak_bytes / self.input_bytes if self.input_bytes else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), 'amplification': self.amplification}
+
+
+def measure_memory(operation: str, func: Callable[..., Any], *args: Any,
+                   input_bytes: int, **kwargs: Any) -> MemoryUsage:
+    """
+    Executa ``func(*args, **kwargs)`` uma vez medindo a memória.
+
+    O resultado da chamada é descartado dentro da medição, de modo que o
+    pico inclui a saída produzida, mas o RSS final não a mantém viva.
+
+    Args:
+        operation: Nome da operação (para o relatório)
+        func: Função a medir
+        *args: Argumentos posicionais de ``func``
+        input_bytes: Tamanho da entrada em bytes (base da amplificação)
+        **kwargs: Argumentos nomeados de ``func``
+
+    Returns:
+        MemoryUsage: Pico alocado, crescimento de RSS e amplificação
+    """
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    rss_before = current_rss()
+    reset = _reset_peak_rss()
+    peak_rss_before = peak_rss()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    gc.collect()
+    rss_after = current_rss()
+    return MemoryUsage(
+        operation=operation,
+        input_bytes=input_bytes,
+        peak_bytes=peak - baseline,
+        rss_growth_bytes=None if rss_before is None or rss_after is None else rss_after - rss_before,
+        peak_rss_growth_bytes=max(0, peak_rss() - peak_rss_before),
+        peak_rss_reset=reset,
+    )
@@ -0,0 +1,56 @@
+"""Benchmarks de leitura de documentos (TXT, DOCX e PDF) por tamanho."""
+
+import os
+
+import pytest
+
+from text_cleaner_for_py.document_processor import DocumentProcessor
+from text_cleaner_for_py.synthetic_corpus import CorpusGenerator
+
+# Tamanho aproximado (em caracteres) do texto de cada faixa
+DOCUMENT_SIZES = {'short': 2_000, 'medium': 40_000, 'large': 400_000}
+
+
+@pytest.fixture(scope="module")
+def documents(tmp_path_factory):
+    """Gera o mesmo texto em TXT, DOCX e PDF para cada faixa, uma única vez."""
+    directory = tmp_path_factory.mktemp("documents")
+    paths = {}
+    for size, length in DOCUMENT_SIZES.items():
+        generator = CorpusGenerator(seed=0, lengths=length)
+        for path in generator.write(directory, 1, formats=('txt', 'docx', 'pdf'), prefix=size):
+            paths[os.path.splitext(path)[1], size] = path
+    return paths
+
+
+def _params():
+    return [pytest.param(fmt, size, id=f"{fmt[1:]}-{size}")
+            for fmt in ('.txt', '.docx', '.pdf') for size in DOCUMENT_SIZES]
+
+
+@pytest.mark.benchmark(group="read_document")
+@pytest.mark.parametrize("fmt,size", _params())
+def test_read_document(measure, documents, fmt, size):
+    path = documents[fmt, size]
+    processor = DocumentProcessor()
+    measure(processor.read_document, path, input_bytes=os.path.getsize(path))
+
+
+@pytest.mark.benchmark(group="iter_document")
+@pytest.mark.parametrize("fmt,size", _params())
+def test_iter_document(measure, documents, fmt, size):
+    path = documents[fmt, size]
+    processor = DocumentProcessor()
+
+    def consume():
+        for _ in processor.iter_document(path):
+            pass
+
+    measure(consume, input_bytes=os.path.getsize(path))
+
+
+@pytest.mark.benchmark(group="extract_metadata")
+@pytest.mark.parametrize("fmt", ('.docx', '.pdf'))
+def test_extract_metadata(measure, documents, fmt):
+    path = documents[fmt, 'large']
+    measure(DocumentProcessor().extract_metadata, path, input_bytes=os.path.getsize(path))
@@ -0,0 +1,127 @@
+"""Benchmarks das funções de limpeza de texto por tipo de conteúdo e tamanho."""
+
+import pytest
+
+from benchmarks.inputs import KINDS, SIZES, make_text, text_params
+from text_cleaner_for_py import cleaner, cleaner_v1
+from text_cleaner_for_py.advanced_cleaner import AdvancedTextCleaner
+from text_cleaner_for_py.performance_cleaner import PerformanceTextCleaner
+from text_cleaner_for_py.spell_checker import SpellCheckerCleaner
+
+
+# Parâmetros fixos: o perfil de calibração da máquina não altera a medição
+CLEANER_OPTIONS = dict(max_workers=4, execution_mode='threads', batch_size=100)
+CHUNK_SIZE = 1000
+
+
+def _size(text):
+    return len(text.encode('utf-8'))
+
+
+@pytest.mark.benchmark(group="clean_text")
+@pytest.mark.parametrize("kind,size", text_params(KINDS))
+def test_clean_text(measure, sample, kind, size):
+    text = sample(kind, size)
+    measure(cleaner.clean_text, text, input_bytes=_size(text))
+
+
+@pytest.mark.benchmark(group="remove_html")
+@pytest.mark.parametrize("kind,size", text_params(('plain', 'html')))
+def test_remove_html(measure, sample, kind, size):
+    text = sample(kind, size)
+    measure(cleaner.remove_html, text, input_bytes=_size(text))
+
+
+@pytest.mark.benchmark(group="cleaner")
+@pytest.mark.parametrize("func", [
+    cleaner.remove_accents,
+    cleaner.remove_special_characters,
+    cleaner.remove_extra_spaces,
+    cleaner.to_snake_case,
+    cleaner.to_camel_case,
+    cleaner.to_pascal_case,
+], ids=lambda func: func.__name__)
+@pytest.mark.parametrize("size", list(SIZES))
+def test_cleaner_functions(measure, sample, func, size):
+    text = sample('plain', size)
+    measure(func, text, input_bytes=_size(text))
+
+
+@pytest.mark.benchmark(group="cleaner_v1")
+@pytest.mark.parametrize("func", [
+    cleaner_v1.normalize_text,
+    cleaner_v1.remove_html_tags,
+    cleaner_v1.clean_whitespace,
+    cleaner_v1.filter_letters,
+    cleaner_v1.filter_numbers,
+], ids=lambda func: func.__name__)
+@pytest.mark.parametrize("kind,size", text_params(('plain', 'html')))
+def test_cleaner_v1_functions(measure, sample, func, kind, size):
+    text = sample(kind, size)
+    measure(func, text, input_bytes=_size(text))
+
+
+@pytest.mark.benchmark(group="remove_stopwords")
+@pytest.mark.parametrize("size", list(SIZES))
+def test_remove_stopwords(measure, sample, size):
+    try:
+        cleaner_v1.get_stopwords('portuguese')
+    except LookupError:
+        pytest.skip("corpus de stopwords do NLTK indisponível")
+    text = sample('plain', size)
+    measure(cleaner_v1.remove_stopwords, text, 'portuguese', input_bytes=_size(text))
+
+
+@pytest.mark.benchmark(group="clean_advanced")
+@pytest.mark.parametrize("kind,size", text_params(KINDS))
+def test_clean_advanced(measure, sample, kind, size):
+    text = sample(kind, size)
+    measure(AdvancedTextCleaner().clean_advanced, text, input_bytes=_size(text))
+
+
+@pytest.fixture(scope="module")
+def spell():
+    return SpellCheckerCleaner()
+
+
+@pytest.mark.benchmark(group="correct_text")
+@pytest.mark.parametrize("kind,size", text_params(('plain', 'social', 'ocr'), ('short', 'medium')))
+def test_correct_text_warm(measure, spell, sample, kind, size):
+    """Correção com a memória de correções já preenchida (caso comum em lote)."""
+    text = sample(kind, size)
+    spell.correct_text(text)
+    measure(spell.correct_text, text, input_bytes=_size(text))
+
+
+@pytest.mark.benchmark(group="correct_text_cold")
+@pytest.mark.parametrize("kind", ('plain', 'social', 'ocr'))
+def test_correct_text_cold(benchmark, spell, kind):
+    """Primeira correção de um texto curto: cada palavra desconhecida é calculada."""
+    text = make_text(kind, SIZES['short'])
+    benchmark.extra_info['input_bytes'] = _size(text)
+    benchmark.extra_info['items'] = 1
+    benchmark.pedantic(spell.correct_text, args=(text,),
+                       setup=spell.clear_correction_cache, rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark(group="correct_texts")
+def test_correct_texts_batch(measure, spell):
+    texts = [make_text('plain', SIZES['short'], seed) for seed in range(200)]
+    spell.correct_texts(texts)
+    measure(spell.correct_texts, texts, input_bytes=sum(map(_size, texts)), items=len(texts))
+
+
+@pytest.mark.benchmark(group="performance_cleaner")
+@pytest.mark.parametrize("size", list(SIZES))
+def test_clean_large_text(measure, sample, size):
+    text = sample('html', size)
+    measure(PerformanceTextCleaner(**CLEANER_OPTIONS).clean_large_text, text, CHUNK_SIZE,
+            input_bytes=_size(text))
+
+
+@pytest.mark.benchmark(group="performance_cleaner")
+@pytest.mark.parametrize("size", ('short', 'medium'))
+def test_clean_texts_parallel(measure, size):
+    texts = [make_text('social', SIZES[size], seed) for seed in range(100)]
+    measure(PerformanceTextCleaner(**CLEANER_OPTIONS).clean_texts_parallel, texts,
+            input_bytes=sum(map(_size, texts)), items=len(texts))
@@ -0,0 +1,103 @@
+"""
+Memória das operações com entradas grandes: pico alocado e RSS por tamanho.
+
+Cada teste falha quando a amplificação (bytes alocados no pico por byte de
+entrada) passa do orçamento da operação em ``BUDGETS``. Os orçamentos têm
+folga sobre os valores medidos; ao otimizar uma operação, reduza-os.
+"""
+
+import os
+
+import pytest
+
+from benchmarks.inputs import make_text
+from text_cleaner_for_py.cleaner import clean_text, remove_html
+from text_cleaner_for_py.document_processor import DocumentProcessor
+from text_cleaner_for_py.performance_cleaner import PerformanceTextCleaner
+from text_cleaner_for_py.synthetic_corpus import CorpusGenerator
+
+pytestmark = pytest.mark.memory
+
+# Tamanhos (em caracteres) dos textos e do texto dos documentos
+TEXT_SIZES = {'100k': 100_000, '1m': 1_000_000, '4m': 4_000_000}
+DOCUMENT_SIZES = {'40k': 40_000, '400k': 400_000, '2m': 2_000_000}
+# Chunk fixo de clean_large_text: o perfil de calibração não muda a amplificação
+CHUNK_SIZE = 1000
+
+# Amplificação máxima aceita por operação
+BUDGETS = {
+    'clean_text': 50,
+    'remove_html': 40,
+    'clean_large_text': 16,
+    'read_document.pdf': 14,
+    'iter_document.pdf': 12,
+    'read_document.docx': 12,
+    'iter_document.docx': 6,
+}
+
+
+def _text(kind, size):
+    text = make_text(kind, TEXT_SIZES[size])
+    return text, len(text.encode('utf-8'))
+
+
+def _check(usage, operation):
+    assert usage.amplification <= BUDGETS[operation], (
+        f"{operation}: {usage.amplification:.1f} bytes por byte de entrada "
+        f"(orçamento {BUDGETS[operation]})"
+    )
+
+
+@pytest.mark.parametrize("size", list(TEXT_SIZES))
+def test_clean_text_memory(memory, size):
+    text, input_bytes = _text('html', size)
+    _check(memory(clean_text, text, input_bytes=input_bytes), 'clean_text')
+
+
+@pytest.mark.parametrize("size", list(TEXT_SIZES))
+def test_remove_html_memory(memory, size):
+    text, input_bytes = _text('html', size)
+    _check(memory(remove_html, text, input_bytes=input_bytes), 'remove_html')
+
+
+@pytest.mark.parametrize("size", list(TEXT_SIZES))
+def test_clean_large_text_memory(memory, size):
+    text, input_bytes = _text('html', size)
+    cleaner = PerformanceTextCleaner()
+    cleaner.clean_text_cached.cache_clear()
+    usage = memory(cleaner.clean_large_text, text, CHUNK_SIZE, input_bytes=input_bytes)
+    cleaner.clean_text_cached.cache_clear()
+    _check(usage, 'clean_large_text')
+
+
+@pytest.fixture(scope="module")
+def documents(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("memory")
+    paths = {}
+    for size, length in DOCUMENT_SIZES.items():
+        generator = CorpusGenerator(seed=0, lengths=length)
+        for path in generator.write(directory, 1, formats=('pdf', 'docx'), prefix=size):
+            paths[os.path.splitext(path)[1][1:], size] = path
+    return paths
+
+
+def _consume(blocks):
+    for _ in blocks:
+        pass
+
+
+@pytest.mark.parametrize("fmt", ('pdf', 'docx'))
+@pytest.mark.parametrize("size", list(DOCUMENT_SIZES))
+def test_read_document_memory(memory, documents, fmt, size):
+    path = documents[fmt, size]
+    usage = memory(DocumentProcessor().read_document, path, input_bytes=os.path.getsize(path))
+    _check(usage, f'read_document.{fmt}')
+
+
+@pytest.mark.parametrize("fmt", ('pdf', 'docx'))
+@pytest.mark.parametrize("size", list(DOCUMENT_SIZES))
+def test_iter_document_memory(memory, documents, fmt, size):
+    path = documents[fmt, size]
+    processor = DocumentProcessor()
+    usage = memory(lambda: _consume(processor.iter_document(path)), input_bytes=os.path.getsize(path))
+    _check(usage, f'iter_document.{fmt}')
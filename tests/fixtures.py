@@ -0,0 +1,19 @@
+"""Dados binários auxiliares dos testes.
+
+PDFs, DOCX e textos sintéticos vêm de ``text_cleaner_for_py.synthetic_corpus``.
+"""
+
+import struct
+import zlib
+
+
+def png_bytes(rgb=(255, 0, 0), width: int = 2, height: int = 2) -> bytes:
+    """Gera um PNG RGB de cor sólida."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+    row = b"\x00" + bytes(rgb) * width
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(row * height))
+            + chunk(b"IEND", b""))
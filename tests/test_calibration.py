@@ -0,0 +1,104 @@
+import importlib
+import json
+
+import pytest
+
+from text_cleaner_for_py import calibration
+from text_cleaner_for_py.calibration import CalibrationProfile, calibrate, load_profile
+from text_cleaner_for_py.cleaner import clean_text
+from text_cleaner_for_py.config import ConfigManager
+from text_cleaner_for_py.exceptions import ConfigurationError
+from text_cleaner_for_py.performance_cleaner import PerformanceTextCleaner
+from text_cleaner_for_py.synthetic_corpus import CorpusGenerator
+
+
+@pytest.fixture
+def texts():
+    return list(CorpusGenerator(seed=5, noise='mixed', lengths=300).documents(20))
+
+
+def _profile(**overrides):
+    values = dict(execution_mode='processes', max_workers=3, batch_size=25, chunk_size=4000,
+                  cpu_count=calibration.cpu_count())
+    values.update(overrides)
+    return CalibrationProfile(**values)
+
+
+def test_calibrate_measures_every_candidate(texts, monkeypatch):
+    monkeypatch.setattr(calibration, 'cpu_count', lambda: 2)
+    profile = calibrate(texts, sample_size=20)
+
+    assert set(profile.throughput) == {
+        'sequential:1', 'threads:1', 'threads:2', 'processes:1', 'processes:2'
+    }
+    assert profile.execution_mode in calibration.EXECUTION_MODES
+    assert 1 <= profile.max_workers <= 2
+    assert profile.batch_size >= 1
+    assert profile.chunk_size in (500, 1000, 4000, 16000)
+    assert profile.cpu_count == 2
+    assert profile.item_cost_us > 0 and profile.process_overhead_us > 0
+
+
+def test_calibrate_rejects_empty_sample():
+    with pytest.raises(ConfigurationError):
+        calibrate([])
+
+
+def test_profile_roundtrip(tmp_path):
+    path = _profile().save(tmp_path / 'perfil' / 'calibration.json')
+    loaded = load_profile(path)
+
+    assert loaded == _profile(host=loaded.host, created_at=loaded.created_at)
+    assert json.loads(path.read_text(encoding='utf-8'))['batch_size'] == 25
+
+
+def test_profile_from_other_machine_is_ignored(tmp_path):
+    path = _profile(cpu_count=calibration.cpu_count() + 1).save(tmp_path / 'calibration.json')
+    assert load_profile(path) is None
+
+
+def test_invalid_or_missing_profile_is_ignored(tmp_path):
+    path = tmp_path / 'calibration.json'
+    assert load_profile(path) is None
+    path.write_text('{"execution_mode": "gpu"}', encoding='utf-8')
+    assert load_profile(path) is None
+    path.write_text('não é json', encoding='utf-8')
+    assert load_profile(path) is None
+
+
+def test_config_applies_profile_and_environment_wins(tmp_path, monkeypatch):
+    path = _profile().save(tmp_path / 'calibration.json')
+    monkeypatch.setenv('TEXT_CLEANER_CALIBRATION', str(path))
+    settings = ConfigManager().get_cleaner_config()
+    assert (settings.execution_mode, settings.max_workers, settings.batch_size, settings.chunk_size) == (
+        'processes', 3, 25, 4000
+    )
+
+    monkeypatch.setenv('TEXT_CLEANER_MAX_WORKERS', '7')
+    assert ConfigManager().get_cleaner_config().max_workers == 7
+
+    monkeypatch.setenv('TEXT_CLEANER_CALIBRATION', 'off')
+    assert ConfigManager().calibration is None
+
+
+def test_performance_cleaner_uses_config(monkeypatch):
+    manager = ConfigManager()
+    manager.update_cleaner_config(execution_mode='sequential', max_workers=6, chunk_size=50)
+    monkeypatch.setattr(importlib.import_module('text_cleaner_for_py.config'), '_config', manager)
+
+    cleaner = PerformanceTextCleaner()
+    assert (cleaner.execution_mode, cleaner.max_workers, cleaner.chunk_size) == ('sequential', 6, 50)
+    assert PerformanceTextCleaner(max_workers=2).max_workers == 2
+
+
+@pytest.mark.parametrize("mode", ['sequential', 'threads', 'processes'])
+def test_execution_modes_match_clean_text(texts, mode):
+    with PerformanceTextCleaner(max_workers=2, execution_mode=mode, batch_size=4) as cleaner:
+        assert cleaner.clean_texts_parallel(texts) == [clean_text(text) for text in texts]
+
+
+def test_invalid_execution_mode():
+    with pytest.raises(ConfigurationError):
+        PerformanceTextCleaner(execution_mode='gpu')
+    with pytest.raises(ConfigurationError):
+        ConfigManager().update_cleaner_config(execution_mode='gpu')
@@ -8,6 +8,9 @@ from text_cleaner_for_py.cleaner_v1 import (
     filter_letters,
     filter_numbers,
     remove_stopwords,
+    remove_stopwords_many,
+    get_stopwords,
+    register_stopwords,
 )
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -57,6 +60,41 @@ def test_remove_stopwords():
     assert result == expected
 
 
+def test_stopwords_are_loaded_once(mocker):
+    loader = mocker.patch(
+        "text_cleaner_for_py.cleaner_v1._load_stopwords",
+        return_value=frozenset({"este", "é", "um"}),
+    )
+    first = remove_stopwords("Este é um teste", language="idioma_teste")
+    second = remove_stopwords("ESTE É UM teste", language="idioma_teste")
+    assert first == second == "teste"
+    assert loader.call_count == 1
+
+
+def test_custom_and_merged_stopwords():
+    register_stopwords("lista_a", ["Olá", "mundo"])
+    register_stopwords("lista_b", ["texto"])
+    merged = get_stopwords(["lista_a", "lista_b"], extra=["novo"], exclude=["mundo"])
+    assert merged == frozenset({"olá", "texto", "novo"})
+    assert remove_stopwords("Olá mundo texto livre", language=["lista_a", "lista_b"]) == "livre"
+
+
+def test_get_stopwords_rejects_empty_language_list():
+    with pytest.raises(ValueError):
+        get_stopwords([])
+
+
+def test_remove_stopwords_with_explicit_list():
+    texto = "Straße und die Brücke"
+    assert remove_stopwords(texto, stop_words=["STRASSE", "die"]) == "und Brücke"
+
+
+def test_remove_stopwords_many():
+    register_stopwords("lista_lote", ["de", "o", "a"])
+    textos = ["O gato de rua", "a casa", ""]
+    assert remove_stopwords_many(textos, language="lista_lote") == ["gato rua", "casa", ""]
+
+
 # 🏃 **Execução dos testes**
 if __name__ == "__main__":
     pytest.main(["-v", "tests/test_cleaner_v1.py"])
@@ -0,0 +1,107 @@
+import dataclasses
+import logging
+import subprocess
+import sys
+
+import pytest
+
+from text_cleaner_for_py import profiling
+from text_cleaner_for_py.config import (
+    ConfigManager,
+    configure,
+    get_cleaner_setting,
+    get_config,
+    get_snapshot,
+)
+from text_cleaner_for_py.exceptions import ConfigurationError
+from text_cleaner_for_py.logging_config import get_logger
+from text_cleaner_for_py.metrics import REGISTRY
+
+
+@pytest.fixture
+def restore_config():
+    previous = get_config()
+    yield
+    configure(previous)
+    REGISTRY.reset()
+
+
+def test_import_has_no_side_effects():
+    code = (
+        "import sys, logging, text_cleaner_for_py\n"
+        "config = sys.modules['text_cleaner_for_py.config']\n"
+        "log = sys.modules['text_cleaner_for_py.logging_config']\n"
+        "assert config._config is None and log._logger is None\n"
+        "assert not logging.getLogger('text_cleaner_for_py').handlers\n"
+        "assert 'nltk' not in sys.modules\n"
+        "assert text_cleaner_for_py.config is config._config is not None\n"
+        "from text_cleaner_for_py import AdvancedTextCleaner, logger\n"
+        "assert logger is log._logger\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+@pytest.mark.parametrize("value,installed", [('bogus', 'None'), ('otel', 'None'), ('log', 'LoggingHook')])
+def test_profiling_hook_is_installed_on_first_use(value, installed, monkeypatch):
+    monkeypatch.setenv('TEXT_CLEANER_PROFILING', value)
+    code = (
+        "import sys\n"
+        "sys.modules['opentelemetry'] = None  # opentelemetry-api ausente\n"
+        "import text_cleaner_for_py\n"
+        "from text_cleaner_for_py import profiling\n"
+        "from text_cleaner_for_py.exceptions import ConfigurationError\n"
+        "assert sys.modules['text_cleaner_for_py.config']._config is None\n"
+        "try:\n"
+        "    text_cleaner_for_py.clean_text('<b>Olá</b>')\n"
+        "except ConfigurationError:\n"
+        "    print(None)\n"
+        "else:\n"
+        "    print(type(profiling._configured_hook).__name__)\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+    assert result.stdout.split()[-1] == installed
+
+
+def test_snapshot_is_immutable_and_follows_updates():
+    manager = ConfigManager()
+    snapshot = manager.snapshot()
+    assert manager.snapshot() is snapshot
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.max_workers = 2
+
+    manager.update_cleaner_config(max_workers=3)
+    assert snapshot.max_workers != 3
+    assert manager.snapshot().max_workers == 3
+
+
+def test_configure_applies_to_running_modules(restore_config):
+    log = get_logger()
+    manager = ConfigManager()
+    manager.logging.level = 'ERROR'
+
+    assert configure(manager, enable_metrics=True, profiling='log') is get_config()
+    assert get_snapshot().enable_metrics
+    assert REGISTRY.enabled
+    assert isinstance(profiling._configured_hook, profiling.LoggingHook)
+    assert get_logger() is log and not log.logger.isEnabledFor(logging.INFO)
+
+    configure(ConfigManager())
+    assert not REGISTRY.enabled
+    assert profiling._configured_hook is None
+
+
+def test_configure_validates(restore_config):
+    before = get_config()
+    with pytest.raises(ConfigurationError):
+        configure(execution_mode='gpu')
+    assert get_config() is before
+
+
+def test_cleaner_setting_without_building_config(monkeypatch):
+    config_module = sys.modules['text_cleaner_for_py.config']
+    monkeypatch.setattr(config_module, '_config', None)
+    monkeypatch.setenv('TEXT_CLEANER_METRICS', 'true')
+
+    assert get_cleaner_setting('enable_metrics') is True
+    assert get_cleaner_setting('profiling') is None
+    assert config_module._config is None
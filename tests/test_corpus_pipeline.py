@@ -0,0 +1,136 @@
+import concurrent.futures
+import json
+import os
+import threading
+import pytest
+from text_cleaner_for_py import corpus_pipeline
+from text_cleaner_for_py.corpus_pipeline import CorpusPipeline
+from text_cleaner_for_py.exceptions import ConfigurationError, ProcessingError
+from text_cleaner_for_py.synthetic_corpus import write_docx, write_pdf
+
+@pytest.fixture
+def corpus_dir(tmp_path):
+    root = tmp_path / "corpus"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_text("<p>Olá, Mundo!</p>", encoding='utf-8')
+    (root / "sub" / "b.txt").write_text("Segundo   arquivo", encoding='utf-8')
+    write_pdf(root / "sub" / "c.pdf", ["Página em PDF"])
+    write_docx(root / "d.docx", ["Parágrafo DOCX"])
+    (root / "ignorado.xyz").write_text("fora do corpus")
+    return root
+
+def _read_records(output_dir):
+    records = []
+    for shard in sorted(output_dir.glob("part-*.jsonl")):
+        with open(shard, encoding='utf-8') as file:
+            records.extend(json.loads(line) for line in file)
+    return records
+
+def test_pipeline_writes_sharded_jsonl(corpus_dir, tmp_path):
+    output_dir = tmp_path / "saida"
+    pipeline = CorpusPipeline(output_dir, executor='thread', shard_size=3)
+    report = pipeline.run(corpus_dir)
+
+    assert report['processed'] == 4
+    assert report['errors'] == []
+    assert report['shards'] == ["part-00000.jsonl", "part-00001.jsonl"]
+    records = {record['path'].replace(str(corpus_dir), ''): record for record in _read_records(output_dir)}
+    assert records['/a.txt']['text'] == "ola mundo"
+    assert records['/sub/c.pdf']['text'] == "pagina em pdf"
+    assert records['/d.docx']['metadata']['paragraphs'] == 1
+    assert set(report['stages']) == {'discovery', 'extraction', 'cleaning', 'writing'}
+    assert report['stages']['cleaning']['items'] == 4
+
+def test_pipeline_resumes_from_checkpoint(corpus_dir, tmp_path):
+    output_dir = tmp_path / "saida"
+    CorpusPipeline(output_dir, executor='thread').run(corpus_dir)
+
+    (corpus_dir / "novo.txt").write_text("Arquivo novo", encoding='utf-8')
+    report = CorpusPipeline(output_dir, executor='thread').run(corpus_dir)
+    assert report['processed'] == 1
+    assert report['skipped'] == 4
+    assert report['shards'] == ["part-00001.jsonl"]
+    assert len(_read_records(output_dir)) == 5
+
+def test_pipeline_reports_errors_without_checkpointing(corpus_dir, tmp_path):
+    (corpus_dir / "quebrado.pdf").write_bytes(b"isto nao e um pdf")
+    output_dir = tmp_path / "saida"
+    report = CorpusPipeline(output_dir, executor='thread').run(corpus_dir)
+    assert report['processed'] == 4
+    assert [error['stage'] for error in report['errors']] == ['extraction']
+    assert "quebrado.pdf" not in (output_dir / "_checkpoint.jsonl").read_text()
+
+def test_pipeline_fails_when_pool_breaks(corpus_dir, tmp_path, monkeypatch):
+    submit = concurrent.futures.ThreadPoolExecutor.submit
+
+    def broken_submit(pool, func, *args):
+        if func is corpus_pipeline._clean_document:
+            raise concurrent.futures.BrokenExecutor("worker encerrado")
+        return submit(pool, func, *args)
+
+    monkeypatch.setattr(concurrent.futures.ThreadPoolExecutor, 'submit', broken_submit)
+    pipeline = CorpusPipeline(tmp_path / "saida", executor='thread', queue_size=1, max_in_flight=1)
+    outcome = {}
+
+    def run():
+        try:
+            pipeline.run(corpus_dir)
+        except ProcessingError as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(30)
+    assert not thread.is_alive()
+    assert "cleaning" in str(outcome['error'])
+    assert isinstance(outcome['error'].__cause__, concurrent.futures.BrokenExecutor)
+
+def _kill_worker(text):
+    os._exit(1)
+
+def test_pipeline_fails_when_worker_dies(tmp_path):
+    # O único documento já foi enviado: o pool quebra só em future.result()
+    root = tmp_path / "corpus"
+    root.mkdir()
+    (root / "a.txt").write_text("Olá", encoding='utf-8')
+    pipeline = CorpusPipeline(tmp_path / "saida", cleaner=_kill_worker, extract_workers=1, clean_workers=1)
+
+    with pytest.raises(ProcessingError, match="cleaning") as excinfo:
+        pipeline.run(root)
+    assert isinstance(excinfo.value.__cause__, concurrent.futures.BrokenExecutor)
+    assert _read_records(tmp_path / "saida") == []
+
+def test_pipeline_with_process_pools(corpus_dir, tmp_path):
+    report = CorpusPipeline(tmp_path / "saida", extract_workers=2, clean_workers=2).run(corpus_dir)
+    assert report['processed'] == 4
+
+def test_pipeline_invalid_configuration(tmp_path):
+    with pytest.raises(ConfigurationError):
+        CorpusPipeline(tmp_path, executor='gpu')
+    with pytest.raises(ConfigurationError):
+        CorpusPipeline(tmp_path, output_format='csv')
+
+def test_pipeline_expands_archives(corpus_dir, tmp_path):
+    import gzip
+    import tarfile
+    pacote = tmp_path / "pacote"
+    pacote.mkdir()
+    (pacote / "e.txt").write_text("Dentro do pacote", encoding='utf-8')
+    write_pdf(pacote / "f.pdf", ["PDF compactado"])
+    with tarfile.open(corpus_dir / "lote.tar.gz", "w:gz") as archive:
+        archive.add(pacote / "e.txt", arcname="docs/e.txt")
+        archive.add(pacote / "f.pdf", arcname="docs/f.pdf")
+    (corpus_dir / "g.txt.gz").write_bytes(gzip.compress("Arquivo gzip".encode('utf-8')))
+
+    output_dir = tmp_path / "saida"
+    report = CorpusPipeline(output_dir, executor='thread').run(corpus_dir)
+    assert report['errors'] == []
+    assert report['processed'] == 7
+    records = {record['path'].replace(str(corpus_dir), ''): record for record in _read_records(output_dir)}
+    assert records['/lote.tar.gz!docs/e.txt']['text'] == "dentro do pacote"
+    assert records['/lote.tar.gz!docs/f.pdf']['text'] == "pdf compactado"
+    assert records['/g.txt.gz']['text'] == "arquivo gzip"
+
+    report = CorpusPipeline(output_dir, executor='thread').run(corpus_dir)
+    assert report['processed'] == 0
+    assert report['skipped'] == 7
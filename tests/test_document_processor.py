@@ -1,7 +1,9 @@
 import pytest
 import os
 from pathlib import Path
+from text_cleaner_for_py.cleaner import clean_text
 from text_cleaner_for_py.document_processor import DocumentProcessor
+from text_cleaner_for_py.synthetic_corpus import write_docx, write_pdf
 
 @pytest.fixture
 def processor():
@@ -21,13 +23,20 @@ def sample_txt_file(test_files_dir):
 
 @pytest.fixture
 def sample_docx_file(test_files_dir):
-    # TODO: Criar arquivo DOCX de teste
-    return None
+    return write_docx(
+        test_files_dir / "test.docx",
+        ["Primeiro parágrafo.", "Segundo parágrafo.", "Terceiro parágrafo."],
+        tables=[[["Nome", "Idade"], ["Ana", "30"]]],
+        page_break_after=0,
+    )
 
 @pytest.fixture
 def sample_pdf_file(test_files_dir):
-    # TODO: Criar arquivo PDF de teste
-    return None
+    return write_pdf(
+        test_files_dir / "test.pdf",
+        ["Primeira página do PDF.", "Segunda página do PDF."],
+        info={"Author": "Ana", "Title": "Relatório"},
+    )
 
 def test_read_txt_file(processor, sample_txt_file):
     content = processor.read_document(sample_txt_file)
@@ -52,22 +61,339 @@ def test_extract_metadata_txt(processor, sample_txt_file):
     assert 'created' in metadata
     assert 'modified' in metadata
 
-@pytest.mark.skipif(True, reason="Necessário implementar criação de arquivos de teste")
 def test_read_docx_file(processor, sample_docx_file):
     content = processor.read_document(sample_docx_file)
     assert content
+    assert "Segundo parágrafo." in content
 
-@pytest.mark.skipif(True, reason="Necessário implementar criação de arquivos de teste")
 def test_read_pdf_file(processor, sample_pdf_file):
     content = processor.read_document(sample_pdf_file)
     assert content
+    assert content == "Primeira página do PDF.\nSegunda página do PDF."
 
-@pytest.mark.skipif(True, reason="Necessário implementar criação de arquivos de teste")
 def test_extract_tables(processor, sample_docx_file):
     tables = processor.extract_tables(sample_docx_file)
     assert isinstance(tables, list)
+    assert tables == [[["Nome", "Idade"], ["Ana", "30"]]]
 
-@pytest.mark.skipif(True, reason="Necessário implementar criação de arquivos de teste")
 def test_extract_images(processor, sample_docx_file):
     images = processor.extract_images(sample_docx_file)
-    assert isinstance(images, list) 
\ No newline at end of file
+    assert isinstance(images, list) 
+
+def test_iter_document_pdf_pages(processor, sample_pdf_file):
+    blocks = list(processor.iter_document(sample_pdf_file))
+    assert [block.page for block in blocks] == [1, 2]
+    assert all(block.kind == 'page' for block in blocks)
+    assert blocks[1].text == "Segunda página do PDF."
+
+def test_iter_document_docx_paragraphs(processor, sample_docx_file):
+    blocks = list(processor.iter_document(sample_docx_file))
+    texts = [block.text for block in blocks if block.text and block.kind == 'paragraph']
+    assert texts == ["Primeiro parágrafo.", "Segundo parágrafo.", "Terceiro parágrafo."]
+    assert blocks[0].page == 1
+    assert blocks[-1].page == 2
+
+def test_iter_document_txt_blocks(test_files_dir):
+    file_path = test_files_dir / "grande.txt"
+    content = "".join(f"linha {i}\n" for i in range(1000))
+    file_path.write_text(content, encoding='utf-8')
+    processor = DocumentProcessor(block_size=100)
+    blocks = list(processor.iter_document(str(file_path)))
+    assert len(blocks) > 1
+    assert all(len(block.text) < 200 for block in blocks)
+    assert "".join(block.text for block in blocks) == content
+    assert [block.index for block in blocks] == list(range(len(blocks)))
+
+def test_iter_document_with_cleaner(processor, sample_pdf_file):
+    blocks = processor.iter_document(sample_pdf_file, cleaner=clean_text)
+    assert next(blocks).text == "primeira pagina do pdf"
+
+def test_read_pdf_parallel_preserves_order(test_files_dir):
+    pages = [f"Página {i}\nConteúdo da página {i}" for i in range(1, 8)]
+    file_path = write_pdf(test_files_dir / "paralelo.pdf", pages)
+    sequential = DocumentProcessor().read_document(file_path)
+    processor = DocumentProcessor(pdf_workers=2, parallel_min_pages=4, pages_per_task=2)
+    assert processor.read_document(file_path) == sequential
+    blocks = list(processor.iter_document(file_path))
+    assert [block.page for block in blocks] == list(range(1, 8))
+    assert blocks[6].text.startswith("Página 7")
+
+def test_process_docx_opens_once(processor, sample_docx_file, mocker):
+    import text_cleaner_for_py.document_processor as module
+    spy = mocker.spy(module, "Document")
+    with processor.process(sample_docx_file) as doc:
+        assert "Segundo parágrafo." in doc.text
+        assert doc.tables == [[["Nome", "Idade"], ["Ana", "30"]]]
+        assert doc.metadata['paragraphs'] == 4
+    assert spy.call_count == 1
+
+def test_process_pdf_opens_once(processor, sample_pdf_file, mocker):
+    import PyPDF2
+    spy = mocker.spy(PyPDF2, "PdfReader")
+    with processor.process(sample_pdf_file) as doc:
+        assert doc.metadata['pages'] == 2
+        assert doc.metadata['author'] == "Ana"
+        assert doc.text.startswith("Primeira página")
+        assert doc.tables == []
+    assert spy.call_count == 1
+
+def test_process_is_lazy(processor, sample_txt_file):
+    doc = processor.process(sample_txt_file)
+    assert doc.handle is None
+    assert doc.text == "Este é um arquivo de teste.\nSegunda linha."
+    assert doc.metadata['extension'] == '.txt'
+
+def test_docx_stream_includes_table_cells(processor, sample_docx_file, mocker):
+    import text_cleaner_for_py.document_processor as module
+    spy = mocker.spy(module, "Document")
+    cells = [block.text for block in processor.iter_document(sample_docx_file)
+             if block.kind == 'cell']
+    assert cells == ["Nome", "Idade", "Ana", "30"]
+    assert "Ana" in processor.read_document(sample_docx_file)
+    assert spy.call_count == 0
+
+def test_docx_backends_agree_on_paragraphs(sample_docx_file):
+    stream = DocumentProcessor(docx_backend='stream').iter_document(sample_docx_file)
+    full = DocumentProcessor(docx_backend='python-docx').iter_document(sample_docx_file)
+    paragraphs = [(b.text, b.page) for b in stream if b.kind == 'paragraph']
+    assert paragraphs == [(b.text, b.page) for b in full]
+
+def test_invalid_docx_backend():
+    from text_cleaner_for_py.exceptions import ConfigurationError
+    with pytest.raises(ConfigurationError):
+        DocumentProcessor(docx_backend='lxml')
+
+def test_read_document_from_bytes(processor, sample_pdf_file, sample_docx_file):
+    from pathlib import Path
+    pdf_bytes = Path(sample_pdf_file).read_bytes()
+    assert processor.read_document(pdf_bytes) == processor.read_document(sample_pdf_file)
+    docx_bytes = Path(sample_docx_file).read_bytes()
+    assert processor.read_document(memoryview(docx_bytes)) == processor.read_document(sample_docx_file)
+    assert processor.read_document("Olá, mundo.\n".encode('utf-8')) == "Olá, mundo.\n"
+
+def test_read_document_from_file_object(processor, sample_docx_file):
+    import io
+    with open(sample_docx_file, 'rb') as file:
+        assert processor.extract_tables(file) == [[["Nome", "Idade"], ["Ana", "30"]]]
+        file.seek(0)
+        metadata = processor.extract_metadata(file)
+    assert metadata['extension'] == '.docx'
+    assert metadata['filename'] == "test.docx"
+    assert metadata['modified'] is None
+    blocks = processor.iter_document(io.BytesIO(b"linha 1\nlinha 2\n"))
+    assert next(blocks).text == "linha 1\nlinha 2\n"
+
+def test_unsupported_zip_bytes(processor):
+    import io
+    import zipfile
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr("dados.csv", "a,b\n")
+    with pytest.raises(ValueError):
+        processor.read_document(buffer.getvalue())
+
+@pytest.mark.parametrize("data", [bytes(range(256)), b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"])
+def test_binary_bytes_are_unsupported(processor, data):
+    with pytest.raises(ValueError, match="Formato não suportado"):
+        processor.read_document(data)
+
+def test_text_mentioning_pdf_header_is_text(processor):
+    text = "Todo PDF começa com %PDF-1.7 no cabeçalho"
+    assert processor.read_document(text.encode('utf-8')) == text
+    assert processor.read_document("texto".encode('utf-16')) == "texto"
+
+def test_read_txt_detects_encoding(processor, test_files_dir):
+    file_path = test_files_dir / "latin.txt"
+    file_path.write_bytes("Ação e coração\r\nfim".encode('cp1252'))
+    assert processor.read_document(str(file_path)) == "Ação e coração\nfim"
+    bom_path = test_files_dir / "bom.txt"
+    bom_path.write_bytes("\ufeffOlá".encode('utf-8'))
+    assert processor.read_document(str(bom_path)) == "Olá"
+    utf16_path = test_files_dir / "utf16.txt"
+    utf16_path.write_text("Olá mundo", encoding='utf-16')
+    assert processor.read_document(str(utf16_path)) == "Olá mundo"
+
+def test_read_txt_error_handling(test_files_dir):
+    file_path = test_files_dir / "corrompido.txt"
+    file_path.write_bytes(b"texto v\xc3\xa1lido \xff fim")
+    strict = DocumentProcessor(text_encoding='utf-8')
+    with pytest.raises(UnicodeDecodeError):
+        strict.read_document(str(file_path))
+    lenient = DocumentProcessor(text_encoding='utf-8', text_errors='replace')
+    assert lenient.read_document(str(file_path)) == "texto válido � fim"
+
+def test_iter_txt_multibyte_across_chunks(test_files_dir):
+    file_path = test_files_dir / "acentos.txt"
+    content = "ção\n" * 50000
+    file_path.write_text(content, encoding='utf-8')
+    processor = DocumentProcessor(block_size=1000)
+    blocks = list(processor.iter_document(str(file_path)))
+    assert all(len(block.text) <= 1000 for block in blocks)
+    assert "".join(block.text for block in blocks) == content
+
+def test_read_compressed_documents(processor, test_files_dir, sample_pdf_file):
+    import bz2
+    import gzip
+    import lzma
+    from pathlib import Path
+    content = "Texto compactado.\nSegunda linha."
+    (test_files_dir / "a.txt.gz").write_bytes(gzip.compress(content.encode('utf-8')))
+    (test_files_dir / "b.txt.bz2").write_bytes(bz2.compress(content.encode('utf-8')))
+    (test_files_dir / "c.pdf.xz").write_bytes(lzma.compress(Path(sample_pdf_file).read_bytes()))
+    assert processor.read_document(str(test_files_dir / "a.txt.gz")) == content
+    assert processor.read_document(str(test_files_dir / "b.txt.bz2")) == content
+    assert processor.read_document(str(test_files_dir / "c.pdf.xz")) == processor.read_document(sample_pdf_file)
+    assert processor.extract_metadata(str(test_files_dir / "c.pdf.xz"))['pages'] == 2
+
+def test_iter_archive_members(processor, test_files_dir, sample_docx_file, sample_txt_file):
+    import tarfile
+    import zipfile
+    zip_path = test_files_dir / "pacote.zip"
+    with zipfile.ZipFile(zip_path, 'w') as archive:
+        archive.write(sample_docx_file, "docs/contrato.docx")
+        archive.write(sample_txt_file, "notas.txt")
+        archive.writestr("imagem.png", b"\x89PNG")
+    members = [(doc.name, doc.tables) for doc in processor.iter_archive(zip_path)]
+    assert members == [("docs/contrato.docx", [[["Nome", "Idade"], ["Ana", "30"]]]),
+                       ("notas.txt", [])]
+
+    tar_path = test_files_dir / "pacote.tar.bz2"
+    with tarfile.open(tar_path, "w:bz2") as archive:
+        archive.add(sample_txt_file, "notas.txt")
+        archive.add(sample_docx_file, "contrato.docx")
+    assert processor.is_archive(tar_path)
+    blocks = list(processor.iter_document(str(tar_path), cleaner=str.upper))
+    assert blocks[0].source == "notas.txt"
+    assert blocks[0].text.startswith("ESTE É UM ARQUIVO")
+    assert blocks[-1].source == "contrato.docx"
+    assert [block.index for block in blocks] == list(range(len(blocks)))
+    text = processor.read_document(str(tar_path))
+    assert "Segunda linha." in text and "Terceiro parágrafo." in text
+
+async def test_aread_document(processor, sample_pdf_file, sample_docx_file):
+    import asyncio
+    texts = await asyncio.gather(
+        processor.aread_document(sample_pdf_file),
+        processor.aread_document(sample_docx_file),
+    )
+    assert texts == [processor.read_document(sample_pdf_file),
+                     processor.read_document(sample_docx_file)]
+    metadata = await processor.aextract_metadata(sample_pdf_file)
+    assert metadata['pages'] == 2
+
+async def test_aiter_document(processor, sample_pdf_file):
+    blocks = [block async for block in processor.aiter_document(sample_pdf_file, cleaner=clean_text)]
+    assert [block.page for block in blocks] == [1, 2]
+    assert blocks[0].text == "primeira pagina do pdf"
+
+async def test_aiter_document_cancellation(processor):
+    import asyncio
+    import time
+    started = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def slow_cleaner(text):
+        loop.call_soon_threadsafe(started.set)
+        time.sleep(0.2)
+        return text
+
+    async def consume():
+        return [block async for block in processor.aiter_document(b"linha de texto\n" * 200_000,
+                                                                    cleaner=slow_cleaner)]
+
+    task = asyncio.create_task(consume())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+async def test_async_concurrency_limit(sample_txt_file, mocker):
+    import asyncio
+    import threading
+    import time
+    processor = DocumentProcessor(max_concurrency=2)
+    lock = threading.Lock()
+    state = {'running': 0, 'peak': 0}
+
+    def slow_read(file_path):
+        with lock:
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['running'])
+        time.sleep(0.05)
+        with lock:
+            state['running'] -= 1
+        return "ok"
+
+    mocker.patch.object(processor, "read_document", side_effect=slow_read)
+    results = await asyncio.gather(*(processor.aread_document(sample_txt_file) for _ in range(6)))
+    assert results == ["ok"] * 6
+    assert state['peak'] == 2
+
+def test_invalid_max_concurrency():
+    from text_cleaner_for_py.exceptions import ConfigurationError
+    with pytest.raises(ConfigurationError):
+        DocumentProcessor(max_concurrency=0)
+
+def test_extract_images_pdf_dedup(processor, test_files_dir):
+    logo = b"\xff\xd8\xff\xe0logo\xff\xd9"
+    photo = b"\xff\xd8\xff\xe0foto\xff\xd9"
+    file_path = write_pdf(test_files_dir / "imagens.pdf", ["Um", "Dois", "Três"],
+                          images=[[logo], [logo, photo], [logo]])
+    output_dir = test_files_dir / "imagens"
+    records = processor.extract_images(file_path, str(output_dir))
+    assert [(record.page, record.duplicate) for record in records] == [
+        (1, False), (2, True), (2, False), (3, True)]
+    assert records[0].path == records[1].path
+    assert records[0].size == len(logo) and records[0].extension == '.jpg'
+    assert sorted(p.name for p in output_dir.iterdir()) == sorted(
+        f"{record.sha256}.jpg" for record in records if not record.duplicate)
+    assert (output_dir / f"{records[2].sha256}.jpg").read_bytes() == photo
+
+def test_extract_images_docx(processor, test_files_dir):
+    from tests.fixtures import png_bytes
+    red, blue = png_bytes((255, 0, 0)), png_bytes((0, 0, 255))
+    file_path = write_docx(test_files_dir / "imagens.docx", ["Texto"], page_break_after=0,
+                           images=[red, blue, red])
+    records = processor.extract_images(file_path)
+    assert [record.page for record in records] == [2, 2, 2]
+    assert [record.duplicate for record in records] == [False, False, True]
+    assert records[0].sha256 == records[2].sha256
+    assert records[0].size == len(red) and records[0].path is None
+
+def test_image_store_removes_temporary_file_on_error(test_files_dir):
+    from text_cleaner_for_py.image_extraction import ImageStore
+
+    def broken_chunks():
+        yield b"\xff\xd8\xff\xe0"
+        raise OSError("leitura interrompida")
+
+    store = ImageStore(test_files_dir / "imagens")
+    with pytest.raises(OSError):
+        store.add(broken_chunks(), '.jpg', 1)
+    assert list((test_files_dir / "imagens").iterdir()) == []
+
+def test_pdf_images_require_pypdf2_helper(monkeypatch):
+    from text_cleaner_for_py.exceptions import ConfigurationError
+    from text_cleaner_for_py.image_extraction import _pdf_image_data
+    monkeypatch.delattr("PyPDF2.filters._xobj_to_image")
+    with pytest.raises(ConfigurationError):
+        _pdf_image_data({'/Filter': '/FlateDecode'}, 'doc.pdf')
+
+def test_pdf_metadata_does_not_walk_pages(processor, test_files_dir, mocker):
+    import PyPDF2
+    file_path = write_pdf(test_files_dir / "datas.pdf", ["Um", "Dois", "Três"],
+                          info={"Author": "Ana", "CreationDate": "D:20230115103000-03'00'"})
+    flatten = mocker.patch.object(PyPDF2.PdfReader, "_flatten", side_effect=AssertionError)
+    metadata = processor.extract_metadata(file_path)
+    assert flatten.call_count == 0
+    assert metadata['pages'] == 3
+    assert metadata['author'] == "Ana"
+    assert metadata['creation_date'] == "2023-01-15T10:30:00-03:00"
+    assert metadata['modification_date'] == ""
+
+def test_parse_pdf_date():
+    from text_cleaner_for_py.document_processor import _parse_pdf_date
+    assert _parse_pdf_date("D:2024") == "2024-01-01T00:00:00"
+    assert _parse_pdf_date("D:20241231235959Z") == "2024-12-31T23:59:59+00:00"
+    assert _parse_pdf_date("ontem") == "ontem"
+    assert _parse_pdf_date(None) == ""
@@ -0,0 +1,81 @@
+import pytest
+from pathlib import Path
+from text_cleaner_for_py.document_processor import DocumentProcessor
+from text_cleaner_for_py.extraction_cache import ExtractionCache, MISSING
+from text_cleaner_for_py.synthetic_corpus import write_docx, write_pdf
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExtractionCache(tmp_path / "cache")
+
+def test_get_and_put(cache, tmp_path):
+    file_path = tmp_path / "doc.txt"
+    file_path.write_text("conteúdo", encoding='utf-8')
+    key = cache.key_for(file_path)
+    assert cache.get(key, 'text') is MISSING
+    cache.put(key, 'text', "conteúdo")
+    cache.put(key, 'metadata', {'size': 9})
+    assert cache.get(key, 'text') == "conteúdo"
+    assert cache.get(key, 'metadata') == {'size': 9}
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['entries'] == 1
+
+def test_key_changes_with_file(cache, tmp_path):
+    file_path = tmp_path / "doc.txt"
+    file_path.write_text("versão 1", encoding='utf-8')
+    first = cache.key_for(file_path)
+    file_path.write_text("versão 2 maior", encoding='utf-8')
+    assert cache.key_for(file_path) != first
+
+def test_content_hash_identity(tmp_path):
+    file_path = tmp_path / "doc.txt"
+    file_path.write_text("abc", encoding='utf-8')
+    hashed = ExtractionCache(tmp_path / "cache", use_content_hash=True)
+    assert hashed.key_for(file_path) != ExtractionCache(tmp_path / "cache").key_for(file_path)
+
+def test_eviction_respects_max_bytes(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache", max_bytes=300)
+    for i in range(5):
+        file_path = tmp_path / f"doc{i}.txt"
+        file_path.write_text(str(i))
+        cache.put(cache.key_for(file_path), 'text', "x" * 100)
+    stats = cache.stats()
+    assert stats['bytes'] <= 300
+    assert 0 < stats['entries'] < 5
+    # A entrada mais recente nunca é removida
+    assert cache.get(cache.key_for(tmp_path / "doc4.txt"), 'text') == "x" * 100
+
+def test_processor_cache_hits_skip_parsing(cache, tmp_path, mocker):
+    pdf_path = write_pdf(tmp_path / "doc.pdf", ["Página um"])
+    docx_path = write_docx(tmp_path / "doc.docx", ["Parágrafo"], tables=[[["a", "b"]]])
+    processor = DocumentProcessor(cache=cache)
+    expected = (
+        processor.read_document(pdf_path),
+        processor.extract_metadata(pdf_path),
+        processor.read_document(docx_path),
+        processor.extract_tables(docx_path),
+    )
+    assert cache.stats()['misses'] == 4
+
+    pdf_reader = mocker.patch("text_cleaner_for_py.document_processor.PyPDF2.PdfReader")
+    document = mocker.patch("text_cleaner_for_py.document_processor.Document")
+    cached = (
+        processor.read_document(pdf_path),
+        processor.extract_metadata(pdf_path),
+        processor.read_document(docx_path),
+        processor.extract_tables(docx_path),
+    )
+    assert cached == expected
+    assert cache.stats()['hits'] == 4
+    pdf_reader.assert_not_called()
+    document.assert_not_called()
+
+def test_cache_for_in_memory_content(tmp_path, mocker):
+    content = Path(write_pdf(tmp_path / "memoria.pdf", ["Conteúdo em memória."])).read_bytes()
+    cache = ExtractionCache(tmp_path / "cache")
+    processor = DocumentProcessor(cache=cache)
+    first = processor.read_document(content)
+    pdf_reader = mocker.patch("text_cleaner_for_py.document_processor.PyPDF2.PdfReader")
+    assert processor.read_document(bytearray(content)) == first
+    assert pdf_reader.call_count == 0
@@ -0,0 +1,224 @@
+import json
+import logging
+import queue
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from text_cleaner_for_py.config import LoggingConfig
+from text_cleaner_for_py.exceptions import ConfigurationError
+from text_cleaner_for_py.logging_config import (
+    BoundedQueueHandler,
+    StructuredFormatter,
+    TextCleanerLogger,
+)
+
+
+def _record(message, *args, **extra_fields):
+    record = logging.LogRecord('teste', logging.INFO, __file__, 1, message, args, None)
+    if extra_fields:
+        record.extra_fields = extra_fields
+    return record
+
+
+def test_structured_formatter_emits_json():
+    formatter = StructuredFormatter(datefmt='%Y-%m-%d %H:%M:%S')
+    line = formatter.format(_record("Operação '%s'", 'limpeza', input_length=10, ratio=0.5))
+
+    entry = json.loads(line)
+    assert entry['message'] == "Operação 'limpeza'"
+    assert entry['level'] == 'INFO'
+    assert entry['input_length'] == 10
+    assert entry['ratio'] == 0.5
+
+
+def test_structured_formatter_includes_exception():
+    try:
+        raise ValueError("falhou")
+    except ValueError:
+        record = logging.LogRecord('teste', logging.ERROR, __file__, 1, 'erro', None,
+                                   sys.exc_info())
+
+    entry = json.loads(StructuredFormatter().format(record))
+    assert 'ValueError: falhou' in entry['exception']
+
+
+def test_queue_handler_drop_new_keeps_oldest_records():
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, 'drop_new')
+    for i in range(5):
+        handler.handle(_record(f"registro {i}"))
+
+    assert handler.dropped == 3
+    assert [log_queue.get_nowait().msg for _ in range(2)] == ['registro 0', 'registro 1']
+
+
+def test_queue_handler_drop_oldest_keeps_newest_records():
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, 'drop_oldest')
+    for i in range(5):
+        handler.handle(_record(f"registro {i}"))
+
+    assert handler.dropped == 3
+    assert [log_queue.get_nowait().msg for _ in range(2)] == ['registro 3', 'registro 4']
+
+
+def test_queue_handler_resolves_message_without_formatting():
+    log_queue = queue.Queue()
+    handler = BoundedQueueHandler(log_queue)
+    handler.handle(_record("%d documentos", 3, operation='limpeza'))
+
+    record = log_queue.get_nowait()
+    assert record.msg == '3 documentos'
+    assert record.args is None
+    assert record.extra_fields == {'operation': 'limpeza'}
+
+
+def test_invalid_drop_policy():
+    with pytest.raises(ConfigurationError):
+        BoundedQueueHandler(queue.Queue(), 'descartar')
+    with pytest.raises(ConfigurationError):
+        LoggingConfig(drop_policy='descartar').validate()
+    with pytest.raises(ConfigurationError):
+        LoggingConfig(queue_size=0).validate()
+
+
+def test_async_logger_writes_on_background_thread(tmp_path, monkeypatch):
+    log_file = tmp_path / 'logs' / 'app.log'
+    log_config = LoggingConfig(level='DEBUG', file=str(log_file), async_logging=True)
+    log = TextCleanerLogger('text_cleaner_for_py.teste_async', log_config)
+
+    threads = []
+    original_emit = logging.handlers.RotatingFileHandler.emit
+
+    def emit(handler, record):
+        threads.append(threading.current_thread())
+        original_emit(handler, record)
+
+    monkeypatch.setattr(logging.handlers.RotatingFileHandler, 'emit', emit)
+    for i in range(20):
+        log.log_operation('limpeza', 'x' * 10, 'x' * (i % 10), documento=i)
+    log.stop()
+
+    entries = [json.loads(line) for line in log_file.read_text(encoding='utf-8').splitlines()]
+    assert [entry['documento'] for entry in entries] == list(range(20))
+    assert threads and threading.main_thread() not in threads
+    assert log.dropped_records == 0
+
+
+def test_sync_logger_keeps_direct_handlers(tmp_path):
+    log_config = LoggingConfig(file=str(tmp_path / 'app.log'))
+    log = TextCleanerLogger('text_cleaner_for_py.teste_sync', log_config)
+
+    assert log.queue_handler is None
+    assert any(isinstance(h, logging.handlers.RotatingFileHandler) for h in log.logger.handlers)
+    log.info('mensagem', etapa='teste')
+    log.flush()
+    entry = json.loads((tmp_path / 'app.log').read_text(encoding='utf-8'))
+    assert entry['etapa'] == 'teste'
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class _Unmeasurable(str):
+    def __len__(self):
+        raise AssertionError("campos calculados para um registro descartado")
+
+
+def _capture(name, **options):
+    log = TextCleanerLogger(name, LoggingConfig(level='DEBUG', **options))
+    handler = _ListHandler()
+    log.logger.handlers[:] = [handler]
+    return log, handler
+
+
+def test_fields_not_computed_when_level_disabled():
+    log = TextCleanerLogger('text_cleaner_for_py.teste_nivel', LoggingConfig(level='WARNING'))
+    log.log_operation('limpeza', _Unmeasurable('a'), 'a')
+    log.log_performance('limpeza', 0.01, texto=_Unmeasurable('a'))
+
+
+def test_sample_every_emits_one_in_n():
+    log, handler = _capture('text_cleaner_for_py.teste_amostra', sample_every=3)
+    for i in range(9):
+        text = 'abc' if i % 3 == 0 else _Unmeasurable('abc')
+        log.log_operation('limpeza', text, 'ab', documento=i)
+    log.log_operation('outra', 'abc', 'ab')
+
+    assert [r.extra_fields.get('documento') for r in handler.records] == [0, 3, 6, None]
+    assert log.suppressed_records == 6
+
+
+def test_rate_limit_per_operation(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('text_cleaner_for_py.logging_config.time.monotonic', lambda: now[0])
+    log, handler = _capture('text_cleaner_for_py.teste_limite', rate_limit=2)
+    for _ in range(10):
+        log.log_operation('limpeza', 'abc', 'ab')
+        log.log_operation('outra', 'abc', 'ab')
+    now[0] += 1.0
+    log.log_operation('limpeza', 'abc', 'ab')
+
+    operations = [r.extra_fields['operation'] for r in handler.records]
+    assert operations.count('limpeza') == 3
+    assert operations.count('outra') == 2
+
+
+def test_aggregation_emits_periodic_summaries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('text_cleaner_for_py.logging_config.time.monotonic', lambda: now[0])
+    log, handler = _capture('text_cleaner_for_py.teste_resumo', aggregate_interval=10)
+    for i in range(1, 101):
+        log.log_operation('limpeza', 'x' * 10, 'x' * 4)
+        log.log_performance('limpeza', i / 1000)
+    assert handler.records == []
+
+    now[0] += 10.0
+    log.log_operation('limpeza', 'x' * 10, 'x' * 4)  # fecha a janela
+    log.log_operation('limpeza', 'x' * 10, 'x' * 4)
+    log.flush_summaries()
+
+    first, second = [r.extra_fields for r in handler.records]
+    assert first['count'] == 101 and first['timed_count'] == 100
+    assert first['input_length_total'] == 1010
+    assert first['output_length_total'] == 404
+    assert first['duration_mean_ms'] == pytest.approx(50.5)
+    assert first['duration_p50_ms'] == pytest.approx(50, abs=1)
+    assert first['duration_p95_ms'] == pytest.approx(95, abs=1)
+    assert first['duration_p99_ms'] == pytest.approx(99, abs=1)
+    assert second['count'] == 1 and 'duration_mean_ms' not in second
+
+
+def test_open_windows_are_flushed_at_exit(tmp_path):
+    log_file = tmp_path / 'app.log'
+    code = (
+        "from text_cleaner_for_py.config import LoggingConfig\n"
+        "from text_cleaner_for_py.logging_config import TextCleanerLogger\n"
+        f"config = LoggingConfig(file={str(log_file)!r}, async_logging=True, aggregate_interval=3600)\n"
+        "log = TextCleanerLogger('text_cleaner_for_py.teste_saida', config)\n"
+        "for _ in range(5):\n"
+        "    log.log_operation('limpeza', 'x' * 10, 'x' * 4)\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True, capture_output=True)
+
+    entry = json.loads(log_file.read_text(encoding='utf-8'))
+    assert entry['operation'] == 'limpeza' and entry['count'] == 5
+
+
+def test_aggregation_keeps_slow_operation_warnings():
+    log, handler = _capture('text_cleaner_for_py.teste_lento', aggregate_interval=60)
+    log.log_performance('ocr', 2.5)
+    log.log_performance('ocr', 0.1)
+
+    assert [r.levelno for r in handler.records] == [logging.WARNING]
+    log.flush_summaries()
+    assert handler.records[-1].extra_fields['timed_count'] == 2
@@ -0,0 +1,110 @@
+import pytest
+
+from text_cleaner_for_py.cleaner import clean_text
+from text_cleaner_for_py.document_processor import DocumentProcessor
+from text_cleaner_for_py.exceptions import ConfigurationError
+from text_cleaner_for_py.extraction_cache import ExtractionCache
+from text_cleaner_for_py.metrics import REGISTRY, MetricsRegistry
+from text_cleaner_for_py.performance_cleaner import PerformanceTextCleaner
+from text_cleaner_for_py.profiling import stage
+
+
+@pytest.fixture
+def metrics():
+    REGISTRY.reset()
+    REGISTRY.enable()
+    yield REGISTRY
+    REGISTRY.disable()
+    REGISTRY.reset()
+
+
+def _samples(snapshot, name):
+    return {tuple(s['labels'].values()): s for s in snapshot[name]['samples']}
+
+
+def test_disabled_registry_records_nothing():
+    REGISTRY.reset()
+    assert not REGISTRY.enabled
+    clean_text("<b>Olá</b>")
+    with stage('teste', 'etapa'):
+        pass
+    assert REGISTRY.to_prometheus() == ''
+    assert all(not metric['samples'] for metric in REGISTRY.snapshot().values())
+
+
+def test_clean_text_stages(metrics):
+    assert clean_text("<p>Olá,   Mundo!</p>") == 'ola mundo'
+    clean_text("Texto", case='snake')
+
+    snapshot = metrics.snapshot()
+    assert _samples(snapshot, 'text_cleaner_calls_total')[('clean_text',)]['value'] == 2
+    stages = _samples(snapshot, 'text_cleaner_stage_seconds')
+    assert stages[('clean_text', 'remove_html')]['count'] == 2
+    assert stages[('clean_text', 'case')]['count'] == 2
+    chars = _samples(snapshot, 'text_cleaner_chars_total')
+    assert chars[('clean_text', 'in')]['value'] == len("<p>Olá,   Mundo!</p>") + len("Texto")
+    assert chars[('clean_text', 'out')]['value'] == len('ola mundo') + len('texto')
+
+
+def test_local_cache_hits_and_workers(metrics):
+    cleaner = PerformanceTextCleaner(max_workers=2)
+    cleaner.clean_text_cached.cache_clear()
+    cleaner.clean_text_cached("Texto repetido")
+    cleaner.clean_text_cached("Texto repetido")
+    cleaner.clean_texts_parallel(["a", "b", "c", "d"])
+
+    snapshot = metrics.snapshot()
+    cache = _samples(snapshot, 'text_cleaner_cache_requests_total')
+    assert cache[('local', 'miss')]['value'] == 1
+    assert cache[('local', 'hit')]['value'] == 1
+    tasks = _samples(snapshot, 'text_cleaner_worker_tasks_total')
+    assert sum(s['value'] for s in tasks.values()) == 4
+    assert all(labels[0] == 'clean_texts_parallel' for labels in tasks)
+
+
+def test_document_extraction_metrics(metrics, tmp_path):
+    path = tmp_path / 'doc.txt'
+    path.write_text("linha 1\nlinha 2\n", encoding='utf-8')
+    processor = DocumentProcessor(cache=ExtractionCache(tmp_path / 'cache'))
+    processor.read_document(path)
+    processor.read_document(path)
+
+    snapshot = metrics.snapshot()
+    operations = _samples(snapshot, 'text_cleaner_document_operations_total')
+    assert operations[('.txt', 'text', 'ok')]['value'] == 1
+    assert _samples(snapshot, 'text_cleaner_document_seconds')[('.txt', 'text')]['count'] == 1
+    cache = _samples(snapshot, 'text_cleaner_cache_requests_total')
+    assert cache[('extraction', 'miss')]['value'] == 1
+    assert cache[('extraction', 'hit')]['value'] == 1
+
+
+def test_prometheus_exposition():
+    registry = MetricsRegistry(enabled=True)
+    counter = registry.counter('docs_total', 'Documentos', ('format',))
+    histogram = registry.histogram('stage_seconds', 'Etapas', ('stage',), buckets=(0.1, 1.0))
+    counter.labels('.pdf').inc(3)
+    counter.labels('a"b').inc()
+    histogram.labels('html').observe(0.05)
+    histogram.labels('html').observe(0.5)
+    histogram.labels('html').observe(2)
+
+    lines = registry.to_prometheus().splitlines()
+    assert '# TYPE docs_total counter' in lines
+    assert 'docs_total{format=".pdf"} 3' in lines
+    assert 'docs_total{format="a\\"b"} 1' in lines
+    assert '# TYPE stage_seconds histogram' in lines
+    assert 'stage_seconds_bucket{stage="html",le="0.1"} 1' in lines
+    assert 'stage_seconds_bucket{stage="html",le="1"} 2' in lines
+    assert 'stage_seconds_bucket{stage="html",le="+Inf"} 3' in lines
+    assert 'stage_seconds_sum{stage="html"} 2.55' in lines
+    assert 'stage_seconds_count{stage="html"} 3' in lines
+
+
+def test_registry_rejects_conflicting_metrics():
+    registry = MetricsRegistry()
+    counter = registry.counter('docs_total', 'Documentos', ('format',))
+    assert registry.counter('docs_total', 'Documentos', ('format',)) is counter
+    with pytest.raises(ConfigurationError):
+        registry.histogram('docs_total', 'Documentos', ('format',))
+    with pytest.raises(ConfigurationError):
+        counter.labels('.pdf', 'extra')
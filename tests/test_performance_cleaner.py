@@ -1,6 +1,8 @@
 import pytest
 import asyncio
+from text_cleaner_for_py.cleaner import clean_text
 from text_cleaner_for_py.performance_cleaner import PerformanceTextCleaner
+from text_cleaner_for_py.synthetic_corpus import CorpusGenerator, LengthDistribution
 
 @pytest.fixture
 def cleaner():
@@ -18,10 +20,17 @@ def test_parallel_text_processing(cleaner):
     assert "🧹" not in cleaned_texts[0]
 
 def test_large_text_processing(cleaner):
-    large_text = "Olá, mundo! " * 1000
+    large_text = CorpusGenerator(seed=1, noise='mixed').text(20_000)
     cleaned_text = cleaner.clean_large_text(large_text, chunk_size=1000)
     assert isinstance(cleaned_text, str)
     assert len(cleaned_text) > 0
+    assert '<' not in cleaned_text
+    assert cleaned_text == cleaned_text.lower()
+
+def test_parallel_matches_sequential_on_corpus(cleaner):
+    generator = CorpusGenerator(seed=2, noise='social', lengths=LengthDistribution('lognormal', median=300))
+    texts = list(generator.documents(50))
+    assert cleaner.clean_texts_parallel(texts) == [clean_text(text) for text in texts]
 
 def test_text_caching(cleaner):
     text = "Olá, mundo! 🧹✨"
@@ -0,0 +1,111 @@
+import json
+
+from text_cleaner_for_py import profiling
+from text_cleaner_for_py.advanced_cleaner import AdvancedTextCleaner
+from text_cleaner_for_py.cleaner import clean_text
+from text_cleaner_for_py.profiling import (
+    OpenTelemetryHook,
+    StageTimeline,
+    add_hook,
+    profile,
+    remove_hook,
+    stage,
+)
+from text_cleaner_for_py.spell_checker import SpellCheckerCleaner
+
+
+class _FakeSpan:
+    def __init__(self, name, start_time, attributes):
+        self.name = name
+        self.start_time = start_time
+        self.attributes = attributes
+        self.end_time = None
+
+    def end(self, end_time=None):
+        self.end_time = end_time
+
+
+class _FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, start_time=None, attributes=None):
+        span = _FakeSpan(name, start_time, attributes)
+        self.spans.append(span)
+        return span
+
+
+def test_no_hooks_means_no_measurement():
+    assert profiling._active == 0
+    assert stage('teste', 'etapa') is profiling._UNMEASURED
+    assert clean_text("<b>Olá</b>") == 'ola'
+
+
+def test_profile_records_clean_text_stages():
+    with profile(StageTimeline('doc-1')) as timeline:
+        result = clean_text("<p>Olá,   Mundo!</p>", case='snake')
+    clean_text("fora do escopo")
+
+    assert result == 'ola_mundo'
+    assert [e.stage for e in timeline.events] == [
+        'remove_html', 'remove_accents', 'remove_special_characters', 'remove_extra_spaces', 'case'
+    ]
+    first, last = timeline.events[0], timeline.events[-1]
+    assert first.operation == 'clean_text'
+    assert first.input_size == len("<p>Olá,   Mundo!</p>")
+    assert last.output_size == len('ola_mundo')
+    assert all(e.elapsed_ns >= 0 for e in timeline.events)
+    assert timeline.total_ns == sum(timeline.by_stage().values())
+    assert profiling._active == 0
+
+
+def test_timeline_written_as_json_lines(tmp_path):
+    with profile(StageTimeline('doc-1')) as timeline:
+        clean_text("Texto")
+    path = tmp_path / 'timeline.jsonl'
+    timeline.write(path)
+
+    entries = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert len(entries) == 5
+    assert entries[0]['document'] == 'doc-1' and entries[0]['offset_ns'] == 0
+    assert entries[0]['stage'] == 'remove_html'
+
+
+def test_global_hook_and_spell_stages():
+    events = []
+    add_hook(events.append)
+    try:
+        SpellCheckerCleaner().correct_text("vc está bem")
+    finally:
+        remove_hook(events.append)
+
+    assert [(e.operation, e.stage) for e in events] == [
+        ('correct_text', 'tokenize'), ('correct_text', 'correct'), ('correct_text', 'rewrite')
+    ]
+    assert events[0].input_size == len("vc está bem")
+    assert events[-1].output_size == len("você está bem")
+    assert profiling._active == 0
+
+
+def test_clean_advanced_returns_timings():
+    cleaner = AdvancedTextCleaner()
+    options = {'remove_urls': True, 'normalize_dates': True}
+    text = "Reunião em 25/12/2023 https://exemplo.com"
+
+    plain = cleaner.clean_advanced(text, options)
+    result, timeline = cleaner.clean_advanced(text, options, return_timings=True)
+
+    assert result == plain
+    assert list(timeline.by_stage()) == ['remove_urls', 'normalize_dates', 'detect_language']
+
+
+def test_opentelemetry_hook_emits_one_span_per_stage():
+    tracer = _FakeTracer()
+    with profile(OpenTelemetryHook(tracer)):
+        clean_text("Texto")
+
+    assert [span.name for span in tracer.spans][0] == 'clean_text.remove_html'
+    span = tracer.spans[0]
+    assert span.attributes['text_cleaner.stage'] == 'remove_html'
+    assert span.attributes['text_cleaner.input_size'] == 5
+    assert span.end_time >= span.start_time
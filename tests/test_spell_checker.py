@@ -1,4 +1,5 @@
 import pytest
+from spellchecker import SpellChecker
 from text_cleaner_for_py.spell_checker import SpellCheckerCleaner
 
 @pytest.fixture
@@ -47,4 +48,43 @@ def test_no_errors(spell_checker):
     result = spell_checker.check_text(text)
     assert result == {}
     corrected = spell_checker.correct_text(text)
-    assert corrected == text 
\ No newline at end of file
+    assert corrected == text 
+
+
+def test_correct_texts_matches_correct_text(spell_checker):
+    texts = ["Olá mundu! Como vai vc?", "Obrigadu, tambem estou bem.", ""]
+    expected = [spell_checker.correct_text(text) for text in texts]
+    spell_checker.clear_correction_cache()
+    assert spell_checker.correct_texts(texts) == expected
+
+
+def test_correct_texts_corrects_each_word_once(spell_checker, mocker):
+    spy = mocker.spy(SpellChecker, "correction")
+    texts = ["obrigadu pela ajuda", "Obrigadu de novo", "muito obrigadu"]
+    corrected = spell_checker.correct_texts(texts)
+    assert corrected[1].startswith("Obrigado")
+    assert spy.call_count == 1
+    # A memória de correções é reaproveitada entre lotes
+    spell_checker.correct_texts(["obrigadu"])
+    assert spy.call_count == 1
+    assert spell_checker.correction_cache_info()["hits"] >= 1
+
+
+def test_correction_cache_is_bounded():
+    checker = SpellCheckerCleaner(language='pt', correction_cache_size=1)
+    assert checker.correct_texts(["mundu obrigadu"]) == ["mundo obrigado"]
+    assert checker.correction_cache_info()["size"] == 1
+
+
+def test_correct_texts_with_processes(spell_checker):
+    texts = ["Olá mundu!", "obrigadu e tambem"]
+    expected = [spell_checker.correct_text(text) for text in texts]
+    assert spell_checker.correct_texts(texts, max_workers=2, chunk_size=1) == expected
+
+
+def test_check_texts(spell_checker):
+    results = spell_checker.check_texts(["Olá mundu!", "mundu e vc", "Olá mundo!"])
+    assert set(results[0]) == {"mundu"}
+    assert set(results[1]) == {"mundu", "vc"}
+    assert results[2] == {}
+    assert "mundo" in results[1]["mundu"]
@@ -0,0 +1,69 @@
+import struct
+import sys
+import pytest
+from text_cleaner_for_py.exceptions import FileProcessingError
+from text_cleaner_for_py.spell_checker import SpellCheckerCleaner
+from text_cleaner_for_py.spell_snapshot import SpellSnapshot, _uint32_section, write_spell_snapshot
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = tmp_path / "mini.snap"
+    write_spell_snapshot(
+        path,
+        {"mundo": 50, "mando": 10, "olá": 40, "casa": 30, "também": 20},
+        abbreviations={"vc": "você"},
+        corrections={"mundu": "mundo"},
+        language="pt",
+    )
+    return path
+
+def test_snapshot_lookup(snapshot_path):
+    with SpellSnapshot(snapshot_path) as snapshot:
+        assert len(snapshot) == 5
+        assert "mundo" in snapshot
+        assert "Mundo" in snapshot
+        assert "mundi" not in snapshot
+        assert snapshot["mundo"] == 50
+        assert snapshot["inexistente"] == 0
+        assert snapshot.unknown(["mundo", "mundu", "123"]) == {"mundu"}
+        assert snapshot.language == "pt"
+
+def test_snapshot_correction(snapshot_path):
+    with SpellSnapshot(snapshot_path) as snapshot:
+        assert snapshot.candidates("mundu") == {"mundo"}
+        assert snapshot.correction("mundu") == "mundo"
+        assert snapshot.correction("tambem") == "também"
+        assert snapshot.correction("xyzxyz") is None
+
+@pytest.mark.skipif(sys.byteorder != "little", reason="simula o host big-endian a partir de um little-endian")
+def test_uint32_sections_follow_host_byte_order():
+    values = [1, 256, 70000]
+    assert list(_uint32_section(memoryview(struct.pack("<3I", *values)))) == values
+    # Em um host big-endian os bytes little-endian do arquivo aparecem invertidos
+    swapped = memoryview(struct.pack(">3I", *values))
+    assert list(_uint32_section(swapped, byteorder="big")) == values
+
+def test_invalid_snapshot(tmp_path):
+    path = tmp_path / "invalido.snap"
+    path.write_bytes(b"nao e um snapshot")
+    with pytest.raises(FileProcessingError):
+        SpellSnapshot(path)
+
+def test_cleaner_from_snapshot(snapshot_path):
+    cleaner = SpellCheckerCleaner(dictionary_path=str(snapshot_path))
+    assert cleaner.language == "pt"
+    assert cleaner.correct_text("Olá Mundu! vc") == "Olá Mundo! você"
+    assert cleaner.correction_cache_info()["size"] == 1
+
+def test_save_snapshot_matches_json_dictionary(tmp_path):
+    cleaner = SpellCheckerCleaner(language='pt')
+    texts = ["Olá mundu! Como vai vc?", "Obrigadu, tambem estou bem."]
+    expected = cleaner.correct_texts(texts)
+    path = cleaner.save_snapshot(str(tmp_path / "pt.snap"))
+
+    from_snapshot = SpellCheckerCleaner(dictionary_path=path)
+    assert from_snapshot.correction_cache_info()["size"] > 0
+    from_snapshot.clear_correction_cache()
+    assert from_snapshot.correct_texts(texts) == expected
+    for got, want in zip(from_snapshot.check_texts(texts), cleaner.check_texts(texts)):
+        assert {w: set(s) for w, s in got.items()} == {w: set(s) for w, s in want.items()}
@@ -0,0 +1,88 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from text_cleaner_for_py.cleaner import remove_html
+from text_cleaner_for_py.document_processor import DocumentProcessor
+from text_cleaner_for_py.exceptions import ConfigurationError
+from text_cleaner_for_py.synthetic_corpus import (
+    CorpusGenerator,
+    LengthDistribution,
+    NoiseProfile,
+)
+
+
+def test_same_seed_generates_same_corpus():
+    first = list(CorpusGenerator(seed=7, noise='mixed').documents(5))
+    second = list(CorpusGenerator(seed=7, noise='mixed').documents(5))
+    other = list(CorpusGenerator(seed=8, noise='mixed').documents(5))
+
+    assert first == second
+    assert first != other
+    # Cada documento depende apenas do seu índice
+    assert list(CorpusGenerator(seed=7, noise='mixed').documents(2, start=3)) == first[3:]
+
+
+def test_text_has_requested_length():
+    text = CorpusGenerator(seed=1).text(5000)
+    assert 5000 <= len(text) < 5200
+
+
+def test_length_distribution_bounds():
+    lengths = LengthDistribution('lognormal', median=300, sigma=1.5, minimum=50, maximum=2000)
+    generator = CorpusGenerator(seed=3, lengths=lengths)
+    sizes = [generator.document_length(i) for i in range(200)]
+
+    assert min(sizes) >= 50 and max(sizes) <= 2000
+    assert len(set(sizes)) > 100
+
+
+@pytest.mark.parametrize("noise,pattern", [
+    ('html', r'<(div|p|ul|table|script)'),
+    ('ocr', r'[a-zà-ú][0-9][a-zà-ú]'),
+    ('financial', r'R\$ \d+\.\d{3},\d{2} em \d{2}/\d{2}/\d{4}'),
+    ('social', r'https://|@usuario|@exemplo\.com'),
+])
+def test_noise_profiles(noise, pattern):
+    text = CorpusGenerator(seed=1, noise=noise).text(5000)
+    assert re.search(pattern, text)
+    assert not re.search(pattern, CorpusGenerator(seed=1).text(5000))
+
+
+def test_english_documents():
+    text = CorpusGenerator(seed=1, language='en', noise='financial').text(3000)
+    assert ' the ' in text
+    assert re.search(r'\$\d+,\d{3}\.\d{2} on \d{2}/\d{2}/\d{4}', text)
+
+
+def test_duplicate_sentences():
+    profile = NoiseProfile(duplicate_rate=0.5)
+    sentences = re.split(r'(?<=[.!?]) ', CorpusGenerator(seed=2, noise=profile).text(5000))
+    assert len(set(sentences)) < len(sentences) * 0.8
+
+
+def test_write_formats_are_readable(tmp_path):
+    generator = CorpusGenerator(seed=4, lengths=3000)
+    paths = generator.write(tmp_path, 2, formats=('txt', 'html', 'docx', 'pdf'))
+    assert len(paths) == 8
+
+    processor = DocumentProcessor()
+    txt, html, docx, pdf = paths[:4]
+    expected = ' '.join(generator.paragraphs(3000, 0)[0].split()[:5])
+    assert expected in ' '.join(remove_html(Path(html).read_text(encoding='utf-8')).split())
+    for path in (txt, docx, pdf):
+        assert expected in ' '.join(processor.read_document(path).split())
+
+
+def test_invalid_configuration():
+    with pytest.raises(ConfigurationError):
+        CorpusGenerator(language='fr')
+    with pytest.raises(ConfigurationError):
+        CorpusGenerator(noise='inexistente')
+    with pytest.raises(ConfigurationError):
+        CorpusGenerator(noise=NoiseProfile(typo_rate=1.5))
+    with pytest.raises(ConfigurationError):
+        CorpusGenerator(lengths=LengthDistribution('normal'))
+    with pytest.raises(ConfigurationError):
+        CorpusGenerator().write('unused', 1, formats=('odt',))
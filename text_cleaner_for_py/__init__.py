@@ -1,3 +1,5 @@
+import importlib
+
 from text_cleaner_for_py.cleaner import (
     remove_accents,
     remove_special_characters,
@@ -21,19 +23,53 @@ from text_cleaner_for_py.exceptions import (
     PerformanceError,
 )
 
-from text_cleaner_for_py.config import config, ConfigManager, CleanerConfig, RedisConfig, LoggingConfig
-from text_cleaner_for_py.logging_config import logger, get_logger, TextCleanerLogger
-
-from text_cleaner_for_py.cleaner_v1 import (
-    normalize_text,
-    remove_html_tags,
-    clean_whitespace,
-    filter_letters,
-    filter_numbers,
-    remove_stopwords,
+from text_cleaner_for_py.config import (
+    ConfigManager,
+    CleanerConfig,
+    RedisConfig,
+    LoggingConfig,
+    ConfigSnapshot,
+    configure,
+    get_config,
+    get_snapshot,
 )
+from text_cleaner_for_py.logging_config import get_logger, TextCleanerLogger
+
+# A importação do submódulo define ``config`` no pacote; o nome é reservado à
+# configuração global, resolvida por ``__getattr__``
+del config
+
+# Carregados no primeiro acesso: a importação do pacote não constrói a
+# configuração nem o logger globais e não importa o NLTK
+_LAZY_ATTRIBUTES = {
+    "config": "config",
+    "logger": "logging_config",
+    "normalize_text": "cleaner_v1",
+    "remove_html_tags": "cleaner_v1",
+    "clean_whitespace": "cleaner_v1",
+    "filter_letters": "cleaner_v1",
+    "filter_numbers": "cleaner_v1",
+    "remove_stopwords": "cleaner_v1",
+    "remove_stopwords_many": "cleaner_v1",
+    "get_stopwords": "cleaner_v1",
+    "register_stopwords": "cleaner_v1",
+    "AdvancedTextCleaner": "advanced_cleaner",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    if name not in ("config", "logger"):
+        globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-from text_cleaner_for_py.advanced_cleaner import AdvancedTextCleaner
 
 __version__ = "1.5.0"
 
@@ -55,6 +91,9 @@ __all__ = [
     "filter_letters",
     "filter_numbers",
     "remove_stopwords",
+    "remove_stopwords_many",
+    "get_stopwords",
+    "register_stopwords",
     
     # Classes avançadas
     "AdvancedTextCleaner",
@@ -76,6 +115,10 @@ __all__ = [
     "CleanerConfig",
     "RedisConfig",
     "LoggingConfig",
+    "ConfigSnapshot",
+    "configure",
+    "get_config",
+    "get_snapshot",
     "logger",
     "get_logger",
     "TextCleanerLogger",
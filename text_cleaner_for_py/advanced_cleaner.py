@@ -1,6 +1,6 @@
 import re
 import unicodedata
-from typing import List, Dict, Union
+from typing import List, Dict, Tuple, Union
 from datetime import datetime
 import emoji
 import langdetect
@@ -8,11 +8,7 @@ from langdetect import DetectorFactory
 from nltk.stem import SnowballStemmer, WordNetLemmatizer
 import nltk
 
-# Garantir que os recursos necessários do NLTK estão disponíveis
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet')
+from .profiling import StageTimeline, profile, run_stages
 
 # Configurar o detector de idioma para ser determinístico
 DetectorFactory.seed = 0
@@ -33,6 +29,34 @@ MONTHS_PT = {
     12: 'dezembro'
 }
 
+_wordnet_checked = False
+
+
+def _ensure_wordnet() -> None:
+    """Baixa o corpus WordNet do NLTK no primeiro uso, se ainda não estiver instalado."""
+    global _wordnet_checked
+    if _wordnet_checked:
+        return
+    try:
+        nltk.data.find('corpora/wordnet')
+    except LookupError:
+        nltk.download('wordnet')
+    _wordnet_checked = True
+
+
+# Opções de clean_advanced aplicadas antes da detecção de idioma: (opção, método)
+_ADVANCED_STAGES = (
+    ('remove_emojis', 'remove_emojis'),
+    ('remove_urls', 'remove_urls'),
+    ('remove_emails', 'remove_emails'),
+    ('remove_typos', 'remove_typos'),
+    ('normalize_numbers', 'normalize_numbers'),
+    ('normalize_dates', 'normalize_dates'),
+    ('normalize_currency', 'normalize_currency'),
+    ('remove_duplicates', 'remove_duplicate_text'),
+    ('normalize_abbreviations', 'normalize_abbreviations'),
+)
+
 class AdvancedTextCleaner:
     def __init__(self):
         self.stemmers = {}
@@ -175,6 +199,7 @@ class AdvancedTextCleaner:
     def get_lemmatizer(self, language: str) -> WordNetLemmatizer:
         """Obtém ou cria um lemmatizer para o idioma especificado."""
         if language not in self.lemmatizers:
+            _ensure_wordnet()
             self.lemmatizers[language] = WordNetLemmatizer()
         return self.lemmatizers[language]
 
@@ -210,10 +235,15 @@ class AdvancedTextCleaner:
                 lemmatized_words.append(word)
         return ' '.join(lemmatized_words)
 
-    def clean_advanced(self, text: str, options: Dict[str, bool] = None) -> str:
+    def clean_advanced(self, text: str, options: Dict[str, bool] = None,
+                       return_timings: bool = False) -> Union[str, Tuple[str, StageTimeline]]:
         """
         Realiza uma limpeza avançada do texto com base nas opções especificadas.
         
+        Com ``return_timings=True`` retorna também a linha do tempo das etapas
+        executadas (``StageTimeline``: duração e tamanhos de entrada e saída de
+        cada etapa; ``by_stage()`` resume em nanossegundos por etapa).
+        
         Opções disponíveis:
         - remove_emojis: Remove emojis e emoticons
         - remove_urls: Remove URLs
@@ -242,29 +272,26 @@ class AdvancedTextCleaner:
                 'lemmatize': False
             }
 
-        if options.get('remove_emojis'):
-            text = self.remove_emojis(text)
-        if options.get('remove_urls'):
-            text = self.remove_urls(text)
-        if options.get('remove_emails'):
-            text = self.remove_emails(text)
-        if options.get('remove_typos'):
-            text = self.remove_typos(text)
-        if options.get('normalize_numbers'):
-            text = self.normalize_numbers(text)
-        if options.get('normalize_dates'):
-            text = self.normalize_dates(text)
-        if options.get('normalize_currency'):
-            text = self.normalize_currency(text)
-        if options.get('remove_duplicates'):
-            text = self.remove_duplicate_text(text)
-        if options.get('normalize_abbreviations'):
-            text = self.normalize_abbreviations(text)
+        stages = [
+            (option, getattr(self, method))
+            for option, method in _ADVANCED_STAGES if options.get(option)
+        ]
+
+        language = None
+
+        def detect(text: str) -> str:
+            nonlocal language
+            language = self.detect_language(text)
+            return text
 
-        language = self.detect_language(text)
+        stages.append(('detect_language', detect))
         if options.get('stem'):
-            text = self.stem_text(text, language)
+            stages.append(('stem', lambda text: self.stem_text(text, language)))
         if options.get('lemmatize'):
-            text = self.lemmatize_text(text, language)
+            stages.append(('lemmatize', lambda text: self.lemmatize_text(text, language)))
 
-        return text 
\ No newline at end of file
+        if not return_timings:
+            return run_stages('clean_advanced', text, stages)
+        with profile(StageTimeline()) as timeline:
+            text = run_stages('clean_advanced', text, stages)
+        return text, timeline
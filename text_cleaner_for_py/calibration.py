@@ -0,0 +1,306 @@
+"""
+Calibração automática do modo de execução, workers, lote e chunk.
+
+``calibrate`` roda micro-benchmarks curtos na máquina atual e em uma
+amostra dos textos do usuário:
+
+- custo médio de ``clean_text`` por item da amostra;
+- overhead por tarefa de um pool de threads e de processos (IPC);
+- vazão de ``clean_texts_parallel`` com threads e com processos para cada
+  número de workers candidato (potências de 2 até o número de CPUs);
+- tempo de ``clean_large_text`` para cada tamanho de chunk candidato.
+
+O resultado é um ``CalibrationProfile`` com o modo de execução
+('sequential', 'threads' ou 'processes'), o número de workers, o tamanho
+do lote enviado a cada processo e o tamanho de chunk. O perfil é gravado
+em JSON (``profile.save()``) e carregado automaticamente pelo
+``ConfigManager`` na inicialização, de modo que ``PerformanceTextCleaner``
+passa a usá-lo sem nenhuma configuração. Um perfil gravado em outra máquina
+(número de CPUs diferente) é ignorado.
+
+Local do perfil: ``TEXT_CLEANER_CALIBRATION`` (``off`` desliga o
+carregamento) ou ``~/.cache/text_cleaner_for_py/calibration.json``.
+
+Examples:
+    >>> profile = calibrate(amostra_de_textos)
+    >>> profile.save()
+"""
+
+import json
+import math
+import os
+import platform
+import time
+import concurrent.futures
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from .exceptions import ConfigurationError
+
+EXECUTION_MODES = ('sequential', 'threads', 'processes')
+
+# Ganho mínimo sobre a opção mais simples para justificar mais workers
+_MIN_GAIN = 1.1
+# Fração máxima do tempo de um lote gasta com o overhead de IPC
+_MAX_IPC_SHARE = 0.1
+_CHUNK_SIZES = (500, 1000, 4000, 16000)
+
+
+def cpu_count() -> int:
+    """CPUs disponíveis para o processo (respeita a afinidade no Linux)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def default_profile_path() -> Optional[Path]:
+    """
+    Caminho do perfil de calibração.
+
+    Returns:
+        Optional[Path]: ``TEXT_CLEANER_CALIBRATION`` ou o caminho padrão em
+        ``~/.cache``; None se o carregamento estiver desligado (``off``)
+    """
+    configured = os.getenv("TEXT_CLEANER_CALIBRATION")
+    if configured:
+        if configured.lower() in ("off", "false", "0"):
+            return None
+        return Path(configured).expanduser()
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "text_cleaner_for_py" / "calibration.json"
+
+
+@dataclass
+class CalibrationProfile:
+    """
+    Configuração de execução medida em uma máquina.
+
+    Attributes:
+        execution_mode: 'sequential', 'threads' ou 'processes'
+        max_workers: Número de workers de ``clean_texts_parallel``
+        batch_size: Textos enviados por tarefa a cada processo
+        chunk_size: Tamanho de chunk de ``clean_large_text``
+        cpu_count: CPUs disponíveis na calibração
+        item_cost_us: Custo médio de ``clean_text`` por item da amostra
+        thread_overhead_us: Overhead por tarefa no pool de threads
+        process_overhead_us: Overhead por tarefa no pool de processos (IPC)
+        throughput: Itens/s medidos por candidato ('threads:4', 'processes:8'...)
+        host: Nome da máquina
+        created_at: Data da calibração (ISO 8601, UTC)
+    """
+    execution_mode: str
+    max_workers: int
+    batch_size: int
+    chunk_size: int
+    cpu_count: int
+    item_cost_us: float = 0.0
+    thread_overhead_us: float = 0.0
+    process_overhead_us: float = 0.0
+    throughput: Dict[str, float] = field(default_factory=dict)
+    host: str = field(default_factory=platform.node)
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def validate(self) -> None:
+        """
+        Valida o perfil.
+
+        Raises:
+            ConfigurationError: Se algum valor for inválido
+        """
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ConfigurationError(
+                "execution_mode", self.execution_mode,
+                f"Deve ser um dos modos suportados: {', '.join(EXECUTION_MODES)}"
+            )
+        for key in ("max_workers", "batch_size", "chunk_size"):
+            if getattr(self, key) < 1:
+                raise ConfigurationError(key, getattr(self, key), "Deve ser maior que 0")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CalibrationProfile':
+        """
+        Reconstrói um perfil gravado (chaves desconhecidas são ignoradas).
+
+        Raises:
+            ConfigurationError: Se faltarem campos ou algum valor for inválido
+        """
+        known = {key: value for key, value in data.items() if key in cls.__dataclass_fields__}
+        try:
+            profile = cls(**known)
+        except TypeError as e:
+            raise ConfigurationError("calibration", data, str(e))
+        profile.validate()
+        return profile
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Grava o perfil em JSON.
+
+        Args:
+            path: Arquivo de saída (padrão: ``default_profile_path()``)
+
+        Returns:
+            Path: Arquivo gravado
+
+        Raises:
+            ConfigurationError: Se nenhum caminho for informado e o carregamento
+                estiver desligado
+        """
+        target = Path(path) if path is not None else default_profile_path()
+        if target is None:
+            raise ConfigurationError("TEXT_CLEANER_CALIBRATION", "off", "Informe o caminho do perfil")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        os.replace(tmp, target)
+        return target
+
+
+def load_profile(path: Optional[Union[str, Path]] = None) -> Optional[CalibrationProfile]:
+    """
+    Carrega o perfil de calibração desta máquina, se existir.
+
+    Args:
+        path: Arquivo do perfil (padrão: ``default_profile_path()``)
+
+    Returns:
+        Optional[CalibrationProfile]: None se o arquivo não existir, estiver
+        inválido ou tiver sido gravado com outro número de CPUs
+    """
+    target = Path(path) if path is not None else default_profile_path()
+    if target is None:
+        return None
+    try:
+        profile = CalibrationProfile.from_dict(json.loads(target.read_text(encoding="utf-8")))
+    except (OSError, ValueError, ConfigurationError):
+        return None
+    if profile.cpu_count != cpu_count():
+        return None
+    return profile
+
+
+# -- medições --------------------------------------------------------------------
+
+def _echo(text: str) -> int:
+    return len(text)
+
+
+def _timed(func: Callable[[], Any], repeat: int = 3) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _pool_overhead(executor: concurrent.futures.Executor, items: Sequence[str]) -> float:
+    """Segundos por tarefa para enviar um texto e receber a resposta."""
+    list(executor.map(_echo, items[:1]))  # inicia os workers fora da medição
+    return _timed(lambda: list(executor.map(_echo, items))) / len(items)
+
+
+def _worker_candidates(cpus: int, limit: Optional[int]) -> List[int]:
+    top = min(cpus, limit) if limit else cpus
+    candidates = {1, top}
+    workers = 2
+    while workers < top:
+        candidates.add(workers)
+        workers *= 2
+    return sorted(candidates)
+
+
+def _default_sample(size: int) -> List[str]:
+    from .synthetic_corpus import CorpusGenerator, LengthDistribution
+    generator = CorpusGenerator(seed=0, noise='mixed',
+                                lengths=LengthDistribution('lognormal', median=500, sigma=1.0))
+    return list(generator.documents(size))
+
+
+def calibrate(sample: Optional[Sequence[str]] = None, max_workers: Optional[int] = None,
+              sample_size: int = 400, include_processes: bool = True) -> CalibrationProfile:
+    """
+    Mede a máquina e a amostra e escolhe a configuração de execução.
+
+    Leva de alguns segundos a poucos minutos, conforme o tamanho da amostra
+    e o número de CPUs; rode uma vez por tipo de máquina e grave o perfil.
+
+    Args:
+        sample: Textos representativos dos dados reais (padrão: corpus sintético)
+        max_workers: Maior número de workers a testar (padrão: número de CPUs)
+        sample_size: Quantidade de textos usados da amostra
+        include_processes: Testa também o modo com processos
+
+    Returns:
+        CalibrationProfile: Perfil escolhido (ainda não gravado)
+
+    Raises:
+        ConfigurationError: Se a amostra estiver vazia
+    """
+    from .cleaner import clean_text
+    from .performance_cleaner import PerformanceTextCleaner
+
+    texts = list(sample[:sample_size]) if sample is not None else _default_sample(sample_size)
+    if not texts:
+        raise ConfigurationError("sample", sample, "A amostra de calibração está vazia")
+    cpus = cpu_count()
+    candidates = _worker_candidates(cpus, max_workers)
+
+    sequential = _timed(lambda: [clean_text(text) for text in texts])
+    item_cost = sequential / len(texts)
+    throughput = {'sequential:1': len(texts) / sequential}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        thread_overhead = _pool_overhead(executor, texts)
+    for workers in candidates:
+        with PerformanceTextCleaner(max_workers=workers, execution_mode='threads') as cleaner:
+            seconds = _timed(lambda: cleaner.clean_texts_parallel(texts))
+        throughput[f'threads:{workers}'] = len(texts) / seconds
+
+    process_overhead = 0.0
+    batch_size = 1
+    if include_processes and cpus > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            process_overhead = _pool_overhead(executor, texts)
+        # Lote grande o bastante para o IPC ficar abaixo de ~10% do trabalho
+        batch_size = max(1, min(1000, math.ceil(process_overhead / (_MAX_IPC_SHARE * item_cost))))
+        for workers in candidates:
+            with PerformanceTextCleaner(max_workers=workers, execution_mode='processes',
+                                        batch_size=batch_size) as cleaner:
+                cleaner.clean_texts_parallel(texts[:workers])  # inicia os processos
+                seconds = _timed(lambda: cleaner.clean_texts_parallel(texts))
+            throughput[f'processes:{workers}'] = len(texts) / seconds
+
+    # Preferência pela opção mais simples: só troca se ganhar pelo menos 10%
+    best_key = 'sequential:1'
+    for key, value in throughput.items():
+        if value > throughput[best_key] * _MIN_GAIN:
+            best_key = key
+    mode, workers = best_key.split(':')
+
+    large_text = ' '.join(texts)
+    chunk_timings = {}
+    with PerformanceTextCleaner(max_workers=int(workers), execution_mode=mode,
+                                batch_size=batch_size) as cleaner:
+        for chunk_size in _CHUNK_SIZES:
+            chunk_timings[chunk_size] = _timed(
+                lambda: cleaner.clean_large_text(large_text, chunk_size=chunk_size), repeat=1
+            )
+
+    return CalibrationProfile(
+        execution_mode=mode,
+        max_workers=int(workers),
+        batch_size=batch_size,
+        chunk_size=min(chunk_timings, key=chunk_timings.get),
+        cpu_count=cpus,
+        item_cost_us=item_cost * 1e6,
+        thread_overhead_us=thread_overhead * 1e6,
+        process_overhead_us=process_overhead * 1e6,
+        throughput=throughput,
+    )
@@ -4,6 +4,7 @@ from typing import Literal, Union
 
 from bs4 import BeautifulSoup
 from .exceptions import ValidationError, UnsupportedFormatError
+from .profiling import run_stages
 
 
 # 🔡 Remover acentos e normalizar texto
@@ -192,26 +193,27 @@ def clean_text(text: str, case: Literal['lower', 'upper', 'title', 'snake', 'cam
     if case not in ('lower', 'upper', 'title', 'snake', 'camel', 'pascal'):
         raise UnsupportedFormatError(case, ['lower', 'upper', 'title', 'snake', 'camel', 'pascal'])
     
-    text = remove_html(text)
-    text = remove_accents(text)
-    text = remove_special_characters(text)
-    text = remove_extra_spaces(text)
-
-    if case == 'lower':
-        return text.lower()
-    elif case == 'upper':
-        return text.upper()
-    elif case == 'title':
-        return text.title()
-    elif case == 'snake':
-        return to_snake_case(text)
-    elif case == 'camel':
-        return to_camel_case(text)
-    elif case == 'pascal':
-        return to_pascal_case(text)
-    else:
-        # Este ponto nunca deve ser alcançado devido à validação acima
-        raise RuntimeError("Erro interno: formato de case inválido")
+    return run_stages('clean_text', text, _CLEAN_STAGES[case])
+
+
+# Etapas de clean_text, na ordem de aplicação, para cada formato de saída
+_BASE_STAGES = (
+    ('remove_html', remove_html),
+    ('remove_accents', remove_accents),
+    ('remove_special_characters', remove_special_characters),
+    ('remove_extra_spaces', remove_extra_spaces),
+)
+_CLEAN_STAGES = {
+    case: _BASE_STAGES + (('case', convert),)
+    for case, convert in (
+        ('lower', str.lower),
+        ('upper', str.upper),
+        ('title', str.title),
+        ('snake', to_snake_case),
+        ('camel', to_camel_case),
+        ('pascal', to_pascal_case),
+    )
+}
 
 
 
@@ -1,17 +1,18 @@
 # 📦 text_cleaner/cleaner_v1.py
 
 import re
+import threading
 import unicodedata
+from typing import Dict, FrozenSet, Iterable, List, Optional, Union
 
 import nltk
 from bs4 import BeautifulSoup
 from nltk.corpus import stopwords
 
-# 📥 Garantir que o corpus de stopwords está disponível
-try:
-    nltk.data.find("corpora/stopwords")
-except LookupError:
-    nltk.download("stopwords")
+# 🗂️ Conjuntos de stopwords carregados uma única vez por idioma
+_stopword_sets: Dict[str, FrozenSet[str]] = {}
+_custom_stopwords: Dict[str, FrozenSet[str]] = {}
+_stopwords_lock = threading.Lock()
 
 
 def normalize_text(text: str) -> str:
@@ -44,12 +45,101 @@ def filter_numbers(text: str) -> str:
     return re.sub(r'[^0-9]', '', text)
 
 
-def remove_stopwords(text: str, language: str = 'portuguese') -> str:
-    """🔍 Remove stopwords do texto com base no idioma especificado."""
-    stop_words = set(stopwords.words(language))
+def _load_stopwords(language: str) -> FrozenSet[str]:
+    """📥 Lê o corpus do NLTK para o idioma (baixando-o se necessário)."""
+    try:
+        nltk.data.find("corpora/stopwords")
+    except LookupError:
+        nltk.download("stopwords")
+    return frozenset(word.casefold() for word in stopwords.words(language))
+
+
+def register_stopwords(name: str, words: Iterable[str]) -> FrozenSet[str]:
+    """🗂️ Registra uma lista personalizada de stopwords com o nome informado.
+
+    O nome pode então ser usado em ``language`` (sozinho ou combinado com
+    idiomas do NLTK) e tem precedência sobre um idioma de mesmo nome.
+    """
+    stop_words = frozenset(word.casefold() for word in words)
+    with _stopwords_lock:
+        _custom_stopwords[name] = stop_words
+        _stopword_sets.pop(name, None)
+    return stop_words
+
+
+def get_stopwords(
+    language: Union[str, Iterable[str]] = 'portuguese',
+    extra: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> FrozenSet[str]:
+    """🗂️ Retorna o conjunto de stopwords (em caixa normalizada) do idioma.
+
+    Os conjuntos de cada idioma são carregados do NLTK apenas na primeira
+    chamada e reaproveitados depois. ``language`` pode ser uma lista de
+    idiomas/listas registradas, cujos conjuntos são combinados; ``extra`` e
+    ``exclude`` acrescentam ou retiram palavras do resultado. Uma lista de
+    idiomas vazia gera ``ValueError``.
+    """
+    names = [language] if isinstance(language, str) else list(language)
+    if not names:
+        raise ValueError("language deve conter ao menos um idioma")
+    sets = []
+    for name in names:
+        stop_words = _custom_stopwords.get(name)
+        if stop_words is None:
+            stop_words = _stopword_sets.get(name)
+        if stop_words is None:
+            with _stopwords_lock:
+                stop_words = _stopword_sets.get(name)
+                if stop_words is None:
+                    stop_words = _stopword_sets[name] = _load_stopwords(name)
+        sets.append(stop_words)
+
+    merged = sets[0] if len(sets) == 1 else frozenset().union(*sets)
+    if extra:
+        merged = merged | {word.casefold() for word in extra}
+    if exclude:
+        merged = merged - {word.casefold() for word in exclude}
+    return merged
+
+
+def _resolve_stopwords(
+    language: Union[str, Iterable[str]],
+    stop_words: Optional[Iterable[str]],
+) -> FrozenSet[str]:
+    if stop_words is None:
+        return get_stopwords(language)
+    return frozenset(word.casefold() for word in stop_words)
+
+
+def _filter_stopwords(text: str, stop_words: FrozenSet[str]) -> str:
+    # ⚡ Caixa normalizada uma única vez no texto todo, não palavra a palavra
+    # (casefold nunca cria nem remove espaços, então as listas se alinham)
     words = text.split()
-    filtered_words = [word for word in words if word.lower() not in stop_words]
-    return ' '.join(filtered_words)
+    folded = text.casefold().split()
+    return ' '.join([word for word, key in zip(words, folded) if key not in stop_words])
+
+
+def remove_stopwords(
+    text: str,
+    language: Union[str, Iterable[str]] = 'portuguese',
+    stop_words: Optional[Iterable[str]] = None,
+) -> str:
+    """🔍 Remove stopwords do texto com base no idioma especificado.
+
+    ``stop_words`` substitui o conjunto do idioma por uma lista própria.
+    """
+    return _filter_stopwords(text, _resolve_stopwords(language, stop_words))
+
+
+def remove_stopwords_many(
+    texts: Iterable[str],
+    language: Union[str, Iterable[str]] = 'portuguese',
+    stop_words: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """🔍 Remove stopwords de vários textos, resolvendo o conjunto uma única vez."""
+    stop_words = _resolve_stopwords(language, stop_words)
+    return [_filter_stopwords(text, stop_words) for text in texts]
 
 
 # 🌟 Exemplo de uso
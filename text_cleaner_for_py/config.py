@@ -3,10 +3,16 @@ Configurações centralizadas para o text_cleaner_for_py.
 
 Este módulo define todas as configurações padrão e permite
 personalização através de variáveis de ambiente ou arquivos de configuração.
+
+Nada é lido na importação: a configuração global é construída no primeiro
+uso (``get_config()`` ou o atributo ``config``) ou explicitamente com
+``configure()``. Caminhos quentes leem ``get_snapshot()``, uma cópia
+imutável dos valores mais consultados.
 """
 
 import os
-from typing import Dict, List, Optional, Union
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
 from .exceptions import ConfigurationError
@@ -48,10 +54,22 @@ class CleanerConfig:
     cache_ttl: int = 3600  # segundos
     max_cache_size: int = 1000
     
-    # Configurações de performance
+    # Configurações de performance (sobrescritas pelo perfil de calibration.py, se houver)
     max_workers: int = 4
     chunk_size: int = 1000
     enable_gpu: bool = False
+    execution_mode: str = "threads"
+    supported_execution_modes: List[str] = field(default_factory=lambda: [
+        "sequential", "threads", "processes"
+    ])
+    batch_size: int = 100  # textos por tarefa no modo 'processes'
+    
+    # Métricas internas (metrics.REGISTRY)
+    enable_metrics: bool = False
+    
+    # Gancho de profiling instalado na importação (profiling.py): None, 'log' ou 'otel'
+    profiling: Optional[str] = None
+    supported_profilers: List[str] = field(default_factory=lambda: ["log", "otel"])
     
     def validate(self) -> None:
         """Valida as configurações."""
@@ -82,6 +100,27 @@ class CleanerConfig:
                 self.chunk_size, 
                 "Deve ser maior que 0"
             )
+        
+        if self.execution_mode not in self.supported_execution_modes:
+            raise ConfigurationError(
+                "execution_mode", 
+                self.execution_mode, 
+                f"Deve ser um dos modos suportados: {', '.join(self.supported_execution_modes)}"
+            )
+        
+        if self.batch_size < 1:
+            raise ConfigurationError(
+                "batch_size", 
+                self.batch_size, 
+                "Deve ser maior que 0"
+            )
+        
+        if self.profiling is not None and self.profiling not in self.supported_profilers:
+            raise ConfigurationError(
+                "profiling", 
+                self.profiling, 
+                f"Deve ser um dos ganchos suportados: {', '.join(self.supported_profilers)}"
+            )
 
 
 @dataclass
@@ -122,6 +161,20 @@ class LoggingConfig:
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     backup_count: int = 5
     
+    # Escrita em segundo plano (QueueHandler/QueueListener)
+    async_logging: bool = False
+    queue_size: int = 10000
+    drop_policy: str = "drop_new"
+    supported_drop_policies: List[str] = field(default_factory=lambda: [
+        "drop_new", "drop_oldest", "block"
+    ])
+    
+    # Volume de log_operation/log_performance por operação
+    sample_every: int = 1  # registra 1 a cada N chamadas
+    sample_rate: float = 1.0  # probabilidade de registrar cada chamada
+    rate_limit: float = 0.0  # registros por segundo (0 = sem limite)
+    aggregate_interval: float = 0.0  # segundos por janela de resumo, emitido na chamada seguinte (0 = um registro por chamada)
+    
     def validate(self) -> None:
         """Valida as configurações de logging."""
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -131,6 +184,125 @@ class LoggingConfig:
                 self.level, 
                 f"Deve ser um dos níveis válidos: {', '.join(valid_levels)}"
             )
+        
+        if self.queue_size < 1:
+            raise ConfigurationError(
+                "queue_size", 
+                self.queue_size, 
+                "Deve ser maior que 0"
+            )
+        
+        if self.drop_policy not in self.supported_drop_policies:
+            raise ConfigurationError(
+                "drop_policy", 
+                self.drop_policy, 
+                f"Deve ser uma das políticas suportadas: {', '.join(self.supported_drop_policies)}"
+            )
+        
+        if self.sample_every < 1:
+            raise ConfigurationError(
+                "sample_every", 
+                self.sample_every, 
+                "Deve ser maior que 0"
+            )
+        
+        if not 0.0 < self.sample_rate <= 1.0:
+            raise ConfigurationError(
+                "sample_rate", 
+                self.sample_rate, 
+                "Deve estar no intervalo (0, 1]"
+            )
+        
+        if self.rate_limit < 0:
+            raise ConfigurationError(
+                "rate_limit", 
+                self.rate_limit, 
+                "Não pode ser negativo"
+            )
+        
+        if self.aggregate_interval < 0:
+            raise ConfigurationError(
+                "aggregate_interval", 
+                self.aggregate_interval, 
+                "Não pode ser negativo"
+            )
+
+
+def _env_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+# Variável de ambiente -> (seção do ConfigManager, campo, conversão)
+_ENVIRONMENT: Dict[str, Tuple[str, str, Callable[[str], Any]]] = {
+    # Configurações do cleaner
+    "TEXT_CLEANER_REMOVE_HTML": ("cleaner", "remove_html", _env_bool),
+    "TEXT_CLEANER_DEFAULT_CASE": ("cleaner", "default_case", str),
+    "TEXT_CLEANER_DEFAULT_LANGUAGE": ("cleaner", "default_language", str),
+    "TEXT_CLEANER_MAX_WORKERS": ("cleaner", "max_workers", int),
+    "TEXT_CLEANER_EXECUTION_MODE": ("cleaner", "execution_mode", str.lower),
+    "TEXT_CLEANER_BATCH_SIZE": ("cleaner", "batch_size", int),
+    "TEXT_CLEANER_CHUNK_SIZE": ("cleaner", "chunk_size", int),
+    "TEXT_CLEANER_METRICS": ("cleaner", "enable_metrics", _env_bool),
+    "TEXT_CLEANER_PROFILING": ("cleaner", "profiling", str.lower),
+    # Configurações do Redis
+    "TEXT_CLEANER_REDIS_HOST": ("redis", "host", str),
+    "TEXT_CLEANER_REDIS_PORT": ("redis", "port", int),
+    "TEXT_CLEANER_REDIS_PASSWORD": ("redis", "password", str),
+    # Configurações de logging
+    "TEXT_CLEANER_LOG_LEVEL": ("logging", "level", str),
+    "TEXT_CLEANER_LOG_ASYNC": ("logging", "async_logging", _env_bool),
+    "TEXT_CLEANER_LOG_QUEUE_SIZE": ("logging", "queue_size", int),
+    "TEXT_CLEANER_LOG_DROP_POLICY": ("logging", "drop_policy", str),
+    "TEXT_CLEANER_LOG_SAMPLE_EVERY": ("logging", "sample_every", int),
+    "TEXT_CLEANER_LOG_SAMPLE_RATE": ("logging", "sample_rate", float),
+    "TEXT_CLEANER_LOG_RATE_LIMIT": ("logging", "rate_limit", float),
+    "TEXT_CLEANER_LOG_AGGREGATE_INTERVAL": ("logging", "aggregate_interval", float),
+}
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Cópia imutável das configurações lidas em caminhos quentes.
+    
+    Os campos são planos (``snapshot.max_workers`` em vez de
+    ``config.get_cleaner_config().max_workers``) e o objeto pode ser
+    compartilhado entre threads sem cópia.
+    """
+    
+    max_workers: int
+    chunk_size: int
+    execution_mode: str
+    supported_execution_modes: Tuple[str, ...]
+    batch_size: int
+    enable_cache: bool
+    cache_ttl: int
+    max_cache_size: int
+    default_case: str
+    default_language: str
+    enable_metrics: bool
+    profiling: Optional[str]
+    log_level: str
+    
+    @classmethod
+    def from_manager(cls, manager: 'ConfigManager') -> 'ConfigSnapshot':
+        """Copia os valores atuais de um ``ConfigManager``."""
+        cleaner = manager.cleaner
+        return cls(
+            max_workers=cleaner.max_workers,
+            chunk_size=cleaner.chunk_size,
+            execution_mode=cleaner.execution_mode,
+            supported_execution_modes=tuple(cleaner.supported_execution_modes),
+            batch_size=cleaner.batch_size,
+            enable_cache=cleaner.enable_cache,
+            cache_ttl=cleaner.cache_ttl,
+            max_cache_size=cleaner.max_cache_size,
+            default_case=cleaner.default_case,
+            default_language=cleaner.default_language,
+            enable_metrics=cleaner.enable_metrics,
+            profiling=cleaner.profiling,
+            log_level=manager.logging.level.upper(),
+        )
 
 
 class ConfigManager:
@@ -141,38 +313,30 @@ class ConfigManager:
         self.cleaner = CleanerConfig()
         self.redis = RedisConfig()
         self.logging = LoggingConfig()
+        self.calibration = None
+        self._snapshot: Optional[ConfigSnapshot] = None
         
+        self._load_calibration()
         self._load_from_environment()
         self._validate_all()
     
-    def _load_from_environment(self) -> None:
-        """Carrega configurações das variáveis de ambiente."""
-        # Configurações do cleaner
-        if os.getenv("TEXT_CLEANER_REMOVE_HTML"):
-            self.cleaner.remove_html = os.getenv("TEXT_CLEANER_REMOVE_HTML").lower() == "true"
-        
-        if os.getenv("TEXT_CLEANER_DEFAULT_CASE"):
-            self.cleaner.default_case = os.getenv("TEXT_CLEANER_DEFAULT_CASE")
-        
-        if os.getenv("TEXT_CLEANER_DEFAULT_LANGUAGE"):
-            self.cleaner.default_language = os.getenv("TEXT_CLEANER_DEFAULT_LANGUAGE")
-        
-        if os.getenv("TEXT_CLEANER_MAX_WORKERS"):
-            self.cleaner.max_workers = int(os.getenv("TEXT_CLEANER_MAX_WORKERS"))
-        
-        # Configurações do Redis
-        if os.getenv("TEXT_CLEANER_REDIS_HOST"):
-            self.redis.host = os.getenv("TEXT_CLEANER_REDIS_HOST")
-        
-        if os.getenv("TEXT_CLEANER_REDIS_PORT"):
-            self.redis.port = int(os.getenv("TEXT_CLEANER_REDIS_PORT"))
+    def _load_calibration(self) -> None:
+        """Aplica o perfil de calibração desta máquina (calibration.py), se existir."""
+        from .calibration import load_profile
         
-        if os.getenv("TEXT_CLEANER_REDIS_PASSWORD"):
-            self.redis.password = os.getenv("TEXT_CLEANER_REDIS_PASSWORD")
-        
-        # Configurações de logging
-        if os.getenv("TEXT_CLEANER_LOG_LEVEL"):
-            self.logging.level = os.getenv("TEXT_CLEANER_LOG_LEVEL")
+        self.calibration = load_profile()
+        if self.calibration is not None:
+            self.cleaner.execution_mode = self.calibration.execution_mode
+            self.cleaner.max_workers = self.calibration.max_workers
+            self.cleaner.batch_size = self.calibration.batch_size
+            self.cleaner.chunk_size = self.calibration.chunk_size
+    
+    def _load_from_environment(self) -> None:
+        """Carrega configurações das variáveis de ambiente (ver ``_ENVIRONMENT``)."""
+        for variable, (section, key, convert) in _ENVIRONMENT.items():
+            value = os.getenv(variable)
+            if value:
+                setattr(getattr(self, section), key, convert(value))
     
     def _validate_all(self) -> None:
         """Valida todas as configurações."""
@@ -191,6 +355,18 @@ class ConfigManager:
         """Retorna as configurações de logging."""
         return self.logging
     
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Retorna a cópia imutável das configurações atuais.
+        
+        A cópia é refeita apenas depois de ``update_cleaner_config``;
+        alterações diretas nos atributos das seções não são refletidas.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = ConfigSnapshot.from_manager(self)
+        return snapshot
+    
     def update_cleaner_config(self, **kwargs) -> None:
         """Atualiza configurações do cleaner."""
         for key, value in kwargs.items():
@@ -204,6 +380,7 @@ class ConfigManager:
                 )
         
         self.cleaner.validate()
+        self._snapshot = None
     
     def to_dict(self) -> Dict[str, Dict]:
         """Converte todas as configurações para dicionário."""
@@ -214,5 +391,112 @@ class ConfigManager:
         }
 
 
-# Instância global de configuração
-config = ConfigManager()
+# Instância global de configuração, construída no primeiro uso
+_config: Optional[ConfigManager] = None
+_config_lock = threading.Lock()
+_listeners: List[Callable[[ConfigManager], None]] = []
+
+
+def get_config() -> ConfigManager:
+    """
+    Retorna a configuração global, construindo-a no primeiro uso.
+    
+    A construção notifica os ouvintes de ``on_configure``, como ``configure()``.
+    
+    Returns:
+        ConfigManager: Configuração global
+        
+    Raises:
+        ConfigurationError: Se as variáveis de ambiente ou o perfil de
+            calibração tiverem valores inválidos
+    """
+    global _config
+    manager = _config
+    if manager is None:
+        built = False
+        with _config_lock:
+            if _config is None:
+                _config = ConfigManager()
+                built = True
+            manager = _config
+        if built:
+            _notify(manager)
+    return manager
+
+
+def _notify(manager: ConfigManager) -> None:
+    for listener in list(_listeners):
+        listener(manager)
+
+
+def get_snapshot() -> ConfigSnapshot:
+    """Cópia imutável da configuração global (ver ``ConfigSnapshot``)."""
+    return get_config().snapshot()
+
+
+def configure(manager: Optional[ConfigManager] = None, **cleaner_options) -> ConfigManager:
+    """
+    Define explicitamente a configuração global.
+    
+    Métricas, o gancho de profiling e o logger global já criados passam a
+    seguir a nova configuração.
+    
+    Args:
+        manager: Configuração a instalar (padrão: uma nova, lida do ambiente)
+        **cleaner_options: Valores aplicados com ``update_cleaner_config``
+        
+    Returns:
+        ConfigManager: Configuração instalada
+        
+    Raises:
+        ConfigurationError: Se algum valor for inválido
+        
+    Examples:
+        >>> configure(max_workers=8, enable_metrics=True)
+    """
+    global _config
+    manager = manager if manager is not None else ConfigManager()
+    if cleaner_options:
+        manager.update_cleaner_config(**cleaner_options)
+    with _config_lock:
+        _config = manager
+    _notify(manager)
+    return manager
+
+
+def on_configure(listener: Callable[[ConfigManager], None]) -> None:
+    """
+    Registra uma função chamada com a configuração global quando ela é
+    construída no primeiro uso e a cada ``configure()``.
+    """
+    _listeners.append(listener)
+
+
+def get_cleaner_setting(key: str) -> Any:
+    """
+    Valor de uma configuração do cleaner sem construir a configuração global.
+    
+    Usado pelos módulos que precisam de um valor na importação (métricas e
+    profiling): se a configuração global ainda não existe, lê apenas a
+    variável de ambiente correspondente ou o padrão do ``CleanerConfig``
+    (sem o perfil de calibração).
+    
+    Args:
+        key: Campo do ``CleanerConfig``
+        
+    Returns:
+        Any: Valor configurado
+    """
+    if _config is not None:
+        return getattr(_config.cleaner, key)
+    for variable, (section, name, convert) in _ENVIRONMENT.items():
+        if section == "cleaner" and name == key and os.getenv(variable):
+            return convert(os.getenv(variable))
+    return CleanerConfig.__dataclass_fields__[key].default
+
+
+def __getattr__(name: str) -> Any:
+    # ``config`` continua disponível como atributo, mas só é construído no primeiro acesso
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,522 @@
+"""
+Pipeline de ingestão de corpus: descoberta → extração → limpeza → JSONL.
+
+Processa diretórios com milhares de documentos (PDF, DOCX, TXT) em estágios
+independentes ligados por filas limitadas, de forma que a descoberta de
+arquivos, a extração de texto e a limpeza acontecem ao mesmo tempo, cada uma
+no seu próprio pool. O resultado é gravado em shards JSONL (ou Parquet, se o
+``pyarrow`` estiver instalado) e um checkpoint permite retomar uma execução
+interrompida sem reprocessar os arquivos já concluídos.
+
+Pacotes .zip/.tar são expandidos na descoberta: cada membro é descompactado
+em memória e segue pelo pipeline como um documento próprio
+(``'pacote.tar.gz!pasta/doc.pdf'``), enquanto os membros anteriores já estão
+sendo extraídos e limpos.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+import concurrent.futures
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .cleaner import clean_text
+from .document_processor import DocumentProcessor
+from .exceptions import ConfigurationError, ProcessingError
+from .logging_config import get_logger
+
+# Marca o fim do fluxo em uma fila entre estágios
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Contadores de um estágio do pipeline."""
+
+    name: str
+    items: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    @property
+    def wall_seconds(self) -> float:
+        """Tempo entre o primeiro item recebido e o fim do estágio."""
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Resumo do estágio, incluindo a vazão em itens por segundo."""
+        wall = self.wall_seconds
+        return {
+            'items': self.items,
+            'errors': self.errors,
+            'wall_seconds': wall,
+            'busy_seconds': self.busy_seconds,
+            'items_per_second': self.items / wall if wall > 0 else 0.0,
+        }
+
+
+@dataclass
+class _WorkItem:
+    """Documento em trânsito entre os estágios."""
+
+    path: str
+    size: int
+    mtime: float
+    text: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    data: Optional[bytes] = None  # conteúdo de membros de pacotes
+
+
+def _extract_document(processor: DocumentProcessor,
+                      path: Union[str, bytes]) -> Tuple[str, Dict[str, Any], float]:
+    """Extrai texto e metadados de um arquivo (executado no pool de extração)."""
+    started = time.perf_counter()
+    with processor.process(path) as doc:
+        text, metadata = doc.text, doc.metadata
+    return text, metadata, time.perf_counter() - started
+
+
+def _clean_document(cleaner: Callable[[str], str], text: str) -> Tuple[str, float]:
+    """Limpa o texto de um documento (executado no pool de limpeza)."""
+    started = time.perf_counter()
+    cleaned = cleaner(text)
+    return cleaned, time.perf_counter() - started
+
+
+class _JsonlShardWriter:
+    """Grava registros em shards JSONL; cada registro é durável ao ser escrito."""
+
+    extension = '.jsonl'
+
+    def __init__(self, output_dir: Path, first_shard: int, shard_size: int) -> None:
+        self.output_dir = output_dir
+        self.shard_index = first_shard
+        self.shard_size = shard_size
+        self.shards: List[str] = []
+        self._file = None
+        self._count = 0
+
+    def _shard_path(self) -> Path:
+        return self.output_dir / f"part-{self.shard_index:05d}{self.extension}"
+
+    def write(self, record: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Grava o registro e retorna os registros confirmados em disco."""
+        if self._file is None:
+            path = self._shard_path()
+            self.shards.append(path.name)
+            self._file = open(path, 'w', encoding='utf-8')
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+        self._count += 1
+        if self._count >= self.shard_size:
+            self._rotate()
+        return [record]
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        self._count = 0
+        self.shard_index += 1
+
+    def close(self) -> List[Dict[str, Any]]:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return []
+
+
+class _ParquetShardWriter(_JsonlShardWriter):
+    """Acumula registros e grava cada shard Parquet de uma vez ao completá-lo."""
+
+    extension = '.parquet'
+
+    def __init__(self, output_dir: Path, first_shard: int, shard_size: int) -> None:
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise ConfigurationError(
+                "output_format", "parquet", "Instale o pacote 'pyarrow' para gravar Parquet"
+            )
+        super().__init__(output_dir, first_shard, shard_size)
+        self._buffer: List[Dict[str, Any]] = []
+
+    def write(self, record: Dict[str, Any]) -> List[Dict[str, Any]]:
+        self._buffer.append(record)
+        if len(self._buffer) >= self.shard_size:
+            return self._flush()
+        return []
+
+    def _flush(self) -> List[Dict[str, Any]]:
+        import pyarrow
+        import pyarrow.parquet
+
+        records, self._buffer = self._buffer, []
+        if not records:
+            return []
+        rows = [
+            {**record, 'metadata': json.dumps(record['metadata'], ensure_ascii=False, default=str)}
+            for record in records
+        ]
+        path = self._shard_path()
+        pyarrow.parquet.write_table(pyarrow.Table.from_pylist(rows), path)
+        self.shards.append(path.name)
+        self.shard_index += 1
+        return records
+
+    def close(self) -> List[Dict[str, Any]]:
+        return self._flush()
+
+
+class CorpusPipeline:
+    """
+    Pipeline produtor/consumidor para limpar diretórios inteiros de documentos.
+
+    Estágios:
+        1. descoberta: percorre o diretório e ignora arquivos já concluídos;
+        2. extração: lê texto e metadados em um pool de processos (ou threads);
+        3. limpeza: aplica ``cleaner`` ao texto em outro pool;
+        4. escrita: grava shards e atualiza o checkpoint.
+
+    Os estágios são ligados por filas limitadas e cada pool mantém no máximo
+    ``max_in_flight`` tarefas pendentes, então o uso de memória não cresce
+    com o tamanho do corpus.
+    """
+
+    CHECKPOINT_NAME = '_checkpoint.jsonl'
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        cleaner: Callable[[str], str] = clean_text,
+        processor: Optional[DocumentProcessor] = None,
+        extract_workers: int = 4,
+        clean_workers: int = 4,
+        executor: str = 'process',
+        queue_size: int = 64,
+        max_in_flight: Optional[int] = None,
+        shard_size: int = 10000,
+        output_format: str = 'jsonl',
+    ) -> None:
+        """
+        Inicializa o pipeline.
+
+        Args:
+            output_dir: Diretório de saída dos shards e do checkpoint
+            cleaner: Função de limpeza aplicada a cada documento (precisa ser
+                serializável com pickle quando ``executor='process'``)
+            processor: Processador de documentos usado na extração
+            extract_workers: Tamanho do pool de extração
+            clean_workers: Tamanho do pool de limpeza
+            executor: 'process' ou 'thread'
+            queue_size: Capacidade das filas entre estágios
+            max_in_flight: Máximo de tarefas pendentes por pool
+                (padrão: o dobro do número de workers)
+            shard_size: Número de documentos por shard
+            output_format: 'jsonl' ou 'parquet'
+
+        Raises:
+            ConfigurationError: Se algum parâmetro for inválido
+        """
+        if executor not in ('process', 'thread'):
+            raise ConfigurationError("executor", executor, "Deve ser 'process' ou 'thread'")
+        if output_format not in ('jsonl', 'parquet'):
+            raise ConfigurationError("output_format", output_format, "Deve ser 'jsonl' ou 'parquet'")
+        if shard_size < 1:
+            raise ConfigurationError("shard_size", shard_size, "Deve ser maior que 0")
+
+        self.output_dir = Path(output_dir)
+        self.cleaner = cleaner
+        self.processor = processor or DocumentProcessor()
+        self.extract_workers = extract_workers
+        self.clean_workers = clean_workers
+        self.executor = executor
+        self.queue_size = queue_size
+        self.max_in_flight = max_in_flight
+        self.shard_size = shard_size
+        self.output_format = output_format
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.output_dir / self.CHECKPOINT_NAME
+
+    def load_checkpoint(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Lê o checkpoint de uma execução anterior.
+
+        Returns:
+            Dict[str, Tuple[int, float]]: Tamanho e data de modificação de cada
+            arquivo já concluído
+        """
+        done: Dict[str, Tuple[int, float]] = {}
+        if not self.checkpoint_path.exists():
+            return done
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # linha truncada por uma interrupção
+                done[entry['path']] = (entry['size'], entry['mtime'])
+        return done
+
+    def discover(self, root: Union[str, Path]) -> Iterator[Path]:
+        """
+        Percorre o diretório em ordem determinística.
+
+        Args:
+            root: Diretório raiz do corpus
+
+        Yields:
+            Path: Arquivos com extensão suportada pelo processador, incluindo
+            arquivos compactados e pacotes
+        """
+        extensions = self.processor.supported_extensions | self.processor.archive_extensions
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                path = Path(dirpath) / filename
+                if path.suffix in extensions:
+                    yield path
+
+    def run(self, root: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Processa todos os documentos do diretório.
+
+        Args:
+            root: Diretório raiz do corpus
+
+        Returns:
+            Dict[str, Any]: Relatório com contagens, erros, shards gravados e a
+            vazão de cada estágio
+
+        Raises:
+            ProcessingError: Se um pool falhar (ex.: ``BrokenProcessPool``); os
+                documentos já gravados continuam no checkpoint
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        done = self.load_checkpoint()
+        stats = {name: StageStats(name) for name in ('discovery', 'extraction', 'cleaning', 'writing')}
+        errors: List[Dict[str, str]] = []
+        skipped = [0]
+        failures: List[Tuple[str, BaseException]] = []
+
+        paths: queue.Queue = queue.Queue(self.queue_size)
+        extracted: queue.Queue = queue.Queue(self.queue_size)
+        cleaned: queue.Queue = queue.Queue(self.queue_size)
+
+        pool_class = (concurrent.futures.ProcessPoolExecutor if self.executor == 'process'
+                      else concurrent.futures.ThreadPoolExecutor)
+        started = time.perf_counter()
+
+        with pool_class(max_workers=self.extract_workers) as extract_pool, \
+                pool_class(max_workers=self.clean_workers) as clean_pool:
+
+            def on_extracted(item: _WorkItem, result) -> None:
+                item.text, item.metadata, busy = result
+                item.data = None
+                stats['extraction'].busy_seconds += busy
+
+            def on_cleaned(item: _WorkItem, result) -> None:
+                item.text, busy = result
+                stats['cleaning'].busy_seconds += busy
+
+            threads = [
+                threading.Thread(
+                    target=self._discovery_stage,
+                    args=(root, done, paths, stats['discovery'], errors, skipped),
+                    daemon=True,
+                ),
+                threading.Thread(
+                    target=self._pool_stage,
+                    args=(extract_pool, self.extract_workers, paths, extracted,
+                          stats['extraction'], errors, failures,
+                          lambda item: (_extract_document, self.processor,
+                                        item.path if item.data is None else item.data),
+                          on_extracted),
+                    daemon=True,
+                ),
+                threading.Thread(
+                    target=self._pool_stage,
+                    args=(clean_pool, self.clean_workers, extracted, cleaned,
+                          stats['cleaning'], errors, failures,
+                          lambda item: (_clean_document, self.cleaner, item.text),
+                          on_cleaned),
+                    daemon=True,
+                ),
+            ]
+            for thread in threads:
+                thread.start()
+
+            shards = self._writing_stage(cleaned, stats['writing'])
+
+            for thread in threads:
+                thread.join()
+
+        if failures:
+            name, error = failures[0]
+            raise ProcessingError(
+                'corpus_pipeline', str(root), f"estágio '{name}' interrompido: {type(error).__name__}: {error}"
+            ) from error
+
+        report = {
+            'processed': stats['writing'].items,
+            'skipped': skipped[0],
+            'errors': errors,
+            'shards': shards,
+            'elapsed_seconds': time.perf_counter() - started,
+            'stages': {name: stage.to_dict() for name, stage in stats.items()},
+        }
+        get_logger().info(
+            f"Pipeline concluído: {report['processed']} documentos processados",
+            operation='corpus_pipeline',
+            processed=report['processed'],
+            skipped=report['skipped'],
+            errors=len(errors),
+        )
+        return report
+
+    def _discovery_stage(self, root, done, outbox: queue.Queue, stats: StageStats,
+                         errors: List[Dict[str, str]], skipped: List[int]) -> None:
+        """Estágio 1: encontra arquivos pendentes (ignora os do checkpoint)."""
+        stats.started = time.perf_counter()
+        try:
+            for path in self.discover(root):
+                key = str(path)
+                try:
+                    stat = path.stat()
+                    if self.processor.is_archive(path):
+                        self._expand_archive(path, stat.st_mtime, done, outbox, stats, skipped)
+                        continue
+                except Exception as e:  # arquivo ilegível ou pacote corrompido
+                    stats.errors += 1
+                    errors.append({'path': key, 'stage': stats.name, 'error': f"{type(e).__name__}: {e}"})
+                    continue
+                if done.get(key) == (stat.st_size, stat.st_mtime):
+                    skipped[0] += 1
+                    continue
+                stats.items += 1
+                outbox.put(_WorkItem(key, stat.st_size, stat.st_mtime))
+        finally:
+            stats.finished = time.perf_counter()
+            outbox.put(_DONE)
+
+    def _expand_archive(self, path: Path, mtime: float, done, outbox: queue.Queue,
+                        stats: StageStats, skipped: List[int]) -> None:
+        """Descompacta os membros de um pacote, um por vez, em itens de trabalho."""
+        for member in self.processor.iter_archive(path):
+            key = f"{path}!{member.name}"
+            size = member.size
+            if done.get(key) == (size, mtime):
+                skipped[0] += 1
+                continue
+            stats.items += 1
+            outbox.put(_WorkItem(key, size, mtime, data=member.read_bytes()))
+
+    def _pool_stage(self, pool, workers: int, inbox: queue.Queue, outbox: queue.Queue,
+                    stats: StageStats, errors: List[Dict[str, str]],
+                    failures: List[Tuple[str, BaseException]],
+                    make_task: Callable, on_result: Callable) -> None:
+        """
+        Estágio genérico que envia itens a um pool mantendo a ordem de chegada.
+
+        No máximo ``max_in_flight`` tarefas ficam pendentes; quando o limite é
+        atingido o estágio espera a mais antiga terminar antes de aceitar outra.
+        Se o próprio pool falhar (ex.: ``BrokenProcessPool`` depois de um worker
+        ser encerrado), a falha vai para ``failures`` e o estágio continua
+        consumindo ``inbox`` até o fim, para que o estágio anterior não fique
+        bloqueado na fila cheia.
+        """
+        limit = self.max_in_flight or 2 * workers
+        pending: deque = deque()
+        item = None
+
+        def complete_oldest() -> None:
+            item, future = pending.popleft()
+            try:
+                on_result(item, future.result())
+            except concurrent.futures.BrokenExecutor:
+                raise  # falha do pool, não do documento
+            except Exception as e:
+                stats.errors += 1
+                errors.append({'path': item.path, 'stage': stats.name, 'error': f"{type(e).__name__}: {e}"})
+                return
+            stats.items += 1
+            outbox.put(item)
+
+        try:
+            while True:
+                item = inbox.get()
+                if item is _DONE:
+                    break
+                if stats.started is None:
+                    stats.started = time.perf_counter()
+                func, *args = make_task(item)
+                pending.append((item, pool.submit(func, *args)))
+                if len(pending) >= limit:
+                    complete_oldest()
+            while pending:
+                complete_oldest()
+        except Exception as e:
+            failures.append((stats.name, e))
+            while item is not _DONE:
+                item = inbox.get()
+        finally:
+            stats.finished = time.perf_counter()
+            outbox.put(_DONE)
+
+    def _writing_stage(self, inbox: queue.Queue, stats: StageStats) -> List[str]:
+        """Estágio 4: grava os shards e registra cada documento no checkpoint."""
+        writer_class = _ParquetShardWriter if self.output_format == 'parquet' else _JsonlShardWriter
+        writer = writer_class(self.output_dir, self._next_shard_index(), self.shard_size)
+
+        with open(self.checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+            def commit(records: List[Dict[str, Any]]) -> None:
+                for record in records:
+                    checkpoint.write(json.dumps({
+                        'path': record['path'],
+                        'size': record['size'],
+                        'mtime': record['mtime'],
+                    }) + '\n')
+                checkpoint.flush()
+
+            try:
+                while True:
+                    item = inbox.get()
+                    if item is _DONE:
+                        break
+                    if stats.started is None:
+                        stats.started = time.perf_counter()
+                    write_started = time.perf_counter()
+                    commit(writer.write({
+                        'path': item.path,
+                        'size': item.size,
+                        'mtime': item.mtime,
+                        'text': item.text,
+                        'metadata': item.metadata,
+                    }))
+                    stats.busy_seconds += time.perf_counter() - write_started
+                    stats.items += 1
+            finally:
+                commit(writer.close())
+                stats.finished = time.perf_counter()
+
+        return writer.shards
+
+    def _next_shard_index(self) -> int:
+        """Índice do primeiro shard livre (shards de execuções anteriores são mantidos)."""
+        indexes = [
+            int(path.stem.split('-')[1])
+            for path in self.output_dir.glob('part-*')
+            if path.stem.split('-')[1].isdigit()
+        ]
+        return max(indexes, default=-1) + 1
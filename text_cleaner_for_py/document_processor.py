@@ -1,21 +1,586 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator, Union, BinaryIO, AsyncIterator
+import asyncio
+import bz2
+import codecs
+import concurrent.futures
+import gzip
+import io
+import lzma
+import mmap
 import os
-from pathlib import Path
+import tarfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path, PurePosixPath
 import PyPDF2
 from docx import Document
+from docx.oxml.ns import qn
 import re
+import xml.etree.ElementTree as ET
+import zipfile
+
+from .exceptions import ConfigurationError
+from .extraction_cache import ExtractionCache, MISSING
+from .metrics import REGISTRY, CACHE_REQUESTS, DOCUMENT_OPERATIONS, DOCUMENT_SECONDS
+from .image_extraction import ImageRecord, ImageStore, iter_docx_images, iter_pdf_images
+
+DOCX_BACKENDS = ('stream', 'python-docx')
+
+# Tags do WordprocessingML usadas pelo leitor em streaming
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W_NS + 'body'
+_W_P = _W_NS + 'p'
+_W_T = _W_NS + 't'
+_W_TAB = _W_NS + 'tab'
+_W_BR = _W_NS + 'br'
+_W_CR = _W_NS + 'cr'
+_W_HYPHEN = _W_NS + 'noBreakHyphen'
+_W_TC = _W_NS + 'tc'
+_W_TBL = _W_NS + 'tbl'
+_W_TYPE = _W_NS + 'type'
+
+# Marcas de ordem de bytes (UTF-32 antes de UTF-16: FF FE 00 00 começa com FF FE)
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Quantidade mínima de bytes lida por vez de arquivos de texto (e usada na detecção)
+_TEXT_CHUNK_BYTES = 64 * 1024
+
+# Arquivos com um único documento compactado ('relatorio.pdf.gz')
+_DECOMPRESSORS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+# Pacotes com vários documentos, lidos membro a membro
+_TAR_SUFFIXES = ('.tar', '.tgz', '.tbz2', '.txz')
+_ARCHIVE_FORMATS = ('.zip', '.tar')
+
+# Caminho no disco ou conteúdo do documento em memória
+DocumentSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+
+@dataclass
+class DocumentBlock:
+    """
+    Trecho de um documento produzido por ``DocumentProcessor.iter_document``.
+
+    Attributes:
+        text: Texto do trecho
+        index: Posição do trecho no documento (a partir de 0)
+        page: Número da página (a partir de 1) quando o formato permite
+            identificá-la; em DOCX corresponde às quebras de página explícitas
+        kind: Tipo do trecho ('page', 'paragraph', 'cell' ou 'block')
+        source: Nome do membro de origem quando o documento é um pacote
+            (.zip/.tar)
+    """
+    text: str
+    index: int
+    page: Optional[int] = None
+    kind: str = 'block'
+    source: Optional[str] = None
+
+
+# Leitor de PDF reaproveitado entre as tarefas de um mesmo processo trabalhador
+_worker_pdf_readers: Dict[str, PyPDF2.PdfReader] = {}
+
+
+def _extract_pdf_pages(file_path: str, start: int, stop: int) -> List[str]:
+    """Extrai o texto das páginas [start, stop) com o leitor próprio do processo."""
+    pdf_reader = _worker_pdf_readers.get(file_path)
+    if pdf_reader is None:
+        _worker_pdf_readers.clear()
+        pdf_reader = _worker_pdf_readers[file_path] = PyPDF2.PdfReader(file_path)
+    return [pdf_reader.pages[number].extract_text() for number in range(start, stop)]
+
+
+class _Source:
+    """
+    Documento de entrada: arquivo no disco ou conteúdo em memória.
+
+    ``origin`` é o arquivo no disco de onde o conteúdo vem (o próprio
+    documento ou o arquivo compactado que o contém); ``owned`` indica que o
+    fluxo foi aberto pelo processador e deve ser fechado por ele.
+    """
+
+    def __init__(self, fmt: str, path: Optional[Path] = None,
+                 stream: Optional[BinaryIO] = None, name: Optional[str] = None,
+                 size: Optional[int] = None, origin: Optional[Path] = None,
+                 owned: bool = False) -> None:
+        self.format = fmt
+        self.path = path
+        self.stream = stream
+        self.name = path.name if path is not None else name
+        self.origin = path if path is not None else origin
+        self.owned = owned
+        self._size = size
+
+    def file(self) -> Union[Path, BinaryIO]:
+        """Caminho ou fluxo posicionado no início (aceitos por PyPDF2, python-docx e zipfile)."""
+        if self.path is not None:
+            return self.path
+        if _is_seekable(self.stream):
+            self.stream.seek(0)
+        return self.stream
+
+    def size(self) -> Optional[int]:
+        """Tamanho do documento em bytes (do arquivo compactado, quando for o caso)."""
+        if self.path is not None:
+            return os.path.getsize(self.path)
+        if self._size is not None:
+            return self._size
+        if self.origin is not None:
+            return os.path.getsize(self.origin)
+        if _is_seekable(self.stream):
+            return self.stream.seek(0, io.SEEK_END)
+        return None
+
+    def close(self) -> None:
+        if self.owned and self.stream is not None:
+            self.stream.close()
+
+
+def _is_seekable(stream: BinaryIO) -> bool:
+    try:
+        return stream.seekable()
+    except AttributeError:  # membros de tar lidos em modo streaming
+        return False
+
+
+def _archive_kind(path: Path) -> Optional[str]:
+    """Classifica o caminho como pacote ('.zip'/'.tar'), compactado ou documento (None)."""
+    suffixes = path.suffixes
+    if path.suffix == '.zip':
+        return '.zip'
+    if path.suffix in _TAR_SUFFIXES or (len(suffixes) > 1 and suffixes[-2] == '.tar'
+                                        and path.suffix in _DECOMPRESSORS):
+        return '.tar'
+    if path.suffix in _DECOMPRESSORS:
+        return 'compressed'
+    return None
+
+
+def _as_stream(data: Union[bytes, bytearray, memoryview, BinaryIO]) -> BinaryIO:
+    """Expõe o conteúdo em memória como fluxo binário posicionável."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return io.BytesIO(data)
+    seekable = getattr(data, 'seekable', None)
+    if seekable is not None and seekable() and data.tell() == 0:
+        return data
+    # Fluxos não posicionáveis (sockets, pipes) ou já parcialmente lidos
+    return io.BytesIO(data.read())
+
+
+def _detect_format(stream: BinaryIO, encoding: Optional[str] = None) -> str:
+    """
+    Identifica o formato pelos bytes iniciais ('.pdf', '.docx' ou '.txt').
+
+    O PDF precisa começar por ``%PDF-`` (admitindo BOM e espaços antes). O
+    restante só é tratado como texto se os bytes iniciais decodificarem na
+    codificação informada (ou detectada) sem bytes nulos fora de UTF-16/32.
+
+    Raises:
+        ValueError: Se o conteúdo não for PDF, DOCX nem texto
+    """
+    stream.seek(0)
+    head = stream.read(1024)
+    stream.seek(0)
+    if head.startswith(codecs.BOM_UTF8):
+        start = head[len(codecs.BOM_UTF8):]
+    else:
+        start = head
+    if start.lstrip(b' \t\r\n\f').startswith(b'%PDF-'):
+        return '.pdf'
+    if head.startswith(b'PK\x03\x04'):
+        try:
+            with zipfile.ZipFile(stream) as archive:
+                names = set(archive.namelist())
+        except zipfile.BadZipFile:
+            names = set()
+        stream.seek(0)
+        if 'word/document.xml' in names:
+            return '.docx'
+        raise ValueError("Formato não suportado: arquivo zip sem word/document.xml")
+    encoding = encoding or detect_encoding(head)
+    if b'\x00' in head and not codecs.lookup(encoding).name.startswith(('utf-16', 'utf-32')):
+        raise ValueError("Formato não suportado: conteúdo binário")
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+    except UnicodeDecodeError:
+        raise ValueError("Formato não suportado: conteúdo binário")
+    return '.txt'
+
+
+def _member_source(name: str, stream: BinaryIO, size: Optional[int] = None,
+                   origin: Optional[Path] = None, owned: bool = False) -> Optional[_Source]:
+    """
+    Prepara um membro de pacote (ou o conteúdo de um arquivo compactado).
+
+    O formato vem da extensão interna ou, sem extensão, dos bytes iniciais.
+    PDF e DOCX precisam de acesso aleatório e são descompactados em memória;
+    texto é decodificado direto do fluxo descompactado. Membros com
+    extensão não suportada retornam None.
+    """
+    fmt = PurePosixPath(name).suffix
+    if fmt == '.txt':
+        return _Source(fmt, stream=stream, name=name, size=size, origin=origin, owned=owned)
+    if fmt and fmt not in ('.pdf', '.docx'):
+        return None
+
+    data = io.BytesIO(stream.read())
+    if owned:
+        stream.close()
+    if not fmt:
+        try:
+            fmt = _detect_format(data)
+        except ValueError:
+            return None
+    return _Source(fmt, stream=data, name=name, size=size, origin=origin)
+
+
+# D:AAAAMMDDHHmmSS seguido do fuso (Z, +HH'mm' ou -HH'mm'); só o ano é obrigatório
+_PDF_DATE_PATTERN = re.compile(
+    r"D:(\d{4})(\d{2})?(\d{2})?(\d{2})?(\d{2})?(\d{2})?(?:([Zz])|([+-])(\d{2})'?(\d{2})?'?)?"
+)
+
+
+def _parse_pdf_date(value: Any) -> str:
+    """Converte uma data do dicionário de informações do PDF para ISO 8601."""
+    if not value:
+        return ''
+    match = _PDF_DATE_PATTERN.match(str(value))
+    if not match:
+        return str(value)
+    year, month, day, hour, minute, second, utc, sign, tz_hours, tz_minutes = match.groups()
+    try:
+        tzinfo = None
+        if utc:
+            tzinfo = timezone.utc
+        elif sign:
+            offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes or 0))
+            tzinfo = timezone(offset if sign == '+' else -offset)
+        parsed = datetime(int(year), int(month or 1), int(day or 1), int(hour or 0),
+                          int(minute or 0), int(second or 0), tzinfo=tzinfo)
+    except ValueError:
+        return str(value)
+    return parsed.isoformat()
+
+
+def _pdf_page_count(pdf_reader: PyPDF2.PdfReader) -> int:
+    """
+    Número de páginas lido do nó raiz da árvore de páginas (``/Root /Pages /Count``).
+
+    ``len(pdf_reader.pages)`` percorre e carrega a árvore inteira; a contagem
+    do nó raiz só é descartada se estiver ausente ou inválida.
+    """
+    try:
+        count = pdf_reader.trailer['/Root']['/Pages']['/Count']
+        if isinstance(count, int) and count >= 0:
+            return int(count)
+    except (KeyError, TypeError, AttributeError, PyPDF2.errors.PdfReadError):
+        pass
+    return len(pdf_reader.pages)
+
+
+def _pdf_metadata(pdf_reader: PyPDF2.PdfReader) -> Dict[str, Any]:
+    """
+    Metadados de um PDF lidos apenas do trailer, da xref e do dicionário de informações.
+
+    Nenhuma página é carregada e nenhum fluxo de conteúdo é decodificado.
+    """
+    try:
+        info = pdf_reader.metadata or {}
+    except PyPDF2.errors.PdfReadError:
+        info = {}  # dicionário de informações ilegível (ex: PDF criptografado)
+    return {
+        'pages': _pdf_page_count(pdf_reader),
+        'author': info.get('/Author', ''),
+        'title': info.get('/Title', ''),
+        'subject': info.get('/Subject', ''),
+        'creator': info.get('/Creator', ''),
+        'producer': info.get('/Producer', ''),
+        'creation_date': _parse_pdf_date(info.get('/CreationDate')),
+        'modification_date': _parse_pdf_date(info.get('/ModDate')),
+    }
+
+
+def detect_encoding(sample: bytes, fallback: str = 'cp1252') -> str:
+    """
+    Detecta a codificação de um texto a partir dos seus bytes iniciais.
+
+    Args:
+        sample: Primeiros bytes do arquivo
+        fallback: Codificação usada quando a amostra não é UTF-8 válido
+
+    Returns:
+        str: Codificação indicada pelo BOM, 'utf-8' ou ``fallback``
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        # final=False tolera um caractere multibyte cortado no fim da amostra
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return fallback
+
+
+class DocumentResult:
+    """
+    Resultado de ``DocumentProcessor.process`` (ou de cada membro em
+    ``DocumentProcessor.iter_archive``).
+
+    O arquivo é aberto no máximo uma vez (``PdfReader`` ou ``Document``), no
+    primeiro acesso a uma parte que precise dele. Texto, metadados e tabelas
+    são calculados sob demanda a partir desse mesmo objeto e memorizados;
+    com um cache de extração configurado, cada parte é consultada no cache
+    antes de o arquivo ser aberto.
+    """
+
+    def __init__(self, processor: 'DocumentProcessor', source: _Source) -> None:
+        self.source = source
+        self.path = source.path
+        self.name = source.name
+        self.format = source.format
+        self._processor = processor
+        self._file = None
+        self._handle: Any = None
+        self._opened = False
+        self._parts: Dict[str, Any] = {}
+        cache = processor.cache
+        # A chave é calculada antes da extração: se o arquivo mudar durante a
+        # leitura, o resultado fica associado à versão antiga e não é reutilizado.
+        # Conteúdo em memória é identificado pelo hash dos bytes; membros lidos
+        # direto de um pacote em streaming não são cacheados
+        if cache is None:
+            self._cache_key = None
+        elif source.origin is not None:
+            self._cache_key = cache.key_for(source.origin)
+        elif source.stream is not None and _is_seekable(source.stream):
+            self._cache_key = cache.key_for_stream(source.stream)
+        else:
+            self._cache_key = None
+
+    def __enter__(self) -> 'DocumentResult':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Libera o arquivo aberto (as partes já calculadas continuam disponíveis)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._handle = None
+        self.source.close()
+
+    @property
+    def size(self) -> Optional[int]:
+        """Tamanho do documento em bytes, quando conhecido."""
+        return self.source.size()
+
+    def read_bytes(self) -> bytes:
+        """
+        Conteúdo bruto do documento.
+
+        Para membros lidos de pacotes em streaming, deve ser chamado antes de
+        acessar o texto (o fluxo só pode ser lido uma vez).
+        """
+        if self.path is not None:
+            return self.path.read_bytes()
+        return self.source.file().read()
+
+    @property
+    def handle(self) -> Any:
+        """Objeto do documento já interpretado (``PdfReader``, ``Document`` ou None)."""
+        if not self._opened:
+            self._opened = True
+            if self.format == '.pdf':
+                if self.path is not None:
+                    self._file = open(self.path, 'rb')
+                self._handle = PyPDF2.PdfReader(self._file or self.source.file())
+            elif self.format == '.docx':
+                self._handle = Document(self.source.file())
+        return self._handle
+
+    def _get(self, part: str, compute: Callable[[], Any]) -> Any:
+        if part not in self._parts:
+            cache = self._processor.cache
+            if self._cache_key is None:
+                cache = None
+            value = MISSING if cache is None else cache.get(self._cache_key, part)
+            hit = value is not MISSING
+            if not hit:
+                value = self._compute(part, compute) if REGISTRY.enabled else compute()
+                if cache is not None:
+                    cache.put(self._cache_key, part, value)
+            if cache is not None and REGISTRY.enabled:
+                CACHE_REQUESTS.labels('extraction', 'hit' if hit else 'miss').inc()
+            self._parts[part] = value
+        return self._parts[part]
+
+    def _compute(self, part: str, compute: Callable[[], Any]) -> Any:
+        """Extrai uma parte registrando duração e resultado por formato."""
+        operation = part.split(':', 1)[0]
+        started = time.perf_counter()
+        try:
+            value = compute()
+        except Exception:
+            DOCUMENT_OPERATIONS.labels(self.format, operation, 'error').inc()
+            raise
+        DOCUMENT_SECONDS.labels(self.format, operation).observe(time.perf_counter() - started)
+        DOCUMENT_OPERATIONS.labels(self.format, operation, 'ok').inc()
+        return value
+
+    @property
+    def text(self) -> str:
+        """Texto completo do documento."""
+        processor = self._processor
+        if self.format == '.docx' and processor.docx_backend == 'stream':
+            # O leitor em streaming não usa o ``Document``; o texto difere do
+            # python-docx (inclui as células de tabelas) e tem entrada própria no cache
+            return self._get('text:stream', lambda: processor._read_docx(self.source))
+        return self._get('text', lambda: processor._extract_text(self.source, self.handle))
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Metadados do documento."""
+        return self._get('metadata', lambda: self._processor._extract_metadata(self.source, self.handle))
+
+    @property
+    def tables(self) -> List[List[List[str]]]:
+        """Tabelas do documento (apenas DOCX)."""
+        if self.format != '.docx':
+            return []
+        return self._get('tables', lambda: self._processor._extract_tables(self.handle))
+
 
 class DocumentProcessor:
-    def __init__(self):
-        """Inicializa o processador de documentos."""
+    def __init__(self, block_size: int = 64 * 1024, pdf_workers: int = 1,
+                 parallel_min_pages: int = 64, pages_per_task: Optional[int] = None,
+                 cache: Optional[ExtractionCache] = None, docx_backend: str = 'stream',
+                 text_encoding: Optional[str] = None, text_errors: str = 'strict',
+                 async_executor: Optional[concurrent.futures.Executor] = None,
+                 max_concurrency: int = 8):
+        """
+        Inicializa o processador de documentos.
+
+        Args:
+            block_size (int): Tamanho aproximado, em caracteres, dos blocos
+                produzidos ao ler arquivos de texto em modo streaming
+            pdf_workers (int): Número de processos usados para extrair o texto
+                de PDFs grandes. ``1`` mantém a extração sequencial
+            parallel_min_pages (int): Número mínimo de páginas para que um PDF
+                seja extraído em paralelo
+            pages_per_task (Optional[int]): Páginas enviadas a cada processo por
+                tarefa. Por padrão divide o documento em ~4 tarefas por processo
+            cache (Optional[ExtractionCache]): Cache em disco de texto, tabelas e
+                metadados; arquivos inalterados não são reabertos
+            docx_backend (str): Leitor do texto de DOCX. ``'stream'`` percorre o
+                ``word/document.xml`` de forma incremental, com memória constante,
+                e inclui o texto das células de tabelas; ``'python-docx'`` carrega
+                o documento completo (apenas parágrafos do corpo)
+            text_encoding (Optional[str]): Codificação dos arquivos de texto.
+                ``None`` detecta pelo BOM, usando UTF-8 ou cp1252 na ausência dele
+            text_errors (str): Tratamento de bytes inválidos na decodificação
+                ('strict', 'replace', 'ignore', ...)
+            async_executor (Optional[concurrent.futures.Executor]): Executor
+                usado pelos métodos assíncronos (padrão: o executor do loop)
+            max_concurrency (int): Máximo de documentos processados ao mesmo
+                tempo pelos métodos assíncronos desta instância
+
+        Raises:
+            ConfigurationError: Se ``docx_backend``, ``text_encoding``,
+                ``text_errors`` ou ``max_concurrency`` forem inválidos
+        """
+        if docx_backend not in DOCX_BACKENDS:
+            raise ConfigurationError(
+                "docx_backend", docx_backend, f"Deve ser um de: {', '.join(DOCX_BACKENDS)}"
+            )
+        try:
+            if text_encoding is not None:
+                codecs.lookup(text_encoding)
+        except LookupError:
+            raise ConfigurationError("text_encoding", text_encoding, "Codificação desconhecida")
+        try:
+            codecs.lookup_error(text_errors)
+        except LookupError:
+            raise ConfigurationError("text_errors", text_errors, "Tratamento de erros desconhecido")
+        if max_concurrency < 1:
+            raise ConfigurationError("max_concurrency", max_concurrency, "Deve ser maior que 0")
         self.supported_extensions = {'.pdf', '.docx', '.txt'}
-        
-    def read_document(self, file_path: str) -> str:
+        self.archive_extensions = {'.zip', *_TAR_SUFFIXES, *_DECOMPRESSORS}
+        self.block_size = block_size
+        self.pdf_workers = pdf_workers
+        self.parallel_min_pages = parallel_min_pages
+        self.pages_per_task = pages_per_task
+        self.cache = cache
+        self.docx_backend = docx_backend
+        self.text_encoding = text_encoding
+        self.text_errors = text_errors
+        self.async_executor = async_executor
+        self.max_concurrency = max_concurrency
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_semaphore: Optional[asyncio.Semaphore] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Executores e primitivas do asyncio não são serializáveis; o
+        # processador é enviado a processos trabalhadores sem eles
+        state = self.__dict__.copy()
+        state['async_executor'] = None
+        state['_async_loop'] = None
+        state['_async_semaphore'] = None
+        return state
+
+    def _resolve_source(self, file_path: DocumentSource, check: bool = True) -> _Source:
+        """
+        Normaliza a entrada em um ``_Source``.
+
+        Caminhos têm o formato definido pela extensão (e, com ``check``, são
+        validados); conteúdo em memória tem o formato detectado pelos bytes
+        iniciais e é lido direto da memória, sem arquivos temporários.
+        Arquivos abertos são lidos a partir da posição atual. Arquivos
+        compactados (.gz/.bz2/.xz) são descompactados em streaming e pacotes
+        (.zip/.tar) ficam com o formato '.zip'/'.tar'.
+        """
+        if isinstance(file_path, (str, os.PathLike)):
+            path = Path(file_path)
+            if check:
+                if not path.exists():
+                    raise FileNotFoundError(f"Arquivo não encontrado: {path}")
+                if (path.suffix not in self.supported_extensions
+                        and path.suffix not in self.archive_extensions):
+                    raise ValueError(f"Formato não suportado: {path.suffix}")
+            kind = _archive_kind(path)
+            if kind == 'compressed':
+                stream = _DECOMPRESSORS[path.suffix](path, 'rb')
+                source = _member_source(path.stem, stream, origin=path, owned=True)
+                if source is None:
+                    stream.close()
+                    raise ValueError(f"Formato não suportado: {Path(path.stem).suffix}")
+                return source
+            if kind is not None:
+                return _Source(kind, path=path)
+            return _Source(path.suffix, path=path)
+
+        name = getattr(file_path, 'name', None)
+        stream = _as_stream(file_path)
+        return _Source(_detect_format(stream, self.text_encoding), stream=stream,
+                       name=Path(name).name if isinstance(name, str) else None)
+
+    def read_document(self, file_path: DocumentSource) -> str:
         """
         Lê o conteúdo de um documento.
         
         Args:
-            file_path (str): Caminho do arquivo
+            file_path (DocumentSource): Caminho do arquivo ou conteúdo do
+                documento (``bytes``, ``memoryview`` ou arquivo binário aberto)
             
         Returns:
             str: Conteúdo do documento
@@ -24,70 +589,386 @@ class DocumentProcessor:
             ValueError: Se o formato do arquivo não for suportado
             FileNotFoundError: Se o arquivo não existir
         """
-        file_path = Path(file_path)
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
-            
-        if file_path.suffix not in self.supported_extensions:
-            raise ValueError(f"Formato não suportado: {file_path.suffix}")
-            
-        if file_path.suffix == '.pdf':
-            return self._read_pdf(file_path)
-        elif file_path.suffix == '.docx':
-            return self._read_docx(file_path)
+        with self.process(file_path) as result:
+            return result.text
+
+    def process(self, file_path: DocumentSource) -> DocumentResult:
+        """
+        Abre um documento uma única vez para extrair texto, metadados e tabelas.
+
+        Cada parte é calculada apenas quando acessada, reaproveitando o mesmo
+        objeto interpretado (``PdfReader``/``Document``). Use como gerenciador
+        de contexto para liberar o arquivo ao final.
+
+        Args:
+            file_path (DocumentSource): Caminho do arquivo ou conteúdo do
+                documento (``bytes``, ``memoryview`` ou arquivo binário aberto)
+
+        Returns:
+            DocumentResult: Resultado com ``text``, ``metadata`` e ``tables``
+
+        Raises:
+            ValueError: Se o formato do arquivo não for suportado
+            FileNotFoundError: Se o arquivo não existir
+
+        Examples:
+            >>> with processor.process('contrato.docx') as doc:
+            ...     texto, tabelas = doc.text, doc.tables
+        """
+        return DocumentResult(self, self._resolve_source(file_path))
+
+    def is_archive(self, file_path: Union[str, os.PathLike]) -> bool:
+        """
+        Indica se o caminho é um pacote com vários documentos (.zip ou .tar[.gz|.bz2|.xz]).
+
+        Args:
+            file_path: Caminho do arquivo
+
+        Returns:
+            bool: True para pacotes lidos com ``iter_archive``
+        """
+        return _archive_kind(Path(file_path)) in _ARCHIVE_FORMATS
+
+    def iter_archive(self, file_path: Union[str, os.PathLike]) -> Iterator[DocumentResult]:
+        """
+        Percorre os documentos de um pacote .zip ou .tar sem extraí-lo para o disco.
+
+        Os membros são descompactados em streaming, na ordem do pacote, e
+        cada um é entregue como ``DocumentResult`` (com ``name`` igual ao
+        caminho do membro). Cada resultado só é válido até o próximo ser
+        produzido. Membros com extensão não suportada são ignorados; membros
+        sem extensão têm o formato detectado pelos bytes iniciais.
+
+        Args:
+            file_path: Caminho do pacote
+
+        Yields:
+            DocumentResult: Um resultado por documento suportado
+
+        Raises:
+            ValueError: Se o arquivo não for um pacote
+            FileNotFoundError: Se o arquivo não existir
+
+        Examples:
+            >>> for doc in processor.iter_archive('corpus.tar.gz'):
+            ...     print(doc.name, len(doc.text))
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {path}")
+        if not self.is_archive(path):
+            raise ValueError(f"Não é um pacote .zip/.tar: {path}")
+        for member in self._iter_members(path):
+            with DocumentResult(self, member) as result:
+                yield result
+
+    def _iter_members(self, path: Path) -> Iterator[_Source]:
+        """Produz os membros suportados de um pacote, descompactando em streaming."""
+        if _archive_kind(path) == '.zip':
+            with zipfile.ZipFile(path) as archive:
+                for info in archive.infolist():
+                    if info.is_dir():
+                        continue
+                    with archive.open(info) as stream:
+                        member = _member_source(info.filename, stream, size=info.file_size)
+                        if member is not None:
+                            yield member
+        else:
+            # Modo 'r|*': leitura sequencial, sem voltar no fluxo descompactado
+            with tarfile.open(path, 'r|*') as archive:
+                for info in archive:
+                    if not info.isfile():
+                        continue
+                    stream = archive.extractfile(info)
+                    member = _member_source(info.name, stream, size=info.size)
+                    if member is not None:
+                        yield member
+
+    def _extract_text(self, source: _Source, handle: Any = None) -> str:
+        """Extrai o texto completo conforme o formato do arquivo."""
+        if source.format in _ARCHIVE_FORMATS:
+            return '\n'.join(self._extract_text(member) for member in self._iter_members(source.path))
+        if source.format == '.pdf':
+            return self._read_pdf(source, handle)
+        elif source.format == '.docx':
+            return self._read_docx(source, handle)
         else:  # .txt
-            return self._read_txt(file_path)
-            
-    def _read_pdf(self, file_path: Path) -> str:
+            return self._read_txt(source)
+
+    def iter_document(self, file_path: DocumentSource,
+                      cleaner: Optional[Callable[[str], str]] = None) -> Iterator[DocumentBlock]:
+        """
+        Lê um documento em modo streaming, trecho a trecho.
+
+        PDFs são produzidos página a página, DOCX parágrafo a parágrafo e
+        arquivos de texto em blocos de linhas de até ``block_size`` caracteres.
+        Pacotes .zip/.tar produzem os trechos de cada membro em sequência
+        (com ``source`` indicando o membro), descompactando sob demanda.
+        Cada trecho é entregue assim que é extraído, de modo que a limpeza
+        pode começar antes de o documento inteiro ser lido.
+
+        Args:
+            file_path (DocumentSource): Caminho do arquivo ou conteúdo do
+                documento (``bytes``, ``memoryview`` ou arquivo binário aberto)
+            cleaner (Optional[Callable[[str], str]]): Função aplicada ao texto de
+                cada trecho (ex: ``clean_text``)
+
+        Yields:
+            DocumentBlock: Trechos do documento, na ordem de leitura
+
+        Raises:
+            ValueError: Se o formato do arquivo não for suportado
+            FileNotFoundError: Se o arquivo não existir
+        """
+        source = self._resolve_source(file_path)
+        try:
+            for block in self._iter_blocks(source):
+                if cleaner is not None:
+                    block.text = cleaner(block.text)
+                yield block
+        finally:
+            source.close()
+
+    def _iter_blocks(self, source: _Source) -> Iterator[DocumentBlock]:
+        """Despacha a leitura em streaming conforme o formato."""
+        if source.format in _ARCHIVE_FORMATS:
+            index = 0
+            for member in self._iter_members(source.path):
+                for block in self._iter_blocks(member):
+                    block.index = index
+                    block.source = member.name
+                    index += 1
+                    yield block
+        elif source.format == '.pdf':
+            yield from self._iter_pdf(source)
+        elif source.format == '.docx':
+            yield from self._iter_docx(source)
+        else:  # .txt
+            yield from self._iter_txt(source)
+
+    def _iter_pdf(self, source: _Source,
+                  pdf_reader: Optional[PyPDF2.PdfReader] = None) -> Iterator[DocumentBlock]:
+        """Extrai o texto de um PDF página a página."""
+        if pdf_reader is None:
+            if source.path is None:
+                pdf_reader = PyPDF2.PdfReader(source.file())
+            else:
+                with open(source.path, 'rb') as file:
+                    yield from self._iter_pdf(source, PyPDF2.PdfReader(file))
+                return
+
+        page_count = len(pdf_reader.pages)
+        # Conteúdo em memória é extraído no próprio processo
+        if (self.pdf_workers <= 1 or page_count < self.parallel_min_pages
+                or source.path is None):
+            for number, page in enumerate(pdf_reader.pages, 1):
+                yield DocumentBlock(page.extract_text(), number - 1, page=number, kind='page')
+            return
+
+        yield from self._iter_pdf_parallel(source.path, page_count)
+
+    def _iter_pdf_parallel(self, file_path: Path, page_count: int) -> Iterator[DocumentBlock]:
+        """
+        Extrai o texto de um PDF distribuindo intervalos de páginas entre processos.
+
+        Cada processo abre o seu próprio leitor sobre o mesmo arquivo; os
+        intervalos são devolvidos na ordem original do documento.
+        """
+        pages_per_task = self.pages_per_task or max(1, -(-page_count // (self.pdf_workers * 4)))
+        starts = range(0, page_count, pages_per_task)
+        stops = [min(start + pages_per_task, page_count) for start in starts]
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.pdf_workers) as executor:
+            texts = executor.map(_extract_pdf_pages, [str(file_path)] * len(stops), starts, stops)
+            number = 0
+            for chunk in texts:
+                for text in chunk:
+                    number += 1
+                    yield DocumentBlock(text, number - 1, page=number, kind='page')
+
+    def _iter_docx(self, source: _Source, doc: Any = None) -> Iterator[DocumentBlock]:
+        """Extrai os parágrafos de um DOCX, contando as quebras de página explícitas."""
+        if doc is None:
+            if self.docx_backend == 'stream':
+                yield from self._iter_docx_stream(source.file())
+                return
+            doc = Document(source.file())
+        page = 1
+        for index, paragraph in enumerate(doc.paragraphs):
+            yield DocumentBlock(paragraph.text, index, page=page, kind='paragraph')
+            for br in paragraph._p.iter(qn('w:br')):
+                if br.get(qn('w:type')) == 'page':
+                    page += 1
+
+    def _iter_docx_stream(self, file: Union[Path, BinaryIO]) -> Iterator[DocumentBlock]:
+        """
+        Extrai parágrafos e células de tabela de um DOCX sem montar o documento.
+
+        O ``word/document.xml`` é lido direto do zip por um parser incremental
+        e cada elemento do corpo é descartado assim que o seu texto é
+        produzido. Células viram um único trecho ``'cell'`` com os parágrafos
+        unidos por quebra de linha, como ``cell.text`` no python-docx.
+        """
+        index = 0
+        page = 1
+        start_page = 1
+        body = None
+        paragraphs: List[List[str]] = []  # parágrafos abertos (caixas de texto aninham)
+        cells: List[List[str]] = []       # células abertas (tabelas aninham)
+        open_tables = 0
+
+        with zipfile.ZipFile(file) as archive, archive.open('word/document.xml') as xml:
+            for event, element in ET.iterparse(xml, events=('start', 'end')):
+                tag = element.tag
+                if event == 'start':
+                    if tag == _W_P:
+                        if not paragraphs:
+                            start_page = page
+                        paragraphs.append([])
+                    elif tag == _W_TC:
+                        cells.append([])
+                    elif tag == _W_TBL:
+                        open_tables += 1
+                    elif tag == _W_BODY:
+                        body = element
+                    continue
+
+                if tag == _W_T:
+                    if paragraphs:
+                        paragraphs[-1].append(element.text or '')
+                elif tag == _W_TAB:
+                    if paragraphs:
+                        paragraphs[-1].append('\t')
+                elif tag == _W_BR:
+                    br_type = element.get(_W_TYPE)
+                    if br_type == 'page':
+                        page += 1
+                    elif paragraphs and br_type in (None, 'textWrapping'):
+                        paragraphs[-1].append('\n')
+                elif tag == _W_CR:
+                    if paragraphs:
+                        paragraphs[-1].append('\n')
+                elif tag == _W_HYPHEN:
+                    if paragraphs:
+                        paragraphs[-1].append('-')
+                elif tag == _W_P:
+                    text = ''.join(paragraphs.pop())
+                    if cells:
+                        cells[-1].append(text)
+                    elif not paragraphs:
+                        yield DocumentBlock(text, index, page=start_page, kind='paragraph')
+                        index += 1
+                elif tag == _W_TC:
+                    yield DocumentBlock('\n'.join(cells.pop()), index, page=page, kind='cell')
+                    index += 1
+                elif tag == _W_TBL:
+                    open_tables -= 1
+                else:
+                    continue
+
+                # Libera o elemento de nível superior do corpo já processado
+                if body is not None and not paragraphs and not open_tables:
+                    body.clear()
+
+    def _iter_bytes(self, source: _Source) -> Iterator[bytes]:
+        """Lê o conteúdo bruto em pedaços; arquivos no disco são mapeados em memória."""
+        chunk_size = max(self.block_size, _TEXT_CHUNK_BYTES)
+        if source.path is None:
+            stream = source.file()
+            yield from iter(lambda: stream.read(chunk_size), b'')
+            return
+
+        with open(source.path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return  # não é possível mapear arquivos vazios
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                for start in range(0, len(mapped), chunk_size):
+                    yield mapped[start:start + chunk_size]
+
+    def _iter_decoded(self, source: _Source) -> Iterator[str]:
+        """
+        Decodifica um arquivo de texto de forma incremental.
+
+        Apenas um pedaço do arquivo é mantido em memória por vez; caracteres
+        multibyte divididos entre pedaços são tratados pelo decodificador e as
+        quebras de linha são normalizadas para ``\\n`` como no modo texto.
+        """
+        chunks = self._iter_bytes(source)
+        first = next(chunks, b'')
+        encoding = self.text_encoding or detect_encoding(first)
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(self.text_errors), translate=True
+        )
+        text = decoder.decode(first)
+        if text:
+            yield text
+        for chunk in chunks:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
+    def _iter_txt(self, source: _Source) -> Iterator[DocumentBlock]:
+        """Lê um arquivo de texto em blocos de linhas completas de até ``block_size`` caracteres."""
+        index = 0
+        pending = ''
+        for text in self._iter_decoded(source):
+            pending += text
+            while len(pending) >= self.block_size:
+                # Linhas muito longas são cortadas em block_size caracteres
+                cut = pending.rfind('\n', 0, self.block_size) + 1 or self.block_size
+                yield DocumentBlock(pending[:cut], index)
+                index += 1
+                pending = pending[cut:]
+        if pending:
+            yield DocumentBlock(pending, index)
+
+    def _read_pdf(self, source: _Source, pdf_reader: Optional[PyPDF2.PdfReader] = None) -> str:
         """Lê o conteúdo de um arquivo PDF."""
-        text = []
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text.append(page.extract_text())
-        return '\n'.join(text)
-    
-    def _read_docx(self, file_path: Path) -> str:
+        return '\n'.join(block.text for block in self._iter_pdf(source, pdf_reader))
+
+    def _read_docx(self, source: _Source, doc: Any = None) -> str:
         """Lê o conteúdo de um arquivo DOCX."""
-        doc = Document(file_path)
-        return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-    
-    def _read_txt(self, file_path: Path) -> str:
+        return '\n'.join(block.text for block in self._iter_docx(source, doc))
+
+    def _read_txt(self, source: _Source) -> str:
         """Lê o conteúdo de um arquivo de texto."""
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.read()
+        return ''.join(self._iter_decoded(source))
             
-    def extract_metadata(self, file_path: str) -> Dict[str, Any]:
+    def extract_metadata(self, file_path: DocumentSource) -> Dict[str, Any]:
         """
         Extrai metadados do documento.
         
         Args:
-            file_path (str): Caminho do arquivo
+            file_path (DocumentSource): Caminho do arquivo ou conteúdo do
+                documento (``bytes``, ``memoryview`` ou arquivo binário aberto)
             
         Returns:
-            Dict[str, Any]: Metadados do documento
+            Dict[str, Any]: Metadados do documento. Para conteúdo em memória,
+            ``created`` e ``modified`` são None
         """
-        file_path = Path(file_path)
+        with DocumentResult(self, self._resolve_source(file_path, check=False)) as result:
+            return result.metadata
+
+    def _extract_metadata(self, source: _Source, handle: Any = None) -> Dict[str, Any]:
+        """Lê os metadados do arquivo a partir do documento já interpretado."""
+        file_path = source.origin
         metadata = {
-            'filename': file_path.name,
-            'extension': file_path.suffix,
-            'size': os.path.getsize(file_path),
-            'created': os.path.getctime(file_path),
-            'modified': os.path.getmtime(file_path)
+            'filename': source.name,
+            'extension': source.format,
+            'size': source.size(),
+            'created': os.path.getctime(file_path) if file_path is not None else None,
+            'modified': os.path.getmtime(file_path) if file_path is not None else None
         }
         
-        if file_path.suffix == '.pdf':
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                metadata.update({
-                    'pages': len(pdf_reader.pages),
-                    'author': pdf_reader.metadata.get('/Author', ''),
-                    'title': pdf_reader.metadata.get('/Title', ''),
-                    'subject': pdf_reader.metadata.get('/Subject', '')
-                })
-        elif file_path.suffix == '.docx':
-            doc = Document(file_path)
+        if source.format == '.pdf':
+            metadata.update(_pdf_metadata(handle))
+        elif source.format == '.docx':
+            doc = handle
             metadata.update({
                 'paragraphs': len(doc.paragraphs),
                 'tables': len(doc.tables),
@@ -96,39 +977,176 @@ class DocumentProcessor:
             
         return metadata
         
-    def extract_tables(self, file_path: str) -> List[List[List[str]]]:
+    def extract_tables(self, file_path: DocumentSource) -> List[List[List[str]]]:
         """
         Extrai tabelas do documento.
         
         Args:
-            file_path (str): Caminho do arquivo
+            file_path (DocumentSource): Caminho do arquivo ou conteúdo do
+                documento (``bytes``, ``memoryview`` ou arquivo binário aberto)
             
         Returns:
             List[List[List[str]]]: Lista de tabelas extraídas
         """
-        file_path = Path(file_path)
+        source = self._resolve_source(file_path, check=False)
+        if source.format != '.docx':
+            return []
+        with DocumentResult(self, source) as result:
+            return result.tables
+
+    def _extract_tables(self, doc: Any) -> List[List[List[str]]]:
+        """Lê as tabelas de um DOCX já interpretado."""
         tables = []
-        
-        if file_path.suffix == '.docx':
-            doc = Document(file_path)
-            for table in doc.tables:
-                table_data = []
-                for row in table.rows:
-                    table_data.append([cell.text for cell in row.cells])
-                tables.append(table_data)
-                
+        for table in doc.tables:
+            table_data = []
+            for row in table.rows:
+                table_data.append([cell.text for cell in row.cells])
+            tables.append(table_data)
         return tables
         
-    def extract_images(self, file_path: str, output_dir: Optional[str] = None) -> List[str]:
+    def _slot(self) -> asyncio.Semaphore:
+        """Semáforo que limita os documentos em processamento no loop atual."""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            # Criado sob demanda: o semáforo pertence ao loop em que é usado
+            self._async_loop = loop
+            self._async_semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._async_semaphore
+
+    async def _run_async(self, func: Callable, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        async with self._slot():
+            return await loop.run_in_executor(self.async_executor, func, *args)
+
+    async def aread_document(self, file_path: DocumentSource) -> str:
+        """
+        Versão assíncrona de ``read_document``.
+
+        A leitura e a interpretação do documento acontecem no executor, sem
+        bloquear o loop de eventos; no máximo ``max_concurrency`` documentos
+        são processados ao mesmo tempo.
+
+        Args:
+            file_path (DocumentSource): Caminho do arquivo ou conteúdo do
+                documento (``bytes``, ``memoryview`` ou arquivo binário aberto)
+
+        Returns:
+            str: Conteúdo do documento
+
+        Raises:
+            ValueError: Se o formato do arquivo não for suportado
+            FileNotFoundError: Se o arquivo não existir
+        """
+        return await self._run_async(self.read_document, file_path)
+
+    async def aextract_metadata(self, file_path: DocumentSource) -> Dict[str, Any]:
+        """
+        Versão assíncrona de ``extract_metadata``.
+
+        Args:
+            file_path (DocumentSource): Caminho do arquivo ou conteúdo do
+                documento (``bytes``, ``memoryview`` ou arquivo binário aberto)
+
+        Returns:
+            Dict[str, Any]: Metadados do documento
+        """
+        return await self._run_async(self.extract_metadata, file_path)
+
+    async def aiter_document(self, file_path: DocumentSource,
+                             cleaner: Optional[Callable[[str], str]] = None
+                             ) -> AsyncIterator[DocumentBlock]:
+        """
+        Versão assíncrona de ``iter_document``.
+
+        Cada trecho é extraído (e limpo) em uma thread do executor e entregue
+        assim que fica pronto. O documento ocupa uma das ``max_concurrency``
+        vagas até a iteração terminar. Como o gerador não pode ser enviado a
+        outro processo, um ``async_executor`` de processos é substituído pelo
+        executor padrão do loop.
+
+        Args:
+            file_path (DocumentSource): Caminho do arquivo ou conteúdo do
+                documento (``bytes``, ``memoryview`` ou arquivo binário aberto)
+            cleaner (Optional[Callable[[str], str]]): Função aplicada ao texto de
+                cada trecho
+
+        Yields:
+            DocumentBlock: Trechos do documento, na ordem de leitura
+
+        Examples:
+            >>> async for bloco in processor.aiter_document(upload, cleaner=clean_text):
+            ...     await fila.put(bloco.text)
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.async_executor
+        if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+            executor = None
+        end = object()
+        async with self._slot():
+            blocks = self.iter_document(file_path, cleaner)
+            # Um ``next`` cancelado continua rodando no executor; o gerador só
+            # pode ser fechado depois dele ("generator already executing")
+            lock = threading.Lock()
+
+            def advance():
+                with lock:
+                    return next(blocks, end)
+
+            def close():
+                with lock:
+                    blocks.close()
+
+            try:
+                while True:
+                    block = await loop.run_in_executor(executor, advance)
+                    if block is end:
+                        break
+                    yield block
+            finally:
+                await asyncio.shield(loop.run_in_executor(executor, close))
+
+    def iter_images(self, file_path: DocumentSource,
+                    output_dir: Optional[str] = None) -> Iterator[ImageRecord]:
+        """
+        Percorre as imagens do documento, gravando cada uma assim que é encontrada.
+
+        As imagens são gravadas em ``output_dir`` com o SHA-256 do conteúdo
+        como nome, de modo que imagens repetidas são gravadas uma única vez.
+
+        Args:
+            file_path (DocumentSource): Caminho do arquivo ou conteúdo do
+                documento (``bytes``, ``memoryview`` ou arquivo binário aberto)
+            output_dir (Optional[str]): Diretório para salvar as imagens. Sem
+                ele, apenas os registros (hash, tamanho e página) são produzidos
+
+        Yields:
+            ImageRecord: Uma ocorrência por imagem, na ordem do documento
+
+        Raises:
+            ValueError: Se o formato do arquivo não for suportado
+            FileNotFoundError: Se o arquivo não existir
+            FileProcessingError: Se uma imagem do PDF exigir o Pillow e ele
+                não estiver instalado
+        """
+        store = ImageStore(output_dir)
+        with self.process(file_path) as result:
+            if result.format == '.pdf':
+                yield from iter_pdf_images(result.handle, store, result.name or '')
+            elif result.format == '.docx':
+                yield from iter_docx_images(result.source.file(), store)
+
+    def extract_images(self, file_path: DocumentSource,
+                       output_dir: Optional[str] = None) -> List[ImageRecord]:
         """
         Extrai imagens do documento.
         
         Args:
-            file_path (str): Caminho do arquivo
+            file_path (DocumentSource): Caminho do arquivo ou conteúdo do
+                documento (``bytes``, ``memoryview`` ou arquivo binário aberto)
             output_dir (Optional[str]): Diretório para salvar as imagens
             
         Returns:
-            List[str]: Lista de caminhos das imagens extraídas
+            List[ImageRecord]: Ocorrências das imagens (hash, tamanho, página e
+            arquivo gravado); imagens repetidas apontam para o mesmo arquivo
         """
-        # TODO: Implementar extração de imagens
-        return [] 
\ No newline at end of file
+        return list(self.iter_images(file_path, output_dir))
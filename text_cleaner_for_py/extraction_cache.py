@@ -0,0 +1,222 @@
+"""
+Cache em disco dos resultados de extração de documentos.
+
+Cada arquivo é identificado pelo caminho absoluto, tamanho e data de
+modificação (e, opcionalmente, pelo hash do conteúdo). Texto, tabelas e
+metadados extraídos ficam gravados em disco, de modo que reprocessar um
+documento inalterado não precisa abrir o PyPDF2 nem o python-docx. O
+tamanho total do cache é limitado e as entradas menos usadas recentemente
+são removidas primeiro.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Union
+
+from .exceptions import CacheError
+
+# Valor retornado por ``get`` quando a parte não está no cache
+MISSING = object()
+
+
+class ExtractionCache:
+    """Cache de extração em disco com limite de tamanho e remoção LRU."""
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 512 * 1024 * 1024,
+                 use_content_hash: bool = False) -> None:
+        """
+        Inicializa o cache.
+
+        Args:
+            directory: Diretório local onde as entradas são gravadas
+            max_bytes: Tamanho máximo do cache em disco
+            use_content_hash: Inclui o SHA-256 do conteúdo na identidade do
+                arquivo (detecta mudanças que preservam tamanho e data, ao custo
+                de ler o arquivo inteiro)
+
+        Raises:
+            CacheError: Se o diretório não puder ser criado
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.use_content_hash = use_content_hash
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._sizes: Optional[Dict[Path, int]] = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise CacheError("inicializar", str(e))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Permite enviar o processador (e seu cache) para outros processos
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_sizes'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def key_for(self, file_path: Union[str, Path]) -> str:
+        """
+        Calcula a chave de um arquivo a partir da sua identidade.
+
+        Args:
+            file_path: Caminho do arquivo
+
+        Returns:
+            str: Chave hexadecimal da entrada
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        identity = hashlib.sha256(
+            f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}".encode('utf-8', 'surrogateescape')
+        )
+        if self.use_content_hash:
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                    identity.update(chunk)
+        return identity.hexdigest()
+
+    def key_for_stream(self, stream: BinaryIO) -> str:
+        """
+        Calcula a chave de um documento em memória pelo hash do conteúdo.
+
+        Args:
+            stream: Fluxo binário posicionável; é lido desde o início e
+                devolvido à posição inicial
+
+        Returns:
+            str: Chave hexadecimal da entrada
+        """
+        identity = hashlib.sha256(b"stream\0")
+        stream.seek(0)
+        for chunk in iter(lambda: stream.read(1024 * 1024), b''):
+            identity.update(chunk)
+        stream.seek(0)
+        return identity.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read_entry(self, entry_path: Path) -> Dict[str, Any]:
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str, part: str) -> Any:
+        """
+        Busca uma parte ('text', 'tables', 'metadata', ...) extraída do arquivo.
+
+        Args:
+            key: Chave do arquivo, obtida com ``key_for`` antes da extração
+            part: Nome da parte
+
+        Returns:
+            Any: Valor armazenado ou ``MISSING`` se não estiver no cache
+        """
+        entry_path = self._entry_path(key)
+        entry = self._read_entry(entry_path)
+        with self._lock:
+            if part not in entry:
+                self.misses += 1
+                return MISSING
+            self.hits += 1
+        try:
+            os.utime(entry_path)  # marca a entrada como usada recentemente
+        except OSError:
+            pass
+        return entry[part]
+
+    def put(self, key: str, part: str, value: Any) -> None:
+        """
+        Armazena uma parte extraída do arquivo.
+
+        Args:
+            key: Chave do arquivo, obtida com ``key_for`` antes da extração
+            part: Nome da parte
+            value: Valor serializável em JSON
+        """
+        entry_path = self._entry_path(key)
+        with self._lock:
+            entry = self._read_entry(entry_path)
+            entry[part] = value
+            data = json.dumps(entry, ensure_ascii=False, default=str).encode('utf-8')
+            try:
+                entry_path.parent.mkdir(exist_ok=True)
+                tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, entry_path)
+            except OSError as e:
+                raise CacheError("gravar", str(e))
+            sizes = self._index()
+            sizes[entry_path] = len(data)
+            self._evict(keep=entry_path)
+
+    def _index(self) -> Dict[Path, int]:
+        """Tamanho de cada entrada em disco (carregado na primeira gravação)."""
+        if self._sizes is None:
+            self._sizes = {
+                path: path.stat().st_size for path in self.directory.glob('*/*.json')
+            }
+        return self._sizes
+
+    def _evict(self, keep: Path) -> None:
+        """Remove as entradas menos usadas até o cache caber em ``max_bytes``."""
+        sizes = self._index()
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        def last_used(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for path in sorted(sizes, key=last_used):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            total -= sizes.pop(path)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna estatísticas de uso do cache.
+
+        Returns:
+            Dict[str, int]: Acertos, falhas, número de entradas e bytes em disco
+        """
+        with self._lock:
+            sizes = self._index()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(sizes),
+                'bytes': sum(sizes.values()),
+            }
+
+    def clear(self) -> None:
+        """Remove todas as entradas e zera as estatísticas."""
+        with self._lock:
+            for path in self.directory.glob('*/*.json'):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._sizes = {}
+            self.hits = 0
+            self.misses = 0
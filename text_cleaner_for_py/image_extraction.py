@@ -0,0 +1,271 @@
+"""
+Extração de imagens de PDF e DOCX com deduplicação por conteúdo.
+
+As imagens são gravadas no diretório de saída à medida que são encontradas,
+com o SHA-256 do conteúdo como nome de arquivo: imagens repetidas (logotipos
+em todas as páginas, por exemplo) são gravadas uma única vez. Em PDFs, um
+mesmo objeto de imagem referenciado em várias páginas nem chega a ser
+decodificado de novo; em DOCX, as mídias são copiadas do zip em blocos, sem
+carregar o arquivo inteiro em memória.
+"""
+
+import hashlib
+import os
+import uuid
+import xml.etree.ElementTree as ET
+import zipfile
+from dataclasses import dataclass, replace
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import PyPDF2
+from PyPDF2.generic import IndirectObject
+
+from .exceptions import ConfigurationError, FileProcessingError
+
+_CHUNK_SIZE = 64 * 1024
+
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_R_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_A_BLIP = '{http://schemas.openxmlformats.org/drawingml/2006/main}blip'
+_V_IMAGEDATA = '{urn:schemas-microsoft-com:vml}imagedata'
+_IMAGE_REL_TYPE = '/image'
+
+
+@dataclass(frozen=True)
+class ImageRecord:
+    """
+    Imagem encontrada em um documento.
+
+    Attributes:
+        sha256: Hash do conteúdo da imagem
+        size: Tamanho em bytes
+        page: Página em que a imagem aparece (None se não for possível saber)
+        extension: Extensão do arquivo ('.jpg', '.png', ...)
+        path: Arquivo gravado em ``output_dir`` (o mesmo para imagens repetidas)
+        duplicate: True se o mesmo conteúdo já apareceu antes no documento
+    """
+    sha256: str
+    size: int
+    page: Optional[int]
+    extension: str
+    path: Optional[str] = None
+    duplicate: bool = False
+
+
+class ImageStore:
+    """Grava imagens pelo hash do conteúdo, uma única vez cada."""
+
+    def __init__(self, output_dir: Optional[Union[str, Path]] = None) -> None:
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        if self.output_dir is not None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._seen: Dict[str, ImageRecord] = {}
+
+    def add(self, chunks: Iterable[bytes], extension: str, page: Optional[int]) -> ImageRecord:
+        """
+        Calcula o hash da imagem enquanto a grava em um arquivo temporário.
+
+        Args:
+            chunks: Conteúdo da imagem em blocos
+            extension: Extensão do arquivo
+            page: Página em que a imagem aparece
+
+        Returns:
+            ImageRecord: Registro da imagem (``duplicate`` se já foi vista)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        tmp_path = None
+        tmp_file = None
+        if self.output_dir is not None:
+            tmp_path = self.output_dir / f".{uuid.uuid4().hex}.tmp"
+            tmp_file = open(tmp_path, 'wb')
+        try:
+            for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                if tmp_file is not None:
+                    tmp_file.write(chunk)
+        except BaseException:
+            # Falha na leitura da imagem: não deixa o temporário em output_dir
+            if tmp_file is not None:
+                tmp_file.close()
+                tmp_path.unlink()
+            raise
+        finally:
+            if tmp_file is not None:
+                tmp_file.close()
+
+        sha256 = digest.hexdigest()
+        first = self._seen.get(sha256)
+        if first is not None:
+            if tmp_path is not None:
+                tmp_path.unlink()
+            return self.repeat(first, page)
+
+        path = None
+        if tmp_path is not None:
+            path = self.output_dir / f"{sha256}{extension}"
+            if path.exists():  # gravada por outro documento
+                tmp_path.unlink()
+            else:
+                os.replace(tmp_path, path)
+        record = ImageRecord(sha256, size, page, extension, str(path) if path else None)
+        self._seen[sha256] = record
+        return record
+
+    @staticmethod
+    def repeat(record: ImageRecord, page: Optional[int]) -> ImageRecord:
+        """Registro de uma nova ocorrência de uma imagem já gravada."""
+        return replace(record, page=page, duplicate=True)
+
+
+def _pdf_image_data(image, name: str) -> Tuple[str, bytes]:
+    """Extensão e conteúdo de um XObject de imagem."""
+    filters = image.get('/Filter')
+    if isinstance(filters, list):
+        filters = filters[-1] if filters else None
+    # JPEG e JPEG 2000 já são arquivos de imagem completos: gravados como estão
+    if filters == '/DCTDecode':
+        return '.jpg', image.get_data()
+    if filters == '/JPXDecode':
+        return '.jp2', image.get_data()
+
+    try:
+        # Auxiliar privado do PyPDF2 3.x; ausente em outras versões
+        from PyPDF2.filters import _xobj_to_image
+    except ImportError:
+        raise ConfigurationError(
+            "PyPDF2", PyPDF2.__version__,
+            "Versão sem PyPDF2.filters._xobj_to_image; use PyPDF2 3.x para extrair imagens não JPEG"
+        )
+    try:
+        extension, data = _xobj_to_image(image)
+    except ImportError:
+        raise FileProcessingError(
+            name, "extrair imagens", "Instale o pacote 'Pillow' para converter imagens não JPEG"
+        )
+    return extension or '.bin', data
+
+
+def iter_pdf_images(pdf_reader: PyPDF2.PdfReader, store: ImageStore,
+                    name: str = '') -> Iterator[ImageRecord]:
+    """
+    Percorre as imagens de um PDF página a página.
+
+    Args:
+        pdf_reader: Leitor do documento
+        store: Destino das imagens
+        name: Nome do documento, usado nas mensagens de erro
+
+    Yields:
+        ImageRecord: Uma ocorrência por imagem em cada página
+    """
+    by_object: Dict[Tuple[int, int], ImageRecord] = {}
+    for number, page in enumerate(pdf_reader.pages, 1):
+        resources = page.get('/Resources')
+        if resources is None:
+            continue
+        xobjects = resources.get_object().get('/XObject')
+        if xobjects is None:
+            continue
+        xobjects = xobjects.get_object()
+        for key in xobjects:
+            reference = xobjects.raw_get(key)
+            image = xobjects[key]
+            if image.get('/Subtype') != '/Image':
+                continue
+            object_id = None
+            if isinstance(reference, IndirectObject):
+                object_id = (reference.idnum, reference.generation)
+                if object_id in by_object:
+                    # Mesmo objeto em outra página: não decodifica de novo
+                    yield store.repeat(by_object[object_id], number)
+                    continue
+            extension, data = _pdf_image_data(image, name)
+            record = store.add([data], extension, number)
+            if object_id is not None:
+                by_object[object_id] = record
+            yield record
+
+
+def _docx_image_targets(archive: zipfile.ZipFile) -> Dict[str, str]:
+    """Mapeia os ids de relacionamento de imagens para o membro do zip."""
+    try:
+        rels = archive.read('word/_rels/document.xml.rels')
+    except KeyError:
+        return {}
+    targets = {}
+    for relationship in ET.fromstring(rels).iter(_REL_NS + 'Relationship'):
+        if (not relationship.get('Type', '').endswith(_IMAGE_REL_TYPE)
+                or relationship.get('TargetMode') == 'External'):
+            continue
+        target = relationship.get('Target', '')
+        if target.startswith('/'):
+            member = target.lstrip('/')
+        else:
+            member = os.path.normpath(f"word/{target}").replace(os.sep, '/')
+        targets[relationship.get('Id')] = member
+    return targets
+
+
+def _docx_image_references(archive: zipfile.ZipFile) -> List[Tuple[str, int]]:
+    """Ids das imagens referenciadas no corpo, com a página de cada ocorrência."""
+    references = []
+    page = 1
+    with archive.open('word/document.xml') as xml:
+        for _, element in ET.iterparse(xml):
+            tag = element.tag
+            if tag == _A_BLIP:
+                rel_id = element.get(_R_NS + 'embed')
+                if rel_id:
+                    references.append((rel_id, page))
+            elif tag == _V_IMAGEDATA:
+                rel_id = element.get(_R_NS + 'id')
+                if rel_id:
+                    references.append((rel_id, page))
+            elif tag == _W_NS + 'br' and element.get(_W_NS + 'type') == 'page':
+                page += 1
+            elif tag == _W_NS + 'p':
+                element.clear()
+    return references
+
+
+def iter_docx_images(file: Union[Path, BinaryIO], store: ImageStore) -> Iterator[ImageRecord]:
+    """
+    Percorre as imagens de um DOCX na ordem em que aparecem no corpo.
+
+    Mídias não referenciadas no corpo (cabeçalhos, rodapés) vêm ao final,
+    com página desconhecida.
+
+    Args:
+        file: Caminho ou fluxo do documento
+        store: Destino das imagens
+
+    Yields:
+        ImageRecord: Uma ocorrência por referência a imagem
+    """
+    with zipfile.ZipFile(file) as archive:
+        targets = _docx_image_targets(archive)
+        names = set(archive.namelist())
+        by_member: Dict[str, ImageRecord] = {}
+
+        def extract(member: str, page: Optional[int]) -> ImageRecord:
+            if member in by_member:
+                return store.repeat(by_member[member], page)
+            with archive.open(member) as stream:
+                extension = PurePosixPath(member).suffix
+                record = store.add(iter(lambda: stream.read(_CHUNK_SIZE), b''), extension, page)
+            by_member[member] = record
+            return record
+
+        for rel_id, page in _docx_image_references(archive):
+            member = targets.get(rel_id)
+            if member in names:
+                yield extract(member, page)
+
+        for member in sorted(names):
+            if member.startswith('word/media/') and member not in by_member:
+                yield extract(member, None)
@@ -2,18 +2,40 @@
 Sistema de logging estruturado para o text_cleaner_for_py.
 
 Este módulo fornece um sistema de logging configurável e estruturado
-para monitorar o funcionamento da biblioteca.
+para monitorar o funcionamento da biblioteca. Com ``async_logging`` ligado,
+o chamador apenas enfileira o registro: formatação e escrita (console e
+arquivo) acontecem em uma thread em segundo plano, e a fila limitada segue
+a ``drop_policy`` configurada quando o disco não acompanha.
+
+O logger global (``logger`` / ``get_logger()``) é criado no primeiro uso,
+não na importação, e é reconfigurado a cada ``configure()``.
 """
 
+import atexit
+import copy
+import json
 import logging
 import logging.handlers
+import queue
+import random
 import sys
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from .config import config
+from .config import ConfigManager, LoggingConfig, get_config, on_configure
 from .exceptions import ConfigurationError
 
+# Políticas para fila cheia no modo assíncrono
+DROP_POLICIES = ("drop_new", "drop_oldest", "block")
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+# Durações mantidas por janela de agregação para o cálculo dos percentis
+_MAX_WINDOW_SAMPLES = 10000
+
 
 class ColoredFormatter(logging.Formatter):
     """Formatador de log com cores para terminal."""
@@ -60,47 +82,257 @@ class StructuredFormatter(logging.Formatter):
             'line': record.lineno
         }
         
-        # Adiciona exceção se houver
-        if record.exc_info:
-            log_entry['exception'] = self.formatException(record.exc_info)
+        # Adiciona exceção se houver (já formatada quando veio da fila)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_entry['exception'] = record.exc_text
         
         # Adiciona campos extras se houver
-        if hasattr(record, 'extra_fields'):
-            log_entry.update(record.extra_fields)
-        
-        # Formata como JSON-like (simplificado)
-        formatted_parts = []
-        for key, value in log_entry.items():
-            if isinstance(value, str):
-                formatted_parts.append(f"{key}='{value}'")
-            else:
-                formatted_parts.append(f"{key}={value}")
+        extra_fields = getattr(record, 'extra_fields', None)
+        if extra_fields:
+            log_entry.update(extra_fields)
+        
+        # Uma linha JSON por registro; valores não serializáveis viram str
+        return json.dumps(log_entry, ensure_ascii=False, default=str)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enfileira registros para a thread de escrita, com fila limitada.
+    
+    Políticas para fila cheia:
+        - ``drop_new``: descarta o registro novo
+        - ``drop_oldest``: descarta o registro mais antigo da fila
+        - ``block``: espera a thread de escrita liberar espaço
+    """
+    
+    def __init__(self, log_queue: queue.Queue, drop_policy: str = "drop_new") -> None:
+        """
+        Inicializa o handler.
         
-        return " | ".join(formatted_parts)
+        Args:
+            log_queue: Fila compartilhada com o ``QueueListener``
+            drop_policy: Política aplicada quando a fila está cheia
+            
+        Raises:
+            ConfigurationError: Se a política não for suportada
+        """
+        if drop_policy not in DROP_POLICIES:
+            raise ConfigurationError(
+                "drop_policy",
+                drop_policy,
+                f"Deve ser uma das políticas suportadas: {', '.join(DROP_POLICIES)}"
+            )
+        super().__init__(log_queue)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepara o registro para outra thread sem formatá-lo.
+        
+        Apenas a mensagem é resolvida (os argumentos podem mudar depois da
+        chamada) e a exceção é convertida em texto; os formatadores rodam na
+        thread de escrita.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enfileira o registro aplicando a política de descarte."""
+        if self.drop_policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            if self.drop_policy == "drop_new":
+                with self._drop_lock:
+                    self.dropped += 1
+                return
+        # drop_oldest: abre espaço removendo o registro mais antigo
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                with self._drop_lock:
+                    self.dropped += 1
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                continue
+
+
+class _BackgroundListener(logging.handlers.QueueListener):
+    """``QueueListener`` que espera espaço na fila para o sinal de parada."""
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+# Thread de escrita ativa de cada logger assíncrono, por nome
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def _stop_listener(name: str) -> None:
+    """Para a thread de escrita de um logger, gravando os registros pendentes."""
+    with _listeners_lock:
+        listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+# Loggers vivos, para emitir as janelas de agregação abertas no encerramento
+_instances: 'weakref.WeakSet[TextCleanerLogger]' = weakref.WeakSet()
+
+
+def shutdown_logging() -> None:
+    """
+    Emite os resumos das janelas de agregação abertas e para todas as
+    threads de escrita, gravando os registros pendentes.
+    """
+    for instance in list(_instances):
+        instance.flush_summaries()
+    for name in list(_listeners):
+        _stop_listener(name)
+
+
+atexit.register(shutdown_logging)
+
+
+class _TokenBucket:
+    """Limite de registros por segundo, com rajadas de até um segundo."""
+    
+    def __init__(self, rate: float, now: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = now
+    
+    def take(self, now: float) -> bool:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class _OperationWindow:
+    """Chamadas de uma operação acumuladas entre dois resumos."""
+    
+    def __init__(self, started: float) -> None:
+        self.started = started
+        self.count = 0
+        self.timed_count = 0
+        self.input_length = 0
+        self.output_length = 0
+        self.duration_total = 0.0
+        self.durations: List[float] = []
+    
+    def add_operation(self, input_length: int, output_length: int) -> None:
+        self.count += 1
+        self.input_length += input_length
+        self.output_length += output_length
+    
+    def add_duration(self, duration: float) -> None:
+        self.timed_count += 1
+        self.duration_total += duration
+        if len(self.durations) < _MAX_WINDOW_SAMPLES:
+            self.durations.append(duration)
+        else:
+            # Amostragem de reservatório: percentis com memória limitada
+            index = random.randrange(self.timed_count)
+            if index < _MAX_WINDOW_SAMPLES:
+                self.durations[index] = duration
+    
+    def summary(self, now: float) -> Dict[str, float]:
+        fields = {
+            'count': self.count,
+            'timed_count': self.timed_count,
+            'window_seconds': now - self.started,
+            'input_length_total': self.input_length,
+            'output_length_total': self.output_length,
+        }
+        if self.durations:
+            ordered = sorted(self.durations)
+            last = len(ordered) - 1
+            fields['duration_mean_ms'] = self.duration_total / self.timed_count * 1000
+            for name, quantile in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99)):
+                fields[f'duration_{name}_ms'] = ordered[round(quantile * last)] * 1000
+        return fields
 
 
 class TextCleanerLogger:
     """Logger principal para o text_cleaner_for_py."""
     
-    def __init__(self, name: str = "text_cleaner_for_py") -> None:
+    def __init__(self, name: str = "text_cleaner_for_py",
+                 log_config: Optional[LoggingConfig] = None) -> None:
         """
         Inicializa o logger.
         
         Args:
             name: Nome do logger
+            log_config: Configurações de logging (padrão: as da configuração global)
         """
         self.name = name
         self.logger = logging.getLogger(name)
-        self._setup_logger()
+        self.queue_handler: Optional[BoundedQueueHandler] = None
+        self.suppressed_records = 0
+        self._volume_lock = threading.Lock()
+        self._calls: Dict[str, int] = {}
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._windows: Dict[str, _OperationWindow] = {}
+        self._next_sweep = 0.0
+        self.reconfigure(log_config or get_config().get_logging_config())
+        _instances.add(self)
     
-    def _setup_logger(self) -> None:
+    def reconfigure(self, log_config: LoggingConfig) -> None:
+        """
+        Aplica novas configurações ao logger já criado.
+        
+        Os handlers são recriados e as janelas de agregação abertas são
+        emitidas antes da troca.
+        
+        Args:
+            log_config: Configurações de logging
+        """
+        self.flush_summaries()
+        self._setup_logger(log_config)
+        
+        # Amostragem, limite e agregação de log_operation/log_performance
+        with self._volume_lock:
+            self.sample_every = log_config.sample_every
+            self.sample_rate = log_config.sample_rate
+            self.rate_limit = log_config.rate_limit
+            self.aggregate_interval = log_config.aggregate_interval
+            self._calls.clear()
+            self._buckets.clear()
+            self._next_sweep = 0.0
+    
+    def _setup_logger(self, log_config: LoggingConfig) -> None:
         """Configura o logger com handlers e formatadores."""
-        # Remove handlers existentes
+        # Remove handlers existentes (e a thread de escrita anterior)
+        _stop_listener(self.name)
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
         
         # Configura o nível do logger
-        log_config = config.get_logging_config()
         self.logger.setLevel(getattr(logging, log_config.level.upper()))
         
         # Handler para console com cores
@@ -110,40 +342,94 @@ class TextCleanerLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        handlers: List[logging.Handler] = [console_handler]
         
         # Handler para arquivo se configurado
+        file_error = None
         if log_config.file:
-            self._setup_file_handler(log_config)
+            try:
+                handlers.append(self._setup_file_handler(log_config))
+            except Exception as e:
+                file_error = e
+        
+        if log_config.async_logging:
+            # O chamador só enfileira; formatação e escrita ficam na thread de escrita
+            log_queue: queue.Queue = queue.Queue(maxsize=log_config.queue_size)
+            self.queue_handler = BoundedQueueHandler(log_queue, log_config.drop_policy)
+            self.logger.addHandler(self.queue_handler)
+            listener = _BackgroundListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            with _listeners_lock:
+                _listeners[self.name] = listener
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
         
         # Não propaga para o logger raiz
         self.logger.propagate = False
-    
-    def _setup_file_handler(self, log_config) -> None:
-        """Configura o handler para arquivo."""
-        try:
-            file_path = Path(log_config.file)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Handler rotativo para arquivo
-            file_handler = logging.handlers.RotatingFileHandler(
-                filename=file_path,
-                maxBytes=log_config.max_file_size,
-                backupCount=log_config.backup_count,
-                encoding='utf-8'
-            )
-            
-            file_formatter = StructuredFormatter(
-                fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            file_handler.setFormatter(file_formatter)
-            
-            self.logger.addHandler(file_handler)
-            
-        except Exception as e:
+        
+        if file_error is not None:
             # Se não conseguir configurar o arquivo, loga o erro mas não falha
-            self.logger.warning(f"Não foi possível configurar logging para arquivo: {e}")
+            self.logger.warning(f"Não foi possível configurar logging para arquivo: {file_error}")
+    
+    @property
+    def dropped_records(self) -> int:
+        """Registros descartados porque a fila estava cheia (modo assíncrono)."""
+        return self.queue_handler.dropped if self.queue_handler is not None else 0
+    
+    def flush(self) -> None:
+        """
+        Grava os registros pendentes.
+        
+        Os resumos das janelas de agregação abertas são emitidos e, no modo
+        assíncrono, a thread de escrita é parada (esvaziando a fila) e
+        iniciada de novo.
+        """
+        self.flush_summaries()
+        with _listeners_lock:
+            listener = _listeners.get(self.name)
+        if listener is not None:
+            listener.stop()
+            listener.start()
+            handlers = listener.handlers
+        else:
+            handlers = self.logger.handlers
+        for handler in handlers:
+            handler.flush()
+    
+    def stop(self) -> None:
+        """Para a thread de escrita (modo assíncrono), gravando os registros pendentes."""
+        self.flush_summaries()
+        _stop_listener(self.name)
+    
+    def flush_summaries(self) -> None:
+        """Emite o resumo de todas as janelas de agregação abertas."""
+        now = time.monotonic()
+        with self._volume_lock:
+            windows = list(self._windows.items())
+            self._windows.clear()
+        for operation, window in windows:
+            self._emit_summary(operation, window, now)
+    
+    def _setup_file_handler(self, log_config: LoggingConfig) -> logging.Handler:
+        """Cria o handler para arquivo."""
+        file_path = Path(log_config.file)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Handler rotativo para arquivo
+        file_handler = logging.handlers.RotatingFileHandler(
+            filename=file_path,
+            maxBytes=log_config.max_file_size,
+            backupCount=log_config.backup_count,
+            encoding='utf-8'
+        )
+        
+        file_formatter = StructuredFormatter(
+            fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        file_handler.setFormatter(file_formatter)
+        return file_handler
     
     def debug(self, message: str, **kwargs) -> None:
         """Log de debug."""
@@ -167,6 +453,8 @@ class TextCleanerLogger:
     
     def _log_with_extra(self, level: int, message: str, **kwargs) -> None:
         """Log com campos extras."""
+        if not self.logger.isEnabledFor(level):
+            return
         if kwargs:
             # Cria um registro com campos extras
             extra = {'extra_fields': kwargs}
@@ -178,12 +466,27 @@ class TextCleanerLogger:
         """
         Log específico para operações de limpeza de texto.
         
+        Respeita a amostragem e o limite por operação; com
+        ``aggregate_interval`` as chamadas são acumuladas em janelas. Não há
+        thread de temporização: o resumo de uma janela vencida é emitido na
+        próxima chamada do logger, em ``flush_summaries``/``stop`` ou no
+        encerramento do processo (``shutdown_logging``). Nenhum campo é
+        calculado se o registro não for emitido.
+        
         Args:
             operation: Nome da operação realizada
             text: Texto de entrada
             result: Resultado da operação
-            **kwargs: Campos extras para o log
+            **kwargs: Campos extras para o log (ignorados nos resumos)
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if self.aggregate_interval:
+            self._aggregate(operation, lambda window: window.add_operation(len(text), len(result)))
+            return
+        if not self._should_emit(operation):
+            return
+        
         extra_fields = {
             'operation': operation,
             'input_length': len(text),
@@ -218,11 +521,25 @@ class TextCleanerLogger:
         """
         Log específico para métricas de performance.
         
+        Operações acima de 1s geram um aviso (sujeito à amostragem e ao
+        limite); com ``aggregate_interval`` as demais durações entram no
+        resumo da operação (média e percentis p50/p95/p99).
+        
         Args:
             operation: Nome da operação
             duration: Duração em segundos
             **kwargs: Campos extras para o log
         """
+        slow = duration > 1.0
+        if self.aggregate_interval and self.logger.isEnabledFor(logging.INFO):
+            self._aggregate(operation, lambda window: window.add_duration(duration))
+            if not slow:
+                return
+        if not self.logger.isEnabledFor(logging.WARNING if slow else logging.DEBUG):
+            return
+        if not self._should_emit(operation):
+            return
+        
         extra_fields = {
             'operation': operation,
             'duration_seconds': duration,
@@ -230,14 +547,66 @@ class TextCleanerLogger:
             **kwargs
         }
         
-        if duration > 1.0:
+        if slow:
             self.warning(f"Operação '{operation}' demorou {duration:.2f}s", **extra_fields)
         else:
             self.debug(f"Operação '{operation}' concluída em {duration:.3f}s", **extra_fields)
+    
+    def _should_emit(self, operation: str) -> bool:
+        """Aplica a amostragem (1 a cada N e probabilística) e o limite por operação."""
+        if self.sample_every == 1 and self.sample_rate >= 1.0 and not self.rate_limit:
+            return True
+        with self._volume_lock:
+            if self.sample_every > 1:
+                calls = self._calls.get(operation, 0)
+                self._calls[operation] = calls + 1
+                if calls % self.sample_every:
+                    self.suppressed_records += 1
+                    return False
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                self.suppressed_records += 1
+                return False
+            if self.rate_limit:
+                now = time.monotonic()
+                bucket = self._buckets.get(operation)
+                if bucket is None:
+                    bucket = self._buckets[operation] = _TokenBucket(self.rate_limit, now)
+                if not bucket.take(now):
+                    self.suppressed_records += 1
+                    return False
+        return True
+    
+    def _aggregate(self, operation: str, update) -> None:
+        """Acumula uma chamada na janela da operação e emite as janelas vencidas."""
+        now = time.monotonic()
+        expired = []
+        with self._volume_lock:
+            window = self._windows.get(operation)
+            if window is None:
+                window = self._windows[operation] = _OperationWindow(now)
+            update(window)
+            if now >= self._next_sweep:
+                for name, open_window in list(self._windows.items()):
+                    if now - open_window.started >= self.aggregate_interval:
+                        expired.append((name, self._windows.pop(name)))
+                oldest = min((w.started for w in self._windows.values()), default=now)
+                self._next_sweep = oldest + self.aggregate_interval
+        for name, closed_window in expired:
+            self._emit_summary(name, closed_window, now)
+    
+    def _emit_summary(self, operation: str, window: _OperationWindow, now: float) -> None:
+        summary = window.summary(now)
+        count = window.count or window.timed_count
+        self.info(
+            f"Resumo de '{operation}': {count} chamadas em {summary['window_seconds']:.1f}s",
+            operation=operation,
+            **summary
+        )
 
 
-# Logger global
-logger = TextCleanerLogger()
+# Logger global, criado no primeiro uso
+_logger: Optional[TextCleanerLogger] = None
+_logger_lock = threading.Lock()
 
 
 def get_logger(name: str = None) -> TextCleanerLogger:
@@ -245,11 +614,31 @@ def get_logger(name: str = None) -> TextCleanerLogger:
     Retorna um logger configurado.
     
     Args:
-        name: Nome do logger (opcional)
+        name: Nome do logger (opcional; sem nome, o logger global)
         
     Returns:
         Logger configurado
     """
+    global _logger
     if name:
         return TextCleanerLogger(name)
-    return logger
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                _logger = TextCleanerLogger()
+    return _logger
+
+
+def _reconfigure_logger(manager: ConfigManager) -> None:
+    if _logger is not None:
+        _logger.reconfigure(manager.get_logging_config())
+
+
+on_configure(_reconfigure_logger)
+
+
+def __getattr__(name: str) -> Any:
+    # ``logger`` continua disponível como atributo, mas só é criado no primeiro acesso
+    if name == "logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
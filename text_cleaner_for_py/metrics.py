@@ -0,0 +1,314 @@
+"""
+Métricas internas do text_cleaner_for_py.
+
+Contadores e histogramas em memória, por etapa de limpeza, camada de cache,
+tipo de documento e worker, exportáveis no formato de texto do Prometheus
+(``REGISTRY.to_prometheus()``) ou como dicionário (``REGISTRY.snapshot()``).
+
+As métricas ficam desligadas por padrão: os pontos instrumentados apenas
+consultam ``REGISTRY.enabled`` e seguem o caminho sem medição (as etapas de
+limpeza são medidas em ``profiling.run_stages``). Para ligar, use
+``REGISTRY.enable()``, ``configure(enable_metrics=True)`` ou a variável de
+ambiente ``TEXT_CLEANER_METRICS=true``.
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .config import get_cleaner_setting, on_configure
+from .exceptions import ConfigurationError
+
+# Limites (em segundos) dos buckets padrão dos histogramas
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str],
+                   extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base dos contadores e histogramas: uma série por combinação de rótulos."""
+
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any) -> Any:
+        """
+        Retorna a série de uma combinação de rótulos (criada no primeiro uso).
+
+        Args:
+            *values: Valores dos rótulos, na ordem de ``labelnames``
+
+        Raises:
+            ConfigurationError: Se o número de valores não corresponder aos rótulos
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ConfigurationError(
+                    self.name, values, f"Esperados os rótulos: {', '.join(self.labelnames)}"
+                )
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def series(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children.clear()
+
+
+class _CounterChild:
+    __slots__ = ('value', '_lock')
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """Contador monotônico (total de chamadas, caracteres, acertos de cache...)."""
+
+    type_name = 'counter'
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Incrementa a série sem rótulos."""
+        self.labels().inc(amount)
+
+
+class _HistogramChild:
+    __slots__ = ('buckets', 'counts', 'count', 'sum', '_lock')
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            index = bisect_left(self.buckets, value)
+            if index < len(self.counts):
+                self.counts[index] += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        with self._lock:
+            total = 0
+            result = []
+            for bound, count in zip(self.buckets, self.counts):
+                total += count
+                result.append((bound, total))
+            result.append((math.inf, self.count))
+            return result
+
+
+class Histogram(_Metric):
+    """Distribuição de valores (durações em segundos) em buckets cumulativos."""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Registra um valor na série sem rótulos."""
+        self.labels().observe(value)
+
+
+class MetricsRegistry:
+    """Conjunto de métricas do processo, com chave geral de ativação."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Liga a coleta de métricas."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Desliga a coleta (os valores já coletados são mantidos)."""
+        self.enabled = False
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ConfigurationError(
+                        metric.name, metric.labelnames, "Métrica já registrada com outro tipo ou rótulos"
+                    )
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        Cria (ou retorna, se já existir) um contador.
+
+        Args:
+            name: Nome da métrica no formato do Prometheus
+            documentation: Descrição exibida em ``# HELP``
+            labelnames: Nomes dos rótulos
+
+        Returns:
+            Counter: Contador registrado
+        """
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """
+        Cria (ou retorna, se já existir) um histograma.
+
+        Args:
+            name: Nome da métrica no formato do Prometheus
+            documentation: Descrição exibida em ``# HELP``
+            labelnames: Nomes dos rótulos
+            buckets: Limites superiores dos buckets
+
+        Returns:
+            Histogram: Histograma registrado
+        """
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self) -> None:
+        """Zera todas as séries (as métricas continuam registradas)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna os valores atuais como dicionário.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Por métrica, o tipo, a descrição e as
+            séries (rótulos e valor; para histogramas, contagem, soma e buckets
+            cumulativos)
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        result = {}
+        for name, metric in metrics:
+            samples = []
+            for values, child in metric.series():
+                sample: Dict[str, Any] = {'labels': dict(zip(metric.labelnames, values))}
+                if isinstance(metric, Histogram):
+                    sample['count'] = child.count
+                    sample['sum'] = child.sum
+                    sample['buckets'] = {_format_value(bound): count for bound, count in child.cumulative()}
+                else:
+                    sample['value'] = child.value
+                samples.append(sample)
+            result[name] = {'type': metric.type_name, 'help': metric.documentation, 'samples': samples}
+        return result
+
+    def to_prometheus(self) -> str:
+        """
+        Exporta as métricas no formato de texto do Prometheus (versão 0.0.4).
+
+        Returns:
+            str: Texto pronto para ser servido em ``/metrics``
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        lines = []
+        for name, metric in metrics:
+            series = metric.series()
+            if not series:
+                continue
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type_name}")
+            for values, child in series:
+                if isinstance(metric, Histogram):
+                    for bound, count in child.cumulative():
+                        labels = _format_labels(metric.labelnames, values, ('le', _format_value(bound)))
+                        lines.append(f"{name}_bucket{labels} {count}")
+                    labels = _format_labels(metric.labelnames, values)
+                    lines.append(f"{name}_sum{labels} {_format_value(child.sum)}")
+                    lines.append(f"{name}_count{labels} {child.count}")
+                else:
+                    labels = _format_labels(metric.labelnames, values)
+                    lines.append(f"{name}{labels} {_format_value(child.value)}")
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+# Registro global (ligado por CleanerConfig.enable_metrics / TEXT_CLEANER_METRICS)
+REGISTRY = MetricsRegistry(enabled=get_cleaner_setting('enable_metrics'))
+on_configure(lambda manager: setattr(REGISTRY, 'enabled', manager.cleaner.enable_metrics))
+
+CALLS = REGISTRY.counter(
+    'text_cleaner_calls_total', 'Chamadas das operações de limpeza', ('operation',)
+)
+CHARS = REGISTRY.counter(
+    'text_cleaner_chars_total', 'Caracteres de entrada e saída das operações de limpeza',
+    ('operation', 'direction')
+)
+STAGE_SECONDS = REGISTRY.histogram(
+    'text_cleaner_stage_seconds', 'Duração de cada etapa de limpeza', ('operation', 'stage')
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    'text_cleaner_cache_requests_total', 'Consultas por camada de cache', ('tier', 'result')
+)
+DOCUMENT_OPERATIONS = REGISTRY.counter(
+    'text_cleaner_document_operations_total', 'Partes extraídas de documentos',
+    ('format', 'operation', 'outcome')
+)
+DOCUMENT_SECONDS = REGISTRY.histogram(
+    'text_cleaner_document_seconds', 'Duração da extração de documentos', ('format', 'operation')
+)
+WORKER_TASKS = REGISTRY.counter(
+    'text_cleaner_worker_tasks_total', 'Tarefas executadas por worker', ('operation', 'worker')
+)
+WORKER_SECONDS = REGISTRY.histogram(
+    'text_cleaner_worker_seconds', 'Duração das tarefas por worker', ('operation', 'worker')
+)
@@ -2,33 +2,112 @@ import asyncio
 import concurrent.futures
 from functools import lru_cache
 import re
+import threading
+import time
 from typing import List, Optional, Dict, Any
 import torch
 import redis
 from text_cleaner_for_py.cleaner import clean_text
+from text_cleaner_for_py.config import get_snapshot
+from text_cleaner_for_py.exceptions import ConfigurationError
+from text_cleaner_for_py.metrics import REGISTRY, CACHE_REQUESTS, WORKER_SECONDS, WORKER_TASKS
+
+# Marca, por thread, se a última consulta ao cache local foi uma falha
+_local_cache_state = threading.local()
+
+
+def _clean_in_worker(text: str) -> str:
+    """Executa clean_text registrando a tarefa no worker (thread) que a executou."""
+    worker = threading.current_thread().name
+    started = time.perf_counter()
+    result = clean_text(text)
+    WORKER_SECONDS.labels('clean_texts_parallel', worker).observe(time.perf_counter() - started)
+    WORKER_TASKS.labels('clean_texts_parallel', worker).inc()
+    return result
+
 
 class PerformanceTextCleaner:
-    def __init__(self, max_workers: int = 4, cache_size: int = 1000):
-        self.max_workers = max_workers
+    def __init__(self, max_workers: Optional[int] = None, cache_size: int = 1000,
+                 execution_mode: Optional[str] = None, batch_size: Optional[int] = None):
+        """
+        Inicializa o cleaner.
+
+        Valores omitidos vêm da configuração global (``get_snapshot()``), que
+        aplica o perfil de calibração da máquina (``calibration.py``) quando existe.
+
+        Args:
+            max_workers: Workers de ``clean_texts_parallel``
+            cache_size: Tamanho do cache local
+            execution_mode: 'sequential', 'threads' ou 'processes'
+            batch_size: Textos enviados por tarefa a cada processo (modo 'processes')
+
+        Raises:
+            ConfigurationError: Se o modo de execução não for suportado
+        """
+        settings = get_snapshot()
+        self.max_workers = max_workers or settings.max_workers
+        self.execution_mode = execution_mode or settings.execution_mode
+        self.batch_size = batch_size or settings.batch_size
+        self.chunk_size = settings.chunk_size
+        if self.execution_mode not in settings.supported_execution_modes:
+            raise ConfigurationError(
+                "execution_mode", self.execution_mode,
+                f"Deve ser um dos modos suportados: {', '.join(settings.supported_execution_modes)}"
+            )
         self._cache = {}
         self.cache_size = cache_size
         self._redis_client = None
+        self._process_pool = None
+
+    def __enter__(self) -> 'PerformanceTextCleaner':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Encerra o pool de processos, se tiver sido criado."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
 
     def clean_texts_parallel(self, texts: List[str]) -> List[str]:
-        """Processa múltiplos textos em paralelo."""
+        """Processa múltiplos textos em paralelo, no modo de execução configurado."""
+        if self.execution_mode == 'sequential':
+            return [clean_text(text) for text in texts]
+        if self.execution_mode == 'processes':
+            # O pool é mantido entre chamadas: iniciar processos custa mais que o lote
+            if self._process_pool is None:
+                self._process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+            return list(self._process_pool.map(clean_text, texts, chunksize=self.batch_size))
+        func = _clean_in_worker if REGISTRY.enabled else clean_text
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            return list(executor.map(clean_text, texts))
+            return list(executor.map(func, texts))
 
-    def clean_large_text(self, text: str, chunk_size: int = 1000) -> str:
-        """Processa um texto grande dividindo em chunks."""
+    def clean_large_text(self, text: str, chunk_size: Optional[int] = None) -> str:
+        """Processa um texto grande dividindo em chunks (padrão: ``chunk_size`` da configuração)."""
+        chunk_size = chunk_size or self.chunk_size
         chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
         cleaned_chunks = self.clean_texts_parallel(chunks)
         return " ".join(cleaned_chunks)
 
     @lru_cache(maxsize=1000)
+    def _clean_text_lru(self, text: str) -> str:
+        _local_cache_state.miss = True
+        return clean_text(text)
+
     def clean_text_cached(self, text: str) -> str:
         """Limpa o texto usando cache local."""
-        return clean_text(text)
+        if not REGISTRY.enabled:
+            return self._clean_text_lru(text)
+        _local_cache_state.miss = False
+        result = self._clean_text_lru(text)
+        CACHE_REQUESTS.labels('local', 'miss' if _local_cache_state.miss else 'hit').inc()
+        return result
+
+    # Mantém a interface do lru_cache (cache_clear, cache_info)
+    clean_text_cached.cache_clear = _clean_text_lru.cache_clear
+    clean_text_cached.cache_info = _clean_text_lru.cache_info
 
     def remove_ocr_noise(self, text: str) -> str:
         """Remove ruído comum em textos de OCR."""
@@ -132,8 +211,12 @@ class PerformanceTextCleaner:
         cached_result = self._redis_client.get(cache_key)
         
         if cached_result:
+            if REGISTRY.enabled:
+                CACHE_REQUESTS.labels('redis', 'hit').inc()
             return cached_result.decode('utf-8')
         
+        if REGISTRY.enabled:
+            CACHE_REQUESTS.labels('redis', 'miss').inc()
         cleaned_text = clean_text(text)
         self._redis_client.set(cache_key, cleaned_text)
         return cleaned_text
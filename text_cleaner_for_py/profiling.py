@@ -0,0 +1,399 @@
+"""
+Ganchos de profiling por etapa de limpeza.
+
+Cada etapa dos pipelines de limpeza (``remove_html``, ``normalize_dates``,
+``detect_language``, correção ortográfica...) pode ser observada por
+ganchos: funções que recebem um ``StageEvent`` com a operação, o nome da
+etapa, os tamanhos de entrada e saída e a duração em nanossegundos.
+
+Ganchos globais são registrados com ``add_hook``; ``profile`` registra um
+gancho apenas no contexto atual (thread ou tarefa asyncio), o que permite
+montar a linha do tempo de um documento enquanto outros são limpos em
+paralelo. Sem ganchos e sem métricas, as etapas são aplicadas diretamente,
+sem nenhuma medição.
+
+Adaptadores incluídos:
+    - ``StageTimeline``: linha do tempo das etapas de um documento
+    - ``OpenTelemetryHook``: um span por etapa (requer ``opentelemetry-api``)
+    - ``LoggingHook``: um registro de debug por etapa
+
+``CleanerConfig.profiling`` (ou ``TEXT_CLEANER_PROFILING``) instala um
+gancho global, ``'log'`` ou ``'otel'``, quando a configuração global é
+construída (no máximo na primeira etapa medida, nunca na importação);
+``configure()`` troca esse gancho pelo da nova configuração.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .config import get_cleaner_setting, get_config, on_configure
+from .exceptions import ConfigurationError
+from .metrics import CALLS, CHARS, REGISTRY, STAGE_SECONDS
+
+Stage = Tuple[str, Callable[[str], str]]
+
+
+@dataclass(frozen=True)
+class StageEvent:
+    """
+    Execução de uma etapa de limpeza.
+
+    Attributes:
+        operation: Operação que executou a etapa ('clean_text', 'clean_advanced', ...)
+        stage: Nome da etapa
+        input_size: Tamanho da entrada em caracteres (None se não se aplicar)
+        output_size: Tamanho da saída em caracteres (None se não se aplicar)
+        start_ns: Início da etapa (``time.time_ns``)
+        elapsed_ns: Duração da etapa em nanossegundos
+    """
+    operation: str
+    stage: str
+    input_size: Optional[int]
+    output_size: Optional[int]
+    start_ns: int
+    elapsed_ns: int
+
+
+Hook = Callable[[StageEvent], None]
+
+_global_hooks: Tuple[Hook, ...] = ()
+_scoped_hooks: ContextVar[Tuple[Hook, ...]] = ContextVar('text_cleaner_profiling_hooks', default=())
+# Ganchos globais + escopos de ``profile`` abertos: zero desliga toda a medição
+_active = 0
+_lock = threading.Lock()
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Registra um gancho chamado em todas as etapas, em todas as threads.
+
+    Args:
+        hook: Função que recebe um ``StageEvent``
+    """
+    global _global_hooks, _active
+    with _lock:
+        _global_hooks = _global_hooks + (hook,)
+        _active += 1
+
+
+def remove_hook(hook: Hook) -> None:
+    """
+    Remove um gancho registrado com ``add_hook``.
+
+    Args:
+        hook: Gancho a remover
+    """
+    global _global_hooks, _active
+    with _lock:
+        if hook in _global_hooks:
+            hooks = list(_global_hooks)
+            hooks.remove(hook)
+            _global_hooks = tuple(hooks)
+            _active -= 1
+
+
+@contextmanager
+def profile(hook: Hook) -> Iterator[Hook]:
+    """
+    Registra um gancho apenas no contexto atual (thread ou tarefa asyncio).
+
+    Args:
+        hook: Função que recebe um ``StageEvent``
+
+    Yields:
+        O próprio gancho
+
+    Examples:
+        >>> with profile(StageTimeline('doc-1')) as timeline:
+        ...     clean_text(texto)
+        >>> timeline.by_stage()
+    """
+    global _active
+    token = _scoped_hooks.set(_scoped_hooks.get() + (hook,))
+    with _lock:
+        _active += 1
+    try:
+        yield hook
+    finally:
+        with _lock:
+            _active -= 1
+        _scoped_hooks.reset(token)
+
+
+def _current_hooks() -> Tuple[Hook, ...]:
+    return _global_hooks + _scoped_hooks.get()
+
+
+def _emit(hooks: Tuple[Hook, ...], event: StageEvent) -> None:
+    for hook in hooks:
+        hook(event)
+
+
+def run_stages(operation: str, text: str, stages: Iterable[Stage]) -> str:
+    """
+    Aplica as etapas de limpeza em sequência.
+
+    Sem ganchos e sem métricas, apenas aplica as funções. Caso contrário,
+    mede cada etapa, alimenta as métricas (chamadas, caracteres e duração
+    por etapa) e entrega um ``StageEvent`` a cada gancho ativo.
+
+    Args:
+        operation: Operação instrumentada ('clean_text', 'clean_advanced', ...)
+        text: Texto de entrada
+        stages: Pares (nome da etapa, função texto -> texto)
+
+    Returns:
+        str: Texto após todas as etapas
+    """
+    metrics_on = REGISTRY.enabled
+    if not (_active or metrics_on):
+        for _, func in stages:
+            text = func(text)
+        return text
+
+    hooks = _current_hooks()
+    if metrics_on:
+        CALLS.labels(operation).inc()
+        CHARS.labels(operation, 'in').inc(len(text))
+    for name, func in stages:
+        input_size = len(text)
+        start_ns = time.time_ns()
+        started = time.perf_counter_ns()
+        text = func(text)
+        elapsed_ns = time.perf_counter_ns() - started
+        if metrics_on:
+            STAGE_SECONDS.labels(operation, name).observe(elapsed_ns / 1e9)
+        if hooks:
+            _emit(hooks, StageEvent(operation, name, input_size, len(text), start_ns, elapsed_ns))
+    if metrics_on:
+        CHARS.labels(operation, 'out').inc(len(text))
+    return text
+
+
+class _StageSpan:
+    """Mede um bloco de código como uma etapa (ver ``stage``)."""
+
+    __slots__ = ('operation', 'stage', 'input_size', 'output_size', '_start_ns', '_started')
+
+    def __init__(self, operation: str, stage: str, input_size: Optional[int]) -> None:
+        self.operation = operation
+        self.stage = stage
+        self.input_size = input_size
+        self.output_size: Optional[int] = None
+
+    def __enter__(self) -> '_StageSpan':
+        self._start_ns = time.time_ns()
+        self._started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        elapsed_ns = time.perf_counter_ns() - self._started
+        if REGISTRY.enabled:
+            STAGE_SECONDS.labels(self.operation, self.stage).observe(elapsed_ns / 1e9)
+        hooks = _current_hooks()
+        if hooks:
+            _emit(hooks, StageEvent(self.operation, self.stage, self.input_size,
+                                    self.output_size, self._start_ns, elapsed_ns))
+
+
+class _Unmeasured:
+    """Substituto de ``_StageSpan`` quando nada está sendo medido."""
+
+    __slots__ = ()
+    output_size = None
+
+    def __enter__(self) -> '_Unmeasured':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+
+_UNMEASURED = _Unmeasured()
+
+
+def stage(operation: str, stage_name: str, input_size: Optional[int] = None) -> Any:
+    """
+    Gerenciador de contexto que mede um bloco como uma etapa.
+
+    Para etapas que não são funções texto -> texto (tokenização, correção
+    em lote...). O tamanho de saída pode ser informado em ``output_size``.
+
+    Args:
+        operation: Operação instrumentada ('correct_texts', ...)
+        stage_name: Nome da etapa
+        input_size: Tamanho da entrada, se aplicável
+
+    Examples:
+        >>> with stage('correct_text', 'rewrite') as step:
+        ...     result = rewrite(tokens)
+        ...     step.output_size = len(result)
+    """
+    if not (_active or REGISTRY.enabled):
+        return _UNMEASURED
+    return _StageSpan(operation, stage_name, input_size)
+
+
+class StageTimeline:
+    """Gancho que guarda a linha do tempo das etapas (por documento)."""
+
+    def __init__(self, document: Optional[str] = None) -> None:
+        """
+        Inicializa a linha do tempo.
+
+        Args:
+            document: Identificação do documento, gravada em cada linha
+        """
+        self.document = document
+        self.events: List[StageEvent] = []
+
+    def __call__(self, event: StageEvent) -> None:
+        self.events.append(event)
+
+    @property
+    def total_ns(self) -> int:
+        """Soma das durações das etapas."""
+        return sum(event.elapsed_ns for event in self.events)
+
+    def by_stage(self) -> Dict[str, int]:
+        """
+        Duração total por etapa, na ordem da primeira execução.
+
+        Returns:
+            Dict[str, int]: Nanossegundos por nome de etapa
+        """
+        totals: Dict[str, int] = {}
+        for event in self.events:
+            totals[event.stage] = totals.get(event.stage, 0) + event.elapsed_ns
+        return totals
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Eventos como dicionários, com o documento e o deslocamento desde a primeira etapa."""
+        if not self.events:
+            return []
+        origin = self.events[0].start_ns
+        return [
+            {'document': self.document, 'offset_ns': event.start_ns - origin, **asdict(event)}
+            for event in self.events
+        ]
+
+    def write(self, path: Union[str, Path]) -> None:
+        """
+        Acrescenta a linha do tempo a um arquivo JSON Lines (um evento por linha).
+
+        Args:
+            path: Arquivo de saída
+        """
+        with open(path, 'a', encoding='utf-8') as file:
+            for entry in self.to_dicts():
+                file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+
+class OpenTelemetryHook:
+    """Gancho que registra cada etapa como um span do OpenTelemetry."""
+
+    def __init__(self, tracer: Any = None) -> None:
+        """
+        Inicializa o adaptador.
+
+        Args:
+            tracer: Tracer do OpenTelemetry (padrão: ``trace.get_tracer('text_cleaner_for_py')``)
+
+        Raises:
+            ConfigurationError: Se o ``opentelemetry-api`` não estiver instalado
+        """
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                raise ConfigurationError(
+                    "profiling", "otel", "Instale o pacote 'opentelemetry-api' para emitir spans"
+                )
+            tracer = trace.get_tracer('text_cleaner_for_py')
+        self.tracer = tracer
+
+    def __call__(self, event: StageEvent) -> None:
+        attributes = {'text_cleaner.operation': event.operation, 'text_cleaner.stage': event.stage}
+        if event.input_size is not None:
+            attributes['text_cleaner.input_size'] = event.input_size
+        if event.output_size is not None:
+            attributes['text_cleaner.output_size'] = event.output_size
+        # O span é criado depois da etapa, com os horários medidos; fica
+        # associado ao span ativo no momento (ex.: o do documento)
+        span = self.tracer.start_span(
+            f"{event.operation}.{event.stage}", start_time=event.start_ns, attributes=attributes
+        )
+        span.end(end_time=event.start_ns + event.elapsed_ns)
+
+
+class LoggingHook:
+    """Gancho que registra cada etapa em debug no logger da biblioteca."""
+
+    def __init__(self, log: Any = None) -> None:
+        # Sem logger explícito, o global é obtido na primeira etapa registrada
+        self.log = log
+
+    def __call__(self, event: StageEvent) -> None:
+        if self.log is None:
+            from .logging_config import get_logger
+            self.log = get_logger()
+        self.log.debug(
+            f"Etapa '{event.stage}' de '{event.operation}' em {event.elapsed_ns / 1e6:.3f}ms",
+            **asdict(event)
+        )
+
+
+_CONFIGURED_HOOKS = {
+    'log': LoggingHook,
+    'otel': OpenTelemetryHook,
+}
+
+_configured_hook: Optional[Hook] = None
+
+
+def _install_configured_hook(name: Optional[str]) -> None:
+    """Substitui o gancho global instalado por ``CleanerConfig.profiling``."""
+    global _configured_hook
+    if name is not None and name not in _CONFIGURED_HOOKS:
+        raise ConfigurationError(
+            "profiling", name,
+            f"Deve ser um dos ganchos suportados: {', '.join(_CONFIGURED_HOOKS)}"
+        )
+    if _configured_hook is not None:
+        remove_hook(_configured_hook)
+        _configured_hook = None
+    if name:
+        _configured_hook = _CONFIGURED_HOOKS[name]()
+        add_hook(_configured_hook)
+
+
+class _PendingConfiguredHook:
+    """
+    Ocupa o lugar do gancho de ``TEXT_CLEANER_PROFILING`` até a configuração
+    global existir; na primeira etapa medida, constrói a configuração (que
+    valida o valor e instala o gancho real) e repassa o evento a ele.
+    """
+
+    def __call__(self, event: StageEvent) -> None:
+        if _configured_hook is self:
+            manager = get_config()  # na construção, o ouvinte instala o gancho real
+            if _configured_hook is self:  # a configuração já existia antes desta importação
+                _install_configured_hook(manager.cleaner.profiling)
+        if _configured_hook is not None and _configured_hook is not self:
+            _configured_hook(event)
+
+
+# Sem construir a configuração nem o gancho: só marca que há um gancho a instalar
+if get_cleaner_setting('profiling'):
+    _configured_hook = _PendingConfiguredHook()
+    add_hook(_configured_hook)
+on_configure(lambda manager: _install_configured_hook(manager.cleaner.profiling))
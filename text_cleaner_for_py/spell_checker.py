@@ -1,16 +1,99 @@
-from typing import List, Dict, Optional
+from collections import OrderedDict
+import concurrent.futures
+from typing import Iterable, List, Dict, Optional, Set, Tuple
 from spellchecker import SpellChecker
 import re
 
+from .metrics import REGISTRY, CACHE_REQUESTS
+from .profiling import stage
+from .spell_snapshot import SpellSnapshot, write_spell_snapshot
+
+# Tokenização compartilhada entre correção unitária e em lote
+_TOKEN_PATTERN = re.compile(r'\b\w+\b|[^\w\s]|\s+')
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+
+# Marca ausência de valor na memória (None é uma correção válida)
+_MISSING = object()
+
+# Corretor usado pelos processos trabalhadores de correct_texts
+_worker_spell = None
+
+
+def _init_correction_worker(language: str, dictionary_path: Optional[str] = None) -> None:
+    """Carrega o dicionário uma única vez em cada processo trabalhador."""
+    global _worker_spell
+    if dictionary_path:
+        # Snapshots são mapeados em memória e compartilhados entre processos
+        _worker_spell = SpellSnapshot(dictionary_path)
+    else:
+        _worker_spell = SpellChecker(language=language)
+
+
+def _correct_words_worker(words: List[str]) -> List[Optional[str]]:
+    """Corrige um lote de palavras desconhecidas em um processo trabalhador."""
+    return [_worker_spell.correction(word) for word in words]
+
+
+class _BoundedMemo:
+    """Memória LRU limitada para resultados por palavra."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default=None):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return default
+
+    def put(self, key: str, value) -> None:
+        if self.max_size <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def items(self):
+        return self._data.items()
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 class SpellCheckerCleaner:
-    def __init__(self, language: str = 'pt'):
+    def __init__(self, language: str = 'pt', correction_cache_size: int = 100000,
+                 dictionary_path: Optional[str] = None):
         """
         Inicializa o corretor ortográfico.
-        
+
         Args:
             language (str): Idioma para correção ('pt' para português, 'en' para inglês)
+            correction_cache_size (int): Número máximo de palavras distintas cujas
+                correções e sugestões ficam memorizadas entre chamadas
+            dictionary_path (Optional[str]): Snapshot binário gerado por
+                ``save_snapshot``/``build_spell_snapshot``. Quando informado, o
+                dicionário é mapeado em memória em vez de carregado do JSON
         """
-        self.spell = SpellChecker(language=language)
+        self.dictionary_path = str(dictionary_path) if dictionary_path else None
+        if self.dictionary_path:
+            self.spell = SpellSnapshot(self.dictionary_path)
+            language = self.spell.language or language
+        else:
+            self.spell = SpellChecker(language=language)
         self.language = language
         self.abbreviations = {
             'vc': 'você',
@@ -30,70 +113,262 @@ class SpellCheckerCleaner:
             'pls': 'please',
             'ty': 'thank you',
         }
-        
+        self._corrections = _BoundedMemo(correction_cache_size)
+        self._candidates = _BoundedMemo(correction_cache_size)
+
+        if self.dictionary_path:
+            self.abbreviations.update(self.spell.abbreviations)
+            for word, correction in self.spell.corrections.items():
+                self._corrections.put(word, correction)
+
     def check_text(self, text: str) -> Dict[str, List[str]]:
         """
         Verifica erros ortográficos no texto.
-        
+
         Args:
             text (str): Texto a ser verificado
-            
+
         Returns:
             Dict[str, List[str]]: Dicionário com palavras incorretas e sugestões
         """
         # Remove pontuação e divide em palavras
-        words = re.findall(r'\b\w+\b', text.lower())
-        
+        words = _WORD_PATTERN.findall(text.lower())
+
         # Encontra palavras incorretas
         misspelled = self.spell.unknown(words)
-        
+
         # Cria dicionário com palavras incorretas e suas sugestões
         result = {}
         for word in misspelled:
-            result[word] = list(self.spell.candidates(word))
-            
+            result[word] = self._get_candidates(word)
+
         return result
-    
+
+    def check_texts(self, texts: Iterable[str]) -> List[Dict[str, List[str]]]:
+        """
+        Verifica erros ortográficos em vários textos de uma vez.
+
+        As palavras desconhecidas de todo o lote são deduplicadas antes do
+        cálculo das sugestões, que acontece uma única vez por palavra distinta.
+
+        Args:
+            texts (Iterable[str]): Textos a serem verificados
+
+        Returns:
+            List[Dict[str, List[str]]]: Um dicionário de erros e sugestões por texto,
+            na mesma ordem da entrada
+        """
+        documents = [_WORD_PATTERN.findall(text.lower()) for text in texts]
+
+        vocabulary: Set[str] = set()
+        for words in documents:
+            vocabulary.update(words)
+        misspelled = self.spell.unknown(vocabulary)
+
+        suggestions = {word: self._get_candidates(word) for word in misspelled}
+
+        results = []
+        for words in documents:
+            results.append({
+                word: list(suggestions[word])
+                for word in dict.fromkeys(words) if word in suggestions
+            })
+        return results
+
     def correct_text(self, text: str) -> str:
         """
         Corrige erros ortográficos no texto.
-        
+
         Args:
             text (str): Texto a ser corrigido
-            
+
         Returns:
             str: Texto corrigido
         """
-        # Divide o texto em palavras e pontuação
-        words = re.findall(r'\b\w+\b|[^\w\s]|\s+', text)
-        corrected_words = []
+        with stage('correct_text', 'tokenize', len(text)):
+            tokens = _TOKEN_PATTERN.findall(text)
+        with stage('correct_text', 'correct'):
+            corrections = self._resolve_corrections(self._collect_words([tokens]))
+        with stage('correct_text', 'rewrite') as step:
+            result = self._rewrite(tokens, corrections)
+            step.output_size = len(result)
+        return result
+
+    def correct_texts(self, texts: Iterable[str], max_workers: Optional[int] = None,
+                      chunk_size: int = 500) -> List[str]:
+        """
+        Corrige erros ortográficos em vários textos de uma vez.
+
+        Todos os textos são tokenizados primeiro; as palavras desconhecidas são
+        deduplicadas e corrigidas uma única vez cada (reaproveitando a memória
+        de correções de lotes anteriores) e, por fim, os textos são reescritos a
+        partir do mapa de correções resultante. O custo passa a ser proporcional
+        ao número de palavras distintas, e não ao número de ocorrências.
+
+        Args:
+            texts (Iterable[str]): Textos a serem corrigidos
+            max_workers (Optional[int]): Número de processos para corrigir as
+                palavras distintas em paralelo. ``None`` ou ``1`` corrige no
+                processo atual
+            chunk_size (int): Quantidade de palavras enviadas a cada processo
+                por tarefa
+
+        Returns:
+            List[str]: Textos corrigidos, na mesma ordem da entrada
+        """
+        with stage('correct_texts', 'tokenize'):
+            documents = [_TOKEN_PATTERN.findall(text) for text in texts]
+        with stage('correct_texts', 'correct'):
+            corrections = self._resolve_corrections(
+                self._collect_words(documents), max_workers, chunk_size
+            )
+        with stage('correct_texts', 'rewrite'):
+            return [self._rewrite(tokens, corrections) for tokens in documents]
+
+    @staticmethod
+    def _collect_words(documents: Iterable[List[str]]) -> Set[str]:
+        """Reúne as palavras distintas (em minúsculas) de textos tokenizados."""
+        words: Set[str] = set()
+        for tokens in documents:
+            for token in tokens:
+                if _WORD_PATTERN.match(token):
+                    words.add(token.lower())
+        return words
+
+    def _resolve_corrections(self, words: Set[str], max_workers: Optional[int] = None,
+                             chunk_size: int = 500) -> Dict[str, Optional[str]]:
+        """
+        Monta o mapa de correções das palavras desconhecidas de um lote.
+
+        Palavras já memorizadas são reaproveitadas; as demais são corrigidas
+        uma única vez e passam a fazer parte da memória de correções.
+        """
+        corrections: Dict[str, Optional[str]] = {}
+        missing = []
         for word in words:
-            if re.match(r'\b\w+\b', word):  # Se for uma palavra
+            if word in self.abbreviations or word in self.spell:
+                continue
+            cached = self._corrections.get(word, _MISSING)
+            if cached is _MISSING:
+                missing.append(word)
+            else:
+                corrections[word] = cached
+
+        if REGISTRY.enabled:
+            CACHE_REQUESTS.labels('spell_corrections', 'hit').inc(len(corrections))
+            CACHE_REQUESTS.labels('spell_corrections', 'miss').inc(len(missing))
+
+        for word, correction in self._correct_unique(sorted(missing), max_workers, chunk_size):
+            corrections[word] = correction
+            self._corrections.put(word, correction)
+        return corrections
+
+    def _correct_unique(self, words: List[str], max_workers: Optional[int],
+                        chunk_size: int) -> List[Tuple[str, Optional[str]]]:
+        """Corrige palavras distintas, opcionalmente em vários processos."""
+        if not max_workers or max_workers <= 1 or len(words) <= chunk_size:
+            return [(word, self.spell.correction(word)) for word in words]
+
+        chunks = [words[i:i + chunk_size] for i in range(0, len(words), chunk_size)]
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_correction_worker,
+            initargs=(self.language, self.dictionary_path),
+        ) as executor:
+            corrections = [c for chunk in executor.map(_correct_words_worker, chunks) for c in chunk]
+        return list(zip(words, corrections))
+
+    def _rewrite(self, tokens: List[str], corrections: Dict[str, Optional[str]]) -> str:
+        """Remonta um texto tokenizado aplicando abreviações e correções."""
+        corrected_words = []
+        for word in tokens:
+            if _WORD_PATTERN.match(word):  # Se for uma palavra
                 lower_word = word.lower()
                 if lower_word in self.abbreviations:
                     correction = self.abbreviations[lower_word]
-                    if word[0].isupper():
-                        correction = correction.capitalize()
-                    corrected_words.append(correction)
-                elif lower_word in self.spell:
-                    corrected_words.append(word)
                 else:
-                    correction = self.spell.correction(word)
-                    if word[0].isupper():
-                        correction = correction.capitalize()
-                    corrected_words.append(correction)
+                    correction = corrections.get(lower_word)
+                    if correction is None:
+                        # Palavra conhecida ou sem candidatos: mantém o original
+                        corrected_words.append(word)
+                        continue
+                if word[0].isupper():
+                    correction = correction.capitalize()
+                corrected_words.append(correction)
             else:
                 corrected_words.append(word)
         return ''.join(corrected_words)
-    
+
+    def _get_candidates(self, word: str) -> List[str]:
+        """Obtém sugestões de uma palavra consultando a memória de sugestões."""
+        candidates = self._candidates.get(word, _MISSING)
+        if candidates is _MISSING:
+            candidates = list(self.spell.candidates(word) or [])
+            self._candidates.put(word, candidates)
+            if REGISTRY.enabled:
+                CACHE_REQUESTS.labels('spell_candidates', 'miss').inc()
+        elif REGISTRY.enabled:
+            CACHE_REQUESTS.labels('spell_candidates', 'hit').inc()
+        return list(candidates)
+
+    def clear_correction_cache(self) -> None:
+        """Descarta as correções e sugestões memorizadas."""
+        self._corrections.clear()
+        self._candidates.clear()
+
+    def correction_cache_info(self) -> Dict[str, int]:
+        """
+        Retorna estatísticas da memória de correções.
+
+        Returns:
+            Dict[str, int]: Acertos, falhas, tamanho atual e tamanho máximo
+        """
+        return {
+            'hits': self._corrections.hits,
+            'misses': self._corrections.misses,
+            'size': len(self._corrections),
+            'max_size': self._corrections.max_size,
+        }
+
+    def save_snapshot(self, path: str) -> str:
+        """
+        Gera um snapshot binário do dicionário atual.
+
+        O snapshot inclui as frequências das palavras, o mapa de abreviações e
+        as correções memorizadas até o momento. Outros processos podem abri-lo
+        com ``SpellCheckerCleaner(dictionary_path=path)``.
+
+        Args:
+            path (str): Caminho do arquivo de saída
+
+        Returns:
+            str: Caminho do snapshot gravado
+        """
+        if isinstance(self.spell, SpellSnapshot):
+            words = self.spell.words()
+            frequencies = {word: self.spell[word] for word in words}
+            letters = self.spell.letters
+        else:
+            frequencies = dict(self.spell.word_frequency.dictionary)
+            letters = self.spell.word_frequency.letters
+        write_spell_snapshot(
+            path,
+            frequencies,
+            letters=letters,
+            abbreviations=self.abbreviations,
+            corrections=dict(self._corrections.items()),
+            language=self.language,
+        )
+        return str(path)
+
     def get_suggestions(self, word: str) -> List[str]:
         """
         Obtém sugestões de correção para uma palavra.
-        
+
         Args:
             word (str): Palavra para obter sugestões
-            
+
         Returns:
             List[str]: Lista de sugestões de correção
         """
-        return list(self.spell.candidates(word)) 
\ No newline at end of file
+        return list(self.spell.candidates(word))
@@ -0,0 +1,333 @@
+"""
+Snapshots binários e compartilháveis de dicionários ortográficos.
+
+Carregar o dicionário do pyspellchecker descompacta e decodifica um JSON
+com centenas de milhares de palavras para um ``dict`` Python, o que custa
+segundos e centenas de MB por processo. Este módulo gera, uma única vez, um
+arquivo binário compacto com as frequências das palavras, o mapa de
+abreviações e o índice de correções já conhecidas. O arquivo é aberto com
+``mmap``: processos trabalhadores que usam o mesmo snapshot compartilham as
+páginas através do cache do sistema operacional em vez de manter cada um a
+sua própria cópia do dicionário.
+
+Formato do arquivo (little-endian)::
+
+    magic (8 bytes) | cabeçalho | metadados JSON | offsets (uint32)
+    | frequências (uint32) | tabela hash (uint32) | palavras UTF-8
+"""
+
+import array
+import json
+import mmap
+import string
+import struct
+import sys
+import unicodedata
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from .exceptions import FileProcessingError
+
+SNAPSHOT_MAGIC = b"TCSPELL1"
+
+# n_words, total_words, table_size, longest_word_length, metadata_length
+_HEADER = struct.Struct("<IQIII")
+_UINT32_MAX = 0xFFFFFFFF
+
+
+def _align(offset: int, alignment: int = 8) -> int:
+    """Arredonda o deslocamento para o próximo múltiplo de ``alignment``."""
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _uint32_section(view: memoryview, byteorder: str = sys.byteorder) -> Union[memoryview, array.array]:
+    """
+    Seção de uint32 little-endian do arquivo, indexável em ordem nativa.
+
+    Em hosts little-endian a seção é uma visão direta do ``mmap`` (páginas
+    compartilhadas); em big-endian é copiada e convertida.
+    """
+    if byteorder == "little":
+        return view.cast("I")
+    values = array.array("I")
+    values.frombytes(view)
+    values.byteswap()
+    return values
+
+
+def _slot(word_bytes: bytes, mask: int) -> int:
+    """Posição inicial da palavra na tabela hash (estável entre processos)."""
+    return zlib.crc32(word_bytes) & mask
+
+
+def write_spell_snapshot(
+    path: Union[str, Path],
+    frequencies: Dict[str, int],
+    letters: Optional[Iterable[str]] = None,
+    abbreviations: Optional[Dict[str, str]] = None,
+    corrections: Optional[Dict[str, Optional[str]]] = None,
+    language: Optional[str] = None,
+) -> Path:
+    """
+    Grava um snapshot binário a partir de um mapa de frequências.
+
+    Args:
+        path: Caminho do arquivo de saída
+        frequencies: Frequência de cada palavra do dicionário
+        letters: Alfabeto usado para gerar candidatos (padrão: letras das palavras)
+        abbreviations: Mapa de abreviações a embutir no snapshot
+        corrections: Índice de correções já calculadas (palavra -> correção)
+        language: Idioma do dicionário, apenas informativo
+
+    Returns:
+        Caminho do snapshot gravado
+    """
+    path = Path(path)
+    words = sorted(frequencies)
+    encoded = [word.encode("utf-8") for word in words]
+
+    if letters is None:
+        letters = {char for word in words for char in word}
+
+    table_size = 1
+    while table_size < max(2 * len(words), 8):
+        table_size <<= 1
+    mask = table_size - 1
+
+    offsets = [0] * (len(words) + 1)
+    for index, word_bytes in enumerate(encoded):
+        offsets[index + 1] = offsets[index] + len(word_bytes)
+
+    table = [0] * table_size
+    for index, word_bytes in enumerate(encoded):
+        slot = _slot(word_bytes, mask)
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = index + 1
+
+    freqs = [min(int(frequencies[word]), _UINT32_MAX) for word in words]
+    metadata = json.dumps({
+        "language": language,
+        "letters": "".join(sorted(letters)),
+        "abbreviations": abbreviations or {},
+        "corrections": corrections or {},
+    }, ensure_ascii=False).encode("utf-8")
+
+    header = _HEADER.pack(
+        len(words),
+        sum(frequencies.values()),
+        table_size,
+        max((len(word) for word in words), default=0),
+        len(metadata),
+    )
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(SNAPSHOT_MAGIC)
+        file.write(header)
+        file.write(metadata)
+        for values in (offsets, freqs, table):
+            file.write(b"\0" * (_align(file.tell()) - file.tell()))
+            file.write(struct.pack(f"<{len(values)}I", *values))
+        file.write(b"".join(encoded))
+    tmp_path.replace(path)
+    return path
+
+
+def build_spell_snapshot(
+    path: Union[str, Path],
+    language: str = "pt",
+    abbreviations: Optional[Dict[str, str]] = None,
+    corrections: Optional[Dict[str, Optional[str]]] = None,
+) -> Path:
+    """
+    Gera o snapshot de um idioma a partir do dicionário do pyspellchecker.
+
+    Args:
+        path: Caminho do arquivo de saída
+        language: Idioma do dicionário ('pt', 'en', ...)
+        abbreviations: Mapa de abreviações a embutir no snapshot
+        corrections: Índice de correções já calculadas
+
+    Returns:
+        Caminho do snapshot gravado
+    """
+    from spellchecker import SpellChecker
+
+    spell = SpellChecker(language=language)
+    word_frequency = spell.word_frequency
+    return write_spell_snapshot(
+        path,
+        dict(word_frequency.dictionary),
+        letters=word_frequency.letters,
+        abbreviations=abbreviations,
+        corrections=corrections,
+        language=language,
+    )
+
+
+class SpellSnapshot:
+    """
+    Dicionário ortográfico somente leitura sobre um snapshot mapeado em memória.
+
+    Implementa a parte da interface do ``SpellChecker`` usada pelo
+    ``SpellCheckerCleaner`` (``in``, ``known``, ``unknown``, ``candidates`` e
+    ``correction``), com o mesmo algoritmo de distância de edição 2.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Abre e mapeia o snapshot em memória.
+
+        Args:
+            path: Caminho do snapshot gerado por ``build_spell_snapshot``
+
+        Raises:
+            FileProcessingError: Se o arquivo não for um snapshot válido
+        """
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as file:
+                self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise FileProcessingError(str(path), "abrir snapshot", str(e))
+
+        if self._mm[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            self._mm.close()
+            raise FileProcessingError(str(path), "abrir snapshot", "Assinatura inválida")
+
+        position = len(SNAPSHOT_MAGIC)
+        (self._n_words, self.total_words, table_size,
+         self.longest_word_length, metadata_length) = _HEADER.unpack_from(self._mm, position)
+        position += _HEADER.size
+
+        metadata = json.loads(self._mm[position:position + metadata_length].decode("utf-8"))
+        position += metadata_length
+        self.language: Optional[str] = metadata["language"]
+        self.letters: str = metadata["letters"]
+        self.abbreviations: Dict[str, str] = metadata["abbreviations"]
+        self.corrections: Dict[str, Optional[str]] = metadata["corrections"]
+
+        view = memoryview(self._mm)
+        sections = []
+        for count in (self._n_words + 1, self._n_words, table_size):
+            position = _align(position)
+            sections.append(_uint32_section(view[position:position + 4 * count]))
+            position += 4 * count
+        self._offsets, self._freqs, self._table = sections
+        self._strings_start = position
+        self._mask = table_size - 1
+
+    def close(self) -> None:
+        """Libera o mapeamento do arquivo."""
+        for section in (self._offsets, self._freqs, self._table):
+            if isinstance(section, memoryview):
+                section.release()
+        self._mm.close()
+
+    def __enter__(self) -> "SpellSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._n_words
+
+    def _index(self, word: str) -> int:
+        """Índice da palavra no snapshot ou -1 se ela não existir."""
+        word_bytes = word.encode("utf-8")
+        slot = _slot(word_bytes, self._mask)
+        base = self._strings_start
+        while True:
+            entry = self._table[slot]
+            if not entry:
+                return -1
+            index = entry - 1
+            start = base + self._offsets[index]
+            end = base + self._offsets[index + 1]
+            if end - start == len(word_bytes) and self._mm[start:end] == word_bytes:
+                return index
+            slot = (slot + 1) & self._mask
+
+    def __contains__(self, word: str) -> bool:
+        return self._index(word.lower()) >= 0
+
+    def __getitem__(self, word: str) -> int:
+        index = self._index(word.lower())
+        return self._freqs[index] if index >= 0 else 0
+
+    def _should_check(self, word: str) -> bool:
+        if len(word) == 1 and word in string.punctuation:
+            return False
+        if len(word) > self.longest_word_length + 3:
+            return False
+        if word.lower() in ("nan", "inf", "infinity"):
+            return True
+        try:
+            float(word)
+            return False
+        except ValueError:
+            return True
+
+    def known(self, words: Iterable[str]) -> Set[str]:
+        """Subconjunto das palavras que existem no dicionário."""
+        lowered = (word.lower() for word in words)
+        return {w for w in lowered if self._index(w) >= 0 and self._should_check(w)}
+
+    def unknown(self, words: Iterable[str]) -> Set[str]:
+        """Subconjunto das palavras que não existem no dicionário."""
+        lowered = [word.lower() for word in words if self._should_check(word)]
+        return {w for w in lowered if self._index(w) < 0}
+
+    def edit_distance_1(self, word: str) -> Set[str]:
+        """Palavras a uma edição de distância usando o alfabeto do dicionário."""
+        word = word.lower()
+        if not self._should_check(word):
+            return {word}
+        letters = self.letters
+        splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+        deletes = [left + right[1:] for left, right in splits if right]
+        transposes = [left + right[1] + right[0] + right[2:] for left, right in splits if len(right) > 1]
+        replaces = [left + c + right[1:] for left, right in splits if right for c in letters]
+        inserts = [left + c + right for left, right in splits for c in letters]
+        return set(deletes + transposes + replaces + inserts)
+
+    def candidates(self, word: str) -> Optional[Set[str]]:
+        """Possíveis correções até distância de edição 2, ou None se não houver."""
+        if self.known([word]):
+            return {word}
+        if not self._should_check(word):
+            return {word}
+        edits = self.edit_distance_1(word)
+        found = self.known(edits)
+        if found:
+            return found
+        found = {
+            e2 for e1 in edits if self._should_check(e1)
+            for e2 in self.known(self.edit_distance_1(e1))
+        }
+        return found or None
+
+    def correction(self, word: str) -> Optional[str]:
+        """Correção mais provável da palavra, ou None se não houver candidatos."""
+        candidates = self.candidates(word)
+        if not candidates:
+            return None
+        word_no_accents = _remove_diacritics(word)
+        same_letters = [c for c in candidates if _remove_diacritics(c) == word_no_accents]
+        return max(same_letters or candidates, key=self.__getitem__)
+
+    def words(self) -> List[str]:
+        """Lista todas as palavras do snapshot (carrega tudo em memória)."""
+        base = self._strings_start
+        return [
+            self._mm[base + self._offsets[i]:base + self._offsets[i + 1]].decode("utf-8")
+            for i in range(self._n_words)
+        ]
+
+
+def _remove_diacritics(text: str) -> str:
+    nfkd_form = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in nfkd_form if not unicodedata.combining(c))
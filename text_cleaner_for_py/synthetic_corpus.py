@@ -0,0 +1,515 @@
+"""
+Gerador de corpus sintético reproduzível para testes e benchmarks.
+
+Produz documentos em português ou inglês a partir de uma semente, com
+distribuição de tamanhos controlável e perfis de ruído que imitam o que as
+funções de limpeza encontram em produção: marcação HTML, emojis, URLs e
+e-mails, dígitos no lugar de letras (OCR), datas e valores monetários,
+abreviações, erros de digitação e frases duplicadas.
+
+O mesmo trio (semente, perfil, índice do documento) gera sempre o mesmo
+texto, de modo que medições de desempenho feitas em momentos diferentes
+usam exatamente os mesmos dados. Os documentos podem ser gravados como
+TXT, HTML, DOCX e PDF (``CorpusGenerator.write``); ``write_pdf`` e
+``write_docx`` gravam arquivos a partir de textos prontos.
+
+Examples:
+    >>> generator = CorpusGenerator(seed=42, noise='social')
+    >>> texto = generator.text(10_000)
+    >>> generator.write('corpus/', count=100, formats=('txt', 'pdf'))
+"""
+
+import html
+import io
+import math
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from docx import Document
+
+from .exceptions import ConfigurationError
+
+_WORDS = {
+    'pt': (
+        "análise documento relatório função informação público será também através "
+        "ação coração português índice ótimo período crédito número código série "
+        "empresa cliente contrato pagamento processo sistema dados texto limpeza "
+        "resultado mercado governo projeto serviço produto reunião equipe prazo "
+        "você porque tudo beleza obrigado valeu "
+        "o a de que e do da em um para com não uma os no se na por mais as dos"
+    ).split(),
+    'en': (
+        "analysis document report function information public will also through "
+        "action heart english index great period credit number code series "
+        "company customer contract payment process system data text cleaning "
+        "result market government project service product meeting team deadline "
+        "you are because thanks please people "
+        "the a of that and to in is for with not on as by at this from or be"
+    ).split(),
+}
+
+_ABBREVIATIONS = {
+    'pt': {'você': 'vc', 'porque': 'pq', 'também': 'tb', 'que': 'q', 'tudo': 'td',
+           'beleza': 'blz', 'obrigado': 'obg', 'valeu': 'vlw', 'para': 'pra', 'não': 'ñ'},
+    'en': {'you': 'u', 'are': 'r', 'because': 'bc', 'to': '2', 'for': '4',
+           'thanks': 'thx', 'please': 'pls', 'people': 'ppl', 'with': 'w/', 'the': 'da'},
+}
+
+_EMOJIS = ('😀', '👍', '🔥', '🎉', '❤️', '🚀', '😂', '🙏')
+_OCR_SWAPS = {'o': '0', 'i': '1', 'l': '1', 'e': '3', 'a': '4', 's': '5', 't': '7', 'b': '8', 'g': '9'}
+_HTML_TEMPLATES = (
+    '<div class="bloco"><p>{}</p></div>',
+    '<p><span style="color:red">{}</span> <a href="https://exemplo.com/{}">link</a></p>',
+    '<ul><li>{}</li></ul>',
+    '<table><tr><td>{}</td><td>&nbsp;&amp;&lt;{}&gt;</td></tr></table>',
+    '<script>var x = {1};</script><h2>{0}</h2>',
+)
+
+LANGUAGES = tuple(_WORDS)
+FORMATS = ('txt', 'html', 'docx', 'pdf')
+
+
+@dataclass(frozen=True)
+class NoiseProfile:
+    """
+    Intensidade de cada tipo de ruído (probabilidades entre 0 e 1).
+
+    Attributes:
+        html_density: Fração das frases envolvidas em marcação HTML
+        emoji_rate: Probabilidade de uma frase terminar com emoji
+        url_rate: Probabilidade de uma frase conter URL, menção ou e-mail
+        ocr_rate: Probabilidade de cada letra trocável virar dígito
+        financial_rate: Probabilidade de uma frase conter data e valor monetário
+        abbreviation_rate: Probabilidade de cada palavra abreviável ser abreviada
+        typo_rate: Probabilidade de cada palavra ter um erro de digitação
+        duplicate_rate: Probabilidade de uma frase repetir uma frase anterior
+    """
+    html_density: float = 0.0
+    emoji_rate: float = 0.0
+    url_rate: float = 0.0
+    ocr_rate: float = 0.0
+    financial_rate: float = 0.0
+    abbreviation_rate: float = 0.0
+    typo_rate: float = 0.0
+    duplicate_rate: float = 0.0
+
+    def validate(self) -> None:
+        """
+        Valida as intensidades.
+
+        Raises:
+            ConfigurationError: Se alguma intensidade estiver fora de [0, 1]
+        """
+        for name, value in vars(self).items():
+            if not 0.0 <= value <= 1.0:
+                raise ConfigurationError(name, value, "Deve estar entre 0 e 1")
+
+
+PROFILES: Dict[str, NoiseProfile] = {
+    'plain': NoiseProfile(),
+    'html': NoiseProfile(html_density=0.8),
+    'social': NoiseProfile(emoji_rate=0.5, url_rate=0.3, abbreviation_rate=0.4, typo_rate=0.05),
+    'ocr': NoiseProfile(ocr_rate=0.1, typo_rate=0.05),
+    'financial': NoiseProfile(financial_rate=0.7),
+    'mixed': NoiseProfile(html_density=0.2, emoji_rate=0.1, url_rate=0.1, ocr_rate=0.02,
+                          financial_rate=0.2, abbreviation_rate=0.1, typo_rate=0.03,
+                          duplicate_rate=0.1),
+}
+
+
+@dataclass(frozen=True)
+class LengthDistribution:
+    """
+    Distribuição dos tamanhos (em caracteres) dos documentos.
+
+    Attributes:
+        kind: 'fixed' (sempre ``median``), 'uniform' (entre ``minimum`` e
+            ``maximum``) ou 'lognormal' (mediana ``median``, dispersão ``sigma``)
+        median: Tamanho típico
+        minimum: Menor tamanho gerado
+        maximum: Maior tamanho gerado
+        sigma: Desvio padrão do logaritmo do tamanho (apenas 'lognormal')
+    """
+    kind: str = 'fixed'
+    median: int = 1000
+    minimum: int = 20
+    maximum: int = 1_000_000
+    sigma: float = 1.0
+
+    def validate(self) -> None:
+        """
+        Valida a distribuição.
+
+        Raises:
+            ConfigurationError: Se o tipo ou os limites forem inválidos
+        """
+        if self.kind not in ('fixed', 'uniform', 'lognormal'):
+            raise ConfigurationError("kind", self.kind, "Deve ser 'fixed', 'uniform' ou 'lognormal'")
+        if not 0 < self.minimum <= self.maximum:
+            raise ConfigurationError("minimum", self.minimum, "Deve ser positivo e até 'maximum'")
+        if self.sigma < 0:
+            raise ConfigurationError("sigma", self.sigma, "Não pode ser negativo")
+
+    def sample(self, rng: random.Random) -> int:
+        """Sorteia um tamanho."""
+        if self.kind == 'fixed':
+            length = self.median
+        elif self.kind == 'uniform':
+            length = rng.randint(self.minimum, self.maximum)
+        else:
+            length = int(rng.lognormvariate(math.log(self.median), self.sigma))
+        return max(self.minimum, min(length, self.maximum))
+
+
+class CorpusGenerator:
+    """Gera documentos sintéticos determinísticos a partir de uma semente."""
+
+    def __init__(self, seed: int = 0, language: str = 'pt',
+                 noise: Union[str, NoiseProfile] = 'plain',
+                 lengths: Union[int, LengthDistribution] = 1000,
+                 paragraph_sentences: Tuple[int, int] = (3, 8)) -> None:
+        """
+        Inicializa o gerador.
+
+        Args:
+            seed: Semente; o mesmo gerador produz sempre os mesmos documentos
+            language: Idioma das palavras ('pt' ou 'en')
+            noise: Nome de um perfil em ``PROFILES`` ou um ``NoiseProfile``
+            lengths: Tamanho fixo em caracteres ou ``LengthDistribution``
+            paragraph_sentences: Mínimo e máximo de frases por parágrafo
+
+        Raises:
+            ConfigurationError: Se o idioma, o perfil ou a distribuição forem inválidos
+        """
+        if language not in _WORDS:
+            raise ConfigurationError("language", language, f"Idiomas suportados: {', '.join(LANGUAGES)}")
+        if isinstance(noise, str):
+            if noise not in PROFILES:
+                raise ConfigurationError("noise", noise, f"Perfis disponíveis: {', '.join(PROFILES)}")
+            noise = PROFILES[noise]
+        noise.validate()
+        if isinstance(lengths, int):
+            lengths = LengthDistribution('fixed', median=lengths, minimum=1, maximum=max(lengths, 1))
+        lengths.validate()
+
+        self.seed = seed
+        self.language = language
+        self.noise = noise
+        self.lengths = lengths
+        self.paragraph_sentences = paragraph_sentences
+        self._words = _WORDS[language]
+        self._abbreviations = _ABBREVIATIONS[language]
+
+    def _rng(self, index: int, purpose: str = 'document') -> random.Random:
+        return random.Random(f'{self.seed}:{self.language}:{purpose}:{index}')
+
+    # -- frases ---------------------------------------------------------------
+
+    def _word(self, rng: random.Random) -> str:
+        word = rng.choice(self._words)
+        noise = self.noise
+        if noise.abbreviation_rate and word in self._abbreviations and rng.random() < noise.abbreviation_rate:
+            return self._abbreviations[word]
+        if noise.typo_rate and len(word) > 3 and rng.random() < noise.typo_rate:
+            position = rng.randrange(1, len(word) - 1)
+            operation = rng.randrange(3)
+            if operation == 0:  # troca duas letras vizinhas
+                word = word[:position] + word[position + 1] + word[position] + word[position + 2:]
+            elif operation == 1:  # omite uma letra
+                word = word[:position] + word[position + 1:]
+            else:  # duplica uma letra
+                word = word[:position] + word[position] + word[position:]
+        return word
+
+    def _financial(self, rng: random.Random) -> str:
+        day, month, year = rng.randint(1, 28), rng.randint(1, 12), rng.randint(2000, 2030)
+        thousands, units, cents = rng.randint(1, 999), rng.randint(0, 999), rng.randint(0, 99)
+        percent = f"{rng.randint(1, 40)}{',' if self.language == 'pt' else '.'}{rng.randint(0, 9)}%"
+        if self.language == 'pt':
+            return f"R$ {thousands}.{units:03d},{cents:02d} em {day:02d}/{month:02d}/{year} ({percent})"
+        return f"${thousands},{units:03d}.{cents:02d} on {month:02d}/{day:02d}/{year} ({percent})"
+
+    def _link(self, rng: random.Random) -> str:
+        choice = rng.randrange(3)
+        if choice == 0:
+            return f"https://exemplo.com/{rng.choice(self._words)}/{rng.randint(1, 9999)}"
+        if choice == 1:
+            return f"@usuario{rng.randint(1, 500)}"
+        return f"contato{rng.randint(1, 99)}@exemplo.com"
+
+    def _ocr(self, rng: random.Random, sentence: str) -> str:
+        return ''.join(
+            _OCR_SWAPS[char] if char in _OCR_SWAPS and rng.random() < self.noise.ocr_rate else char
+            for char in sentence
+        )
+
+    def _sentence(self, rng: random.Random, previous: List[str]) -> str:
+        noise = self.noise
+        if previous and noise.duplicate_rate and rng.random() < noise.duplicate_rate:
+            return rng.choice(previous)
+        words = [self._word(rng) for _ in range(rng.randint(6, 18))]
+        if noise.financial_rate and rng.random() < noise.financial_rate:
+            words.insert(rng.randrange(len(words) + 1), self._financial(rng))
+        if noise.url_rate and rng.random() < noise.url_rate:
+            words.insert(rng.randrange(len(words) + 1), self._link(rng))
+        sentence = ' '.join(words)
+        sentence = sentence[0].upper() + sentence[1:] + rng.choice('...!?')
+        if noise.emoji_rate and rng.random() < noise.emoji_rate:
+            sentence += ' ' + rng.choice(_EMOJIS)
+        if noise.ocr_rate:
+            sentence = self._ocr(rng, sentence)
+        if noise.html_density and rng.random() < noise.html_density:
+            sentence = rng.choice(_HTML_TEMPLATES).format(sentence, rng.randint(1, 99))
+        previous.append(sentence)
+        return sentence
+
+    # -- documentos -----------------------------------------------------------
+
+    def paragraphs(self, length: int, index: int = 0) -> List[str]:
+        """
+        Gera os parágrafos de um documento com aproximadamente ``length`` caracteres.
+
+        Args:
+            length: Tamanho aproximado em caracteres (o último parágrafo é completado)
+            index: Índice do documento (define a semente)
+
+        Returns:
+            List[str]: Parágrafos do documento
+        """
+        rng = self._rng(index)
+        previous: List[str] = []
+        paragraphs = []
+        total = 0
+        low, high = self.paragraph_sentences
+        while total < length:
+            sentences = []
+            for _ in range(rng.randint(low, high)):
+                sentence = self._sentence(rng, previous)
+                sentences.append(sentence)
+                total += len(sentence) + 1
+                if total >= length:
+                    break
+            paragraphs.append(' '.join(sentences))
+        return paragraphs
+
+    def text(self, length: int, index: int = 0) -> str:
+        """
+        Gera um texto com aproximadamente ``length`` caracteres.
+
+        Args:
+            length: Tamanho aproximado em caracteres
+            index: Índice do documento (define a semente)
+
+        Returns:
+            str: Parágrafos separados por linha em branco
+        """
+        return '\n\n'.join(self.paragraphs(length, index))
+
+    def document_length(self, index: int) -> int:
+        """Tamanho sorteado para o documento ``index``."""
+        return self.lengths.sample(self._rng(index, 'length'))
+
+    def document(self, index: int) -> str:
+        """Documento ``index`` do corpus, com tamanho sorteado pela distribuição."""
+        return self.text(self.document_length(index), index)
+
+    def documents(self, count: int, start: int = 0) -> Iterator[str]:
+        """
+        Gera ``count`` documentos a partir do índice ``start``.
+
+        Args:
+            count: Quantidade de documentos
+            start: Índice do primeiro documento
+
+        Yields:
+            str: Texto de cada documento
+        """
+        for index in range(start, start + count):
+            yield self.document(index)
+
+    def write(self, directory: Union[str, Path], count: int,
+              formats: Sequence[str] = ('txt',), prefix: str = 'doc') -> List[str]:
+        """
+        Grava ``count`` documentos em cada formato pedido.
+
+        Args:
+            directory: Diretório de saída (criado se necessário)
+            count: Quantidade de documentos
+            formats: Formatos ('txt', 'html', 'docx', 'pdf')
+            prefix: Prefixo dos nomes dos arquivos (``doc00000.pdf``...)
+
+        Returns:
+            List[str]: Caminhos gravados, documento a documento
+
+        Raises:
+            ConfigurationError: Se algum formato não for suportado
+        """
+        for fmt in formats:
+            if fmt not in FORMATS:
+                raise ConfigurationError("formats", fmt, f"Formatos suportados: {', '.join(FORMATS)}")
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for index in range(count):
+            paragraphs = self.paragraphs(self.document_length(index), index)
+            for fmt in formats:
+                path = directory / f"{prefix}{index:05d}.{fmt}"
+                paths.append(_WRITERS[fmt](path, paragraphs))
+        return paths
+
+
+# -- gravação de arquivos ------------------------------------------------------
+
+def _write_txt(path: Path, paragraphs: List[str]) -> str:
+    path.write_text('\n\n'.join(paragraphs), encoding='utf-8')
+    return str(path)
+
+
+def _write_html(path: Path, paragraphs: List[str]) -> str:
+    # O ruído HTML das frases é mantido; parágrafos sem marcação são escapados
+    body = '\n'.join(
+        f"<p>{paragraph if '<' in paragraph else html.escape(paragraph)}</p>" for paragraph in paragraphs
+    )
+    path.write_text(
+        '<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>Documento</title></head>\n'
+        f'<body>\n{body}\n</body></html>\n',
+        encoding='utf-8'
+    )
+    return str(path)
+
+
+def _wrap(text: str, width: int) -> List[str]:
+    lines, line = [], ''
+    for word in text.split():
+        if line and len(line) + 1 + len(word) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _layout_pages(paragraphs: List[str], width: int = 90, lines_per_page: int = 48) -> List[str]:
+    """Quebra os parágrafos em linhas e páginas (texto representável em cp1252)."""
+    lines: List[str] = []
+    for paragraph in paragraphs:
+        text = paragraph.encode('cp1252', 'ignore').decode('cp1252')
+        lines.extend(_wrap(text, width))
+        lines.append('')
+    pages = ['\n'.join(lines[i:i + lines_per_page]) for i in range(0, len(lines), lines_per_page)]
+    return pages or ['']
+
+
+def _write_pdf_document(path: Path, paragraphs: List[str]) -> str:
+    return write_pdf(path, _layout_pages(paragraphs))
+
+
+_WRITERS = {
+    'txt': _write_txt,
+    'html': _write_html,
+    'docx': lambda path, paragraphs: write_docx(path, paragraphs),
+    'pdf': _write_pdf_document,
+}
+
+
+def write_pdf(path: Union[str, Path], pages: List[str], info: Optional[Dict[str, str]] = None,
+              images: Optional[List[List[bytes]]] = None) -> str:
+    """
+    Grava um PDF mínimo com o texto de cada página em Helvetica.
+
+    Args:
+        path: Caminho do arquivo de saída
+        pages: Texto de cada página (caracteres representáveis em cp1252);
+            quebras de linha viram linhas separadas na página
+        info: Entradas do dicionário de informações (ex: {'Author': 'Ana'})
+        images: Conteúdo JPEG das imagens de cada página (um objeto por imagem)
+
+    Returns:
+        Caminho do arquivo gravado
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    kids = []
+    for page_number, text in enumerate(pages):
+        xobjects = []
+        page_images = images[page_number] if images and page_number < len(images) else []
+        for image_number, data in enumerate(page_images):
+            objects.append(
+                b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceRGB "
+                b"/BitsPerComponent 8 /Filter /DCTDecode /Length %d >>\nstream\n%s\nendstream"
+                % (len(data), data)
+            )
+            xobjects.append(b"/Im%d %d 0 R" % (image_number, len(objects)))
+        lines = []
+        for line in text.split("\n"):
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            lines.append(b"(" + escaped.encode("cp1252") + b") Tj")
+        content = b"BT /F1 12 Tf 14 TL 72 720 Td " + b" T* ".join(lines) + b" ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> /XObject << %s >> >> /Contents %d 0 R >>"
+            % (b" ".join(xobjects), len(objects))
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    trailer = b"/Root 1 0 R"
+    if info:
+        entries = b" ".join(b"/%s (%s)" % (k.encode(), v.encode("cp1252")) for k, v in info.items())
+        objects.append(b"<< " + entries + b" >>")
+        trailer += b" /Info %d 0 R" % len(objects)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d %s >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, trailer, xref)
+
+    Path(path).write_bytes(bytes(out))
+    return str(path)
+
+
+def write_docx(path: Union[str, Path], paragraphs: List[str],
+               tables: Optional[List[List[List[str]]]] = None,
+               page_break_after: Optional[int] = None,
+               images: Optional[List[bytes]] = None) -> str:
+    """
+    Grava um DOCX com os parágrafos e tabelas informados.
+
+    Args:
+        path: Caminho do arquivo de saída
+        paragraphs: Texto de cada parágrafo
+        tables: Tabelas (linhas de células) adicionadas após os parágrafos
+        page_break_after: Índice do parágrafo seguido de quebra de página
+        images: Imagens PNG/JPEG adicionadas ao final, uma por parágrafo
+
+    Returns:
+        Caminho do arquivo gravado
+    """
+    document = Document()
+    for index, text in enumerate(paragraphs):
+        document.add_paragraph(text)
+        if index == page_break_after:
+            document.add_page_break()
+    for table_data in tables or []:
+        table = document.add_table(rows=len(table_data), cols=len(table_data[0]))
+        for row, values in zip(table.rows, table_data):
+            for cell, value in zip(row.cells, values):
+                cell.text = value
+    for data in images or []:
+        document.add_picture(io.BytesIO(data))
+    document.save(str(path))
+    return str(path)